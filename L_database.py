@@ -6,6 +6,7 @@ from typing import Optional, Tuple, List, Callable
 from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from L_config import SUPABASE_URL, SUPABASE_KEY, BASE_URL
+from L_lotto_history import DrawHistory
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +26,21 @@ def init_supabase() -> Optional[Client]:
     logger.error("Supabase URL 또는 KEY가 설정되지 않았습니다.")
     return None
 
-def load_lotto_data_from_supabase() -> Tuple[Optional[List[List[int]]], str]:
-    """Supabase에서 로또 데이터 로드"""
+def load_lotto_data_from_supabase() -> Tuple[Optional[DrawHistory], str]:
+    """Supabase에서 로또 데이터 로드 (회차/번호/보너스/추첨일을 열 단위 DrawHistory로)"""
     if not supabase:
         return None, "데이터베이스 연결이 설정되지 않았습니다."
     
     try:
-        response = supabase.table('lotto_data').select('num1, num2, num3, num4, num5, num6').order('round').execute()
+        response = supabase.table('lotto_data').select(
+            'round, num1, num2, num3, num4, num5, num6, bonus, draw_date').order('round').execute()
         
         if response.data:
-            winning_numbers = []
+            winning_numbers = DrawHistory()
             for row in response.data:
                 numbers = [row['num1'], row['num2'], row['num3'], row['num4'], row['num5'], row['num6']]
                 if all(1 <= x <= 45 for x in numbers) and len(set(numbers)) == 6:
-                    winning_numbers.append(sorted(numbers))
+                    winning_numbers.append(sorted(numbers), row.get('bonus'), row['round'], row.get('draw_date'))
             
             if winning_numbers:
                 logger.info(f"데이터 로드 성공: {len(winning_numbers)}개 당첨 번호")
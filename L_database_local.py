@@ -7,6 +7,9 @@ import requests
 from bs4 import BeautifulSoup
 import time
 
+from L_lotto_history import DrawHistory
+from L_lotto_snapshot import write_snapshot
+
 logger = logging.getLogger(__name__)
 
 class LocalLottoDatabase:
@@ -200,39 +203,43 @@ def init_local_database(data_file: str = "lotto_data.json") -> Optional[LocalLot
         logger.error(f"로컬 데이터베이스 초기화 실패: {e}")
         return None
 
-def load_lotto_data_from_local() -> Tuple[List[List[int]], str]:
-    """로컬 파일에서 로또 데이터 로드 (기존 함수와 호환)"""
+def load_history_from_local(data_file: str = "lotto_data.json") -> Tuple[DrawHistory, str]:
+    """로컬 파일에서 회차/번호/보너스/추첨일을 열 단위 DrawHistory로 로드 (파일 순서 유지)"""
     try:
-        db = init_local_database()
+        db = init_local_database(data_file)
         if not db:
-            return [], "로컬 데이터베이스 초기화 실패"
+            return DrawHistory(), "로컬 데이터베이스 초기화 실패"
         
         # JSON 먼저 시도, 실패하면 CSV 시도 (APK 환경 고려)
-        data = db.load_data()
-        if not data:
-            data = db.load_data_from_csv()
-        
-        if not data:
-            return [], "데이터를 로드할 수 없습니다"
+        history = DrawHistory.from_rows(db.load_data())
+        if not history and os.path.exists(db.csv_file):
+            history = DrawHistory.from_csv(db.csv_file)
+            logger.info(f"CSV에서 {len(history)}개 회차 데이터 로드")
         
-        # L_lotto_logic.py 형식에 맞게 변환 (번호만 추출)
-        past_winnings = []
-        for item in data:
-            numbers = [item['num1'], item['num2'], item['num3'], 
-                      item['num4'], item['num5'], item['num6']]
-            past_winnings.append(numbers)
+        if not history:
+            return history, "데이터를 로드할 수 없습니다"
         
-        return past_winnings, f"{len(data)}개 회차 데이터 로드 완료"
+        return history, f"{len(history)}개 회차 데이터 로드 완료"
         
     except Exception as e:
         logger.error(f"로또 데이터 로드 실패: {e}")
-        return [], f"데이터 로드 실패: {e}"
+        return DrawHistory(), f"데이터 로드 실패: {e}"
+
+def load_lotto_data_with_bonus_from_local() -> Tuple[DrawHistory, List[int], str]:
+    """로컬 파일에서 당첨번호와 보너스 번호를 함께 로드 (회차 순서, 보너스 0 = 정보 없음)"""
+    history, message = load_history_from_local()
+    return history, list(history.bonuses), message
+
+def load_lotto_data_from_local() -> Tuple[DrawHistory, str]:
+    """로컬 파일에서 로또 데이터 로드 (기존 함수와 호환: 6개 번호 목록의 시퀀스로도 사용 가능)"""
+    return load_history_from_local()
 
 class LocalDatabaseUpdater:
     """로컬 데이터베이스 업데이터 (기존 DatabaseUpdater와 호환)"""
     
-    def __init__(self, database_instance=None):
+    def __init__(self, database_instance=None, logic=None):
         self.db = database_instance or init_local_database()
+        self.logic = logic  # 앱의 LottoLogic (있으면 스냅샷을 새 회차만 분석해 갱신)
 
     def start(self):
         """업데이트 확인 시작"""
@@ -366,6 +373,9 @@ class LocalDatabaseUpdater:
             # CSV 파일도 업데이트 (APK 호환성)
             self._update_csv_file(all_data)
             
+            # 분석 스냅샷도 새 데이터 기준으로 다시 생성
+            write_snapshot(all_data, self.db.data_file, self.logic)
+            
             logger.info(f"로컬 파일 업데이트 완료: {len(new_data)}개 회차 추가")
             return True
             
@@ -0,0 +1,123 @@
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from L_lotto_logic import LottoLogic
+from L_lotto_match import NUM_TIERS, prize_tiers
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestResult:
+    """Prize-tier counts of a walk-forward replay.
+
+    hits[m, t, tier] is how many of the k tickets generated by methods[m]
+    before rounds[t] landed in that tier (0 = no prize).
+    """
+
+    def __init__(self, methods: List[str], rounds: np.ndarray, hits: np.ndarray, tickets_per_round: int) -> None:
+        self.methods = methods
+        self.rounds = rounds
+        self.hits = hits
+        self.tickets_per_round = tickets_per_round
+
+    def method_hits(self, method: str) -> np.ndarray:
+        """(rounds, 6) tier counts over time for one method."""
+        return self.hits[self.methods.index(method)]
+
+    def cumulative(self, method: str) -> np.ndarray:
+        return np.cumsum(self.method_hits(method), axis=0)
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Total tickets per tier for each method over the whole replay."""
+        totals = self.hits.sum(axis=1)
+        return {
+            method: {('none' if tier == 0 else f'tier{tier}'): int(totals[m, tier]) for tier in range(NUM_TIERS)}
+            for m, method in enumerate(self.methods)
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'tickets_per_round': self.tickets_per_round,
+            'rounds': self.rounds.tolist(),
+            'summary': self.summary(),
+            'hits': {method: self.hits[m].tolist() for m, method in enumerate(self.methods)},
+        }
+
+
+def backtest(draws: List[List[int]], bonuses: Optional[List[Optional[int]]] = None,
+             rounds: Optional[Sequence[int]] = None, k: int = 5, methods: Optional[List[str]] = None,
+             start: int = 1, seed: Optional[int] = None) -> BacktestResult:
+    """Walk-forward replay: before each draw r >= start, generate k tickets per method from draws[:r] and score them.
+
+    The LottoLogic state is built once from draws[:start] and then advanced
+    one draw at a time with add_draw, so no round re-analyzes the history.
+    Tickets come from generate_batch and are scored with prize_tiers; methods
+    that do not depend on past data are generated for all rounds at once.
+    """
+    if not 1 <= start <= len(draws):
+        raise ValueError("start must be between 1 and the number of draws")
+    bonuses = bonuses if bonuses is not None else [None] * len(draws)
+    rounds = np.asarray(rounds if rounds is not None else range(1, len(draws) + 1))
+
+    logic = LottoLogic([list(d) for d in draws[:start]], seed=seed)
+    logic.bonus_numbers = list(bonuses[:start])
+    if methods is None:
+        methods = [m.__name__ for m in logic._get_generation_methods(all_methods=True)]
+        methods += ['generate_data_driven_mix', 'generate_all_methods']
+
+    # Methods that ignore the history can draw every round's tickets up front in one batch
+    data_driven = {m.__name__ for m in logic._get_generation_methods(data_driven_only=True)}
+    data_driven.update(('generate_data_driven_mix', 'generate_all_methods'))
+    num_rounds = len(draws) - start
+    pregenerated = {
+        name: logic.generate_batch(name, num_rounds * k).reshape(num_rounds, k, -1)
+        for name in methods if name not in data_driven
+    }
+
+    hits = np.zeros((len(methods), num_rounds, NUM_TIERS), dtype=np.int32)
+    began = time.perf_counter()
+    for t, r in enumerate(range(start, len(draws))):
+        for m, name in enumerate(methods):
+            tickets = pregenerated[name][t] if name in pregenerated else logic.generate_batch(name, k)
+            hits[m, t] = np.bincount(prize_tiers(tickets, draws[r], bonuses[r]), minlength=NUM_TIERS)
+        logic.add_draw(draws[r], bonuses[r])
+    logger.info(f"백테스트 완료: {num_rounds}회차 x {len(methods)}개 방법, {time.perf_counter() - began:.2f}초")
+    return BacktestResult(methods, rounds[start:], hits, k)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """로컬 데이터로 백테스트 실행 후 결과를 JSON으로 출력"""
+    parser = argparse.ArgumentParser(description="로또 생성기 회차별 백테스트")
+    parser.add_argument('--data', default="lotto_data.json")
+    parser.add_argument('--tickets', type=int, default=5, help="회차당 방법별 티켓 수")
+    parser.add_argument('--start', type=int, default=1, help="처음 몇 회차를 학습용으로만 사용할지")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', default=None, help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    from L_database_local import LocalLottoDatabase
+    data = sorted(LocalLottoDatabase(args.data).load_data(), key=lambda item: item['round'])
+    if not data:
+        sys.exit("데이터를 로드할 수 없습니다")
+    draws = [[item[f'num{i}'] for i in range(1, 7)] for item in data]
+    bonuses = [item.get('bonus') for item in data]
+    result = backtest(draws, bonuses, [item['round'] for item in data], k=args.tickets,
+                      start=args.start, seed=args.seed)
+
+    text = json.dumps(result.to_dict(), ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
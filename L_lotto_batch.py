@@ -0,0 +1,252 @@
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from L_lotto_constraint import constraint_index_bounds
+from L_lotto_mask import MAX_NUM, NUM_BALLS
+
+# 번호 n은 열 인덱스 (n - 1)에 대응
+NUM_COLS = MAX_NUM
+
+# 끝자리별 번호 표 (끝자리 0은 4개, 1~5는 5개, 6~9는 4개; 빈 칸은 0)
+ENDING_TABLE = np.zeros((10, 5), dtype=np.intp)
+ENDING_SIZES = np.zeros(10, dtype=np.intp)
+for _n in range(1, NUM_COLS + 1):
+    ENDING_TABLE[_n % 10, ENDING_SIZES[_n % 10]] = _n
+    ENDING_SIZES[_n % 10] += 1
+
+def rows_from_chosen(chosen: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Turn an (n, 45) bool selection into sorted (n, 6) uint8 tickets.
+
+    Rows with more than 6 selected numbers keep a uniform 6 of them; rows with
+    fewer are topped up with uniformly random unselected numbers.
+    """
+    keys = rng.random(chosen.shape) - chosen
+    idx = np.argpartition(keys, NUM_BALLS - 1, axis=1)[:, :NUM_BALLS]
+    idx.sort(axis=1)
+    return (idx + 1).astype(np.uint8)
+
+
+def pick_from(pool: Sequence[int], k: int, n: int, rng: np.random.Generator) -> np.ndarray:
+    """(n, k) numbers drawn uniformly without replacement from pool, independently per row."""
+    pool = np.asarray(pool, dtype=np.intp)
+    if k >= len(pool):
+        keys = rng.random((n, len(pool)))
+        return pool[np.argsort(keys, axis=1)]
+    keys = rng.random((n, len(pool)))
+    return pool[np.argpartition(keys, k - 1, axis=1)[:, :k]]
+
+
+def scatter(rows: np.ndarray, chosen: Optional[np.ndarray] = None) -> np.ndarray:
+    """Mark the numbers of (n, k) rows in an (n, 45) bool matrix."""
+    if chosen is None:
+        chosen = np.zeros((len(rows), NUM_COLS), dtype=bool)
+    chosen[np.arange(len(rows))[:, None], rows.astype(np.intp) - 1] = True
+    return chosen
+
+
+class BatchGenerator:
+    """Vectorized counterparts of the LottoLogic generators.
+
+    Every method takes a ticket count and returns an (n, 6) uint8 array of
+    sorted tickets drawn from the same distribution as the scalar generator.
+    """
+
+    def __init__(self, logic, rng: Optional[np.random.Generator] = None) -> None:
+        self.logic = logic
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._methods: Dict[str, Callable[..., np.ndarray]] = {
+            'generate_random': self.generate_random,
+            'generate_pattern': self.generate_pattern,
+            'generate_inverse_pattern': self.generate_inverse_pattern,
+            'generate_balance': self.generate_balance,
+            'generate_range_distribution': self.generate_range_distribution,
+            'generate_prime': self.generate_prime,
+            'generate_sum_range': self.generate_sum_range,
+            'generate_consecutive': self.generate_consecutive,
+            'generate_hot_cold_mix': self.generate_hot_cold_mix,
+            'generate_frequent_pairs': self.generate_frequent_pairs,
+            'generate_frequent_triples': self.generate_frequent_triples,
+            'generate_ending_pattern': self.generate_ending_pattern,
+            'generate_statistical_optimal': self.generate_statistical_optimal,
+            'generate_carryover_unseen_mix': self.generate_carryover_unseen_mix,
+            'generate_same_ending_mix': self.generate_same_ending_mix,
+            'generate_compatibility_mix': self.generate_compatibility_mix,
+            'generate_covering': self.generate_covering,
+            'generate_data_driven_mix': self.generate_data_driven_mix,
+            'generate_all_methods': self.generate_all_methods,
+        }
+
+    def generate(self, method_name: str, n: int, **kwargs) -> np.ndarray:
+        name = method_name if method_name.startswith('generate_') else f'generate_{method_name}'
+        if name not in self._methods:
+            raise ValueError(f"Unknown generation method: {method_name}")
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return self._methods[name](n, **kwargs)
+
+    def _constrained(self, n: int, **constraints) -> np.ndarray:
+        logic = self.logic
+        if logic.combination_index is not None:
+            return logic.combination_index.sample(n, self.rng, **constraint_index_bounds(**constraints))
+        return logic._constraint_sampler(**constraints).sample_batch(n, self.rng)
+
+    def generate_random(self, n: int) -> np.ndarray:
+        return rows_from_chosen(np.zeros((n, NUM_COLS), dtype=bool), self.rng)
+
+    def generate_pattern(self, n: int) -> np.ndarray:
+        logic = self.logic
+        if not logic.past_winnings or not logic.number_freq:
+            return self.generate_random(n)
+        return logic._pattern_sampler().sample_batch(n, self.rng)
+
+    def generate_inverse_pattern(self, n: int) -> np.ndarray:
+        if not self.logic.past_winnings:
+            return self.generate_random(n)
+        return self.logic._inverse_pattern_sampler().sample_batch(n, self.rng)
+
+    def generate_balance(self, n: int) -> np.ndarray:
+        return self._constrained(n, min_even=2, max_even=4)
+
+    def generate_range_distribution(self, n: int) -> np.ndarray:
+        keys = self.rng.random((n, 3, 15))
+        picks = np.argpartition(keys, 1, axis=2)[:, :, :2] + np.array([1, 16, 31])[None, :, None]
+        rows = picks.reshape(n, NUM_BALLS)
+        rows.sort(axis=1)
+        return rows.astype(np.uint8)
+
+    def generate_prime(self, n: int) -> np.ndarray:
+        return self._constrained(n, min_primes=2)
+
+    def generate_sum_range(self, n: int, min_sum: Optional[int] = None, max_sum: Optional[int] = None) -> np.ndarray:
+        logic = self.logic
+        min_s = min_sum or (logic.sum_stats['min'] if logic.past_winnings else 111)
+        max_s = max_sum or (logic.sum_stats['max'] if logic.past_winnings else 170)
+        return self._constrained(n, min_sum=min_s, max_sum=max_s)
+
+    def generate_consecutive(self, n: int) -> np.ndarray:
+        return self._constrained(n, require_consecutive=True)
+
+    def generate_hot_cold_mix(self, n: int, window: Optional[int] = None) -> np.ndarray:
+        logic = self.logic
+        if not logic.past_winnings:
+            return self.generate_random(n)
+        hot, cold = logic._hot_cold_plan() if window is None else logic.window_hot_cold(window)
+        chosen = np.zeros((n, NUM_COLS), dtype=bool)
+        if hot:
+            scatter(pick_from(hot, min(3, len(hot)), n, self.rng), chosen)
+        if cold:
+            scatter(pick_from(cold, min(3, len(cold)), n, self.rng), chosen)
+        return rows_from_chosen(chosen, self.rng)
+
+    def generate_frequent_pairs(self, n: int) -> np.ndarray:
+        top_pairs = self.logic._pairs_plan().pairs
+        if not top_pairs:
+            return self.generate_random(n)
+        pairs = np.array(top_pairs, dtype=np.intp)
+        picked = pairs[self.rng.integers(len(pairs), size=n)]
+        return rows_from_chosen(scatter(picked), self.rng)
+
+    def generate_frequent_triples(self, n: int) -> np.ndarray:
+        top_triples = self.logic._triples_plan().triples
+        if not top_triples:
+            return self.generate_random(n)
+        triples = np.array(top_triples, dtype=np.intp)
+        picked = triples[self.rng.integers(len(triples), size=n)]
+        return rows_from_chosen(scatter(picked), self.rng)
+
+    def generate_ending_pattern(self, n: int) -> np.ndarray:
+        chosen = np.zeros((n, NUM_COLS), dtype=bool)
+        picks = self.rng.integers(1, 4, size=n)
+        rows = np.arange(n)
+        for step in range(3):
+            active = rows[picks > step]
+            endings = self.rng.integers(10, size=len(active))
+            slots = (self.rng.random(len(active)) * ENDING_SIZES[endings]).astype(np.intp)
+            chosen[active, ENDING_TABLE[endings, slots] - 1] = True
+        return rows_from_chosen(chosen, self.rng)
+
+    def generate_statistical_optimal(self, n: int) -> np.ndarray:
+        logic = self.logic
+        if not logic.past_winnings:
+            return self.generate_random(n)
+        min_s, max_s = logic.sum_stats['min'], logic.sum_stats['max']
+        return self._constrained(n, min_even=2, max_even=4, min_sum=min_s, max_sum=max_s)
+
+    def generate_carryover_unseen_mix(self, n: int, window: Optional[int] = None) -> np.ndarray:
+        logic = self.logic
+        window = logic.UNSEEN_WINDOW if window is None else window
+        if len(logic.past_winnings) < window:
+            return self.generate_random(n)
+        plan = logic._carryover_plan()
+        rows = np.arange(n)[:, None]
+        carry = pick_from(plan.last_draw, 2, n, self.rng)
+        keep = np.arange(2)[None, :] < self.rng.integers(1, 3, size=n)[:, None]
+        chosen = np.zeros((n, NUM_COLS), dtype=bool)
+        chosen[np.broadcast_to(rows, carry.shape)[keep], carry[keep] - 1] = True
+        unseen = plan.unseen if window == logic.UNSEEN_WINDOW else logic.recency.unseen(window)
+        if unseen:
+            k = min(3, len(unseen))
+            picked = pick_from(unseen, k, n, self.rng)
+            counts = np.minimum(self.rng.integers(2, 4, size=n), len(unseen))
+            keep = np.arange(k)[None, :] < counts[:, None]
+            chosen[np.broadcast_to(rows, picked.shape)[keep], picked[keep] - 1] = True
+        return rows_from_chosen(chosen, self.rng)
+
+    def generate_same_ending_mix(self, n: int) -> np.ndarray:
+        endings = np.flatnonzero(ENDING_SIZES >= 2)
+        chosen_ending = endings[self.rng.integers(len(endings), size=n)]
+        keys = self.rng.random((n, ENDING_TABLE.shape[1]))
+        keys[ENDING_TABLE[chosen_ending] == 0] = np.inf
+        slots = np.argpartition(keys, 1, axis=1)[:, :2]
+        picked = ENDING_TABLE[chosen_ending[:, None], slots]
+        return rows_from_chosen(scatter(picked), self.rng)
+
+    def generate_compatibility_mix(self, n: int) -> np.ndarray:
+        logic = self.logic
+        if not logic.incompatible_pairs:
+            return self.generate_random(n)
+        incompatible = logic._compatibility_plan().matrix
+
+        # Constructive: each step draws uniformly from the numbers still compatible with the row.
+        # Rows that hit a dead end (rare) are rebuilt from scratch in the next pass, as the scalar
+        # generator restarts; after COMPATIBILITY_RESTARTS passes its backtracking finishes them.
+        out = np.empty((n, NUM_BALLS), dtype=np.uint8)
+        pending = np.arange(n)
+        for _ in range(logic.COMPATIBILITY_RESTARTS):
+            if not len(pending):
+                return out
+            m = len(pending)
+            rows = np.arange(m)
+            blocked = np.zeros((m, NUM_COLS), dtype=bool)
+            picks = np.empty((m, NUM_BALLS), dtype=np.intp)
+            alive = np.ones(m, dtype=bool)
+            for step in range(NUM_BALLS):
+                keys = np.where(blocked, np.inf, self.rng.random((m, NUM_COLS)))
+                pick = keys.argmin(axis=1)
+                alive &= np.isfinite(keys[rows, pick])
+                picks[:, step] = pick
+                blocked[rows, pick] = True
+                blocked |= incompatible[pick]
+            picks.sort(axis=1)
+            out[pending[alive]] = (picks[alive] + 1).astype(np.uint8)
+            pending = pending[~alive]
+            logic.cost_stats['restarts'] += len(pending)
+        for i in pending:
+            out[i] = logic._backtrack_compatible()
+        return out
+
+    def generate_covering(self, n: int) -> np.ndarray:
+        logic = self.logic
+        if len(logic.number_freq) < logic.COVERING_POOL_SIZE:
+            return self.generate_random(n)
+        design = np.array(logic._covering_plan(), dtype=np.uint8)
+        return design[self.rng.integers(len(design), size=n)]
+
+    def generate_data_driven_mix(self, n: int) -> np.ndarray:
+        if not self.logic.past_winnings:
+            return self.generate_random(n)
+        return self.logic._ensemble_sampler(data_driven_only=True).sample_batch(n, self.rng)
+
+    def generate_all_methods(self, n: int) -> np.ndarray:
+        return self.logic._ensemble_sampler(data_driven_only=False).sample_batch(n, self.rng)
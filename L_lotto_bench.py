@@ -0,0 +1,153 @@
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from L_lotto_instrument import percentile
+from L_lotto_logic import LottoLogic, np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_ITERATIONS = 2000
+DEFAULT_BATCH_SIZE = 100000
+RESULT_FORMAT = 2
+
+
+def load_bundled_history(data_file: str = "lotto_data.json") -> List[List[int]]:
+    """Draws from the local JSON data file, oldest first, as 6-number lists."""
+    from L_database_local import LocalLottoDatabase
+    data = sorted(LocalLottoDatabase(data_file).load_data(), key=lambda item: item['round'])
+    return [[item[f'num{i}'] for i in range(1, 7)] for item in data]
+
+
+def synthetic_history(num_draws: int, seed: int = 0) -> List[List[int]]:
+    """num_draws uniformly random sorted draws, reproducible for a given seed."""
+    rng = random.Random(seed)
+    return [sorted(rng.sample(range(LottoLogic.MIN_NUM, LottoLogic.MAX_NUM + 1), LottoLogic.NUM_BALLS))
+            for _ in range(num_draws)]
+
+
+def bench_method(logic: LottoLogic, name: str, iterations: int) -> Dict[str, Any]:
+    """Time iterations single-ticket calls of one generator.
+
+    One untimed warm-up call first builds the generator's plans and
+    constraint DPs, so they do not land in p99 or tickets/s; its duration is
+    reported as warmup_us and the cost counters include it.
+    """
+    method = getattr(logic, name)
+    before = dict(logic.cost_stats)
+    clock = time.perf_counter_ns
+    t0 = clock()
+    method()
+    warmup = clock() - t0
+    timings = []
+    start = clock()
+    for _ in range(iterations):
+        t0 = clock()
+        method()
+        timings.append(clock() - t0)
+    elapsed = (clock() - start) / 1e9
+    timings.sort()
+
+    restarts = logic.cost_stats['restarts'] - before['restarts']
+    backtracks = logic.cost_stats['backtracks'] - before['backtracks']
+    return {
+        'tickets': iterations,
+        'seconds': round(elapsed, 6),
+        'tickets_per_sec': round(iterations / elapsed, 1) if elapsed else None,
+        'p50_us': round(percentile(timings, 50) / 1000, 2),
+        'p99_us': round(percentile(timings, 99) / 1000, 2),
+        'warmup_us': round(warmup / 1000, 2),
+        'constraint_builds': logic.cost_stats['constraint_builds'] - before['constraint_builds'],
+        'restarts': restarts,
+        'restarts_per_ticket': round(restarts / (iterations + 1), 3),
+        'backtracks': backtracks,
+        'backtracks_per_ticket': round(backtracks / (iterations + 1), 3),
+    }
+
+
+def bench_batch(logic: LottoLogic, name: str, n: int) -> Dict[str, Any]:
+    """Throughput of one generate_batch call for n tickets, after a one-ticket warm-up call."""
+    logic.generate_batch(name, 1)
+    start = time.perf_counter()
+    logic.generate_batch(name, n)
+    elapsed = time.perf_counter() - start
+    return {'tickets': n, 'seconds': round(elapsed, 6),
+            'tickets_per_sec': round(n / elapsed, 1) if elapsed else None}
+
+
+def method_names(logic: LottoLogic) -> List[str]:
+    """Every generator from _get_generation_methods plus the two mix methods."""
+    names = [m.__name__ for m in logic._get_generation_methods(all_methods=True)]
+    return names + ['generate_data_driven_mix', 'generate_all_methods']
+
+
+def bench_dataset(label: str, history: List[List[int]], iterations: int, seed: int,
+                  batch_size: int = 0) -> Dict[str, Any]:
+    start = time.perf_counter()
+    logic = LottoLogic(history, seed=seed)
+    logic._analyze_patterns()  # statistics are lazy; time them all here rather than inside the first ticket
+    analyze_seconds = time.perf_counter() - start
+    logger.info(f"벤치마크: {label} ({len(history)}회차)")
+
+    methods = {}
+    for name in method_names(logic):
+        result = bench_method(logic, name, iterations)
+        if batch_size and np is not None:
+            result['batch'] = bench_batch(logic, name, batch_size)
+        methods[name] = result
+    return {'draws': len(history), 'analyze_seconds': round(analyze_seconds, 6), 'methods': methods}
+
+
+def run_benchmarks(data_file: Optional[str] = "lotto_data.json", sizes=DEFAULT_SIZES,
+                   iterations: int = DEFAULT_ITERATIONS, seed: int = 0,
+                   batch_size: int = 0) -> Dict[str, Any]:
+    """Benchmark every generator on the bundled history and on synthetic histories of each size."""
+    datasets = {}
+    if data_file:
+        history = load_bundled_history(data_file)
+        if history:
+            datasets['bundled'] = bench_dataset('bundled', history, iterations, seed, batch_size)
+    for size in sizes:
+        label = f'synthetic_{size}'
+        datasets[label] = bench_dataset(label, synthetic_history(size, seed), iterations, seed, batch_size)
+    return {
+        'format': RESULT_FORMAT,
+        'config': {'iterations': iterations, 'seed': seed, 'batch_size': batch_size,
+                   'sizes': list(sizes), 'data_file': data_file},
+        'environment': {'python': platform.python_version(),
+                        'numpy': np.__version__ if np is not None else None,
+                        'machine': platform.machine()},
+        'datasets': datasets,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """벤치마크 실행 후 결과를 JSON으로 출력 (버전 간 diff 용도로 키 정렬)"""
+    parser = argparse.ArgumentParser(description="로또 번호 생성기 벤치마크")
+    parser.add_argument('--data', default="lotto_data.json", help="번들 데이터 파일 (빈 문자열이면 생략)")
+    parser.add_argument('--sizes', type=int, nargs='*', default=list(DEFAULT_SIZES), help="합성 이력 회차 수")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help="생성기당 티켓 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch', type=int, default=0, help="generate_batch 처리량 측정 티켓 수 (0이면 생략)")
+    parser.add_argument('--output', default=None, help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.data or None, args.sizes, args.iterations, args.seed, args.batch)
+    text = json.dumps(results, indent=2, sort_keys=True, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        logger.info(f"벤치마크 결과 저장: {args.output}")
+    else:
+        sys.stdout.write(text + '\n')
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
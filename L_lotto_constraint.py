@@ -0,0 +1,215 @@
+import random
+from itertools import product
+from typing import Callable, Dict, List, Optional, Tuple
+
+from L_lotto_mask import (
+    MAX_NUM, MIN_NUM, NUM_BALLS, PRIMES, bit, even_count, has_consecutive, mask_sum, mask_to_numbers, prime_count,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only sample_batch needs it
+    np = None
+
+
+# DP state: (chosen count, even count, prime count (capped), consecutive flag)
+# consecutive flag: 0 = none yet / previous number skipped, 1 = none yet / previous taken, 2 = found
+State = Tuple[int, int, int, int]
+
+
+def constraint_index_bounds(min_even: int = 0, max_even: int = NUM_BALLS,
+                            min_sum: Optional[int] = None, max_sum: Optional[int] = None,
+                            min_primes: int = 0, require_consecutive: bool = False) -> Dict[str, Tuple]:
+    """The same constraints expressed as CombinationIndex.select() column bounds."""
+    bounds: Dict[str, Tuple] = {}
+    if min_even > 0 or max_even < NUM_BALLS:
+        bounds['even'] = (min_even, max_even)
+    if min_sum is not None or max_sum is not None:
+        bounds['sum'] = (min_sum, max_sum)
+    if min_primes:
+        bounds['prime'] = (min_primes, None)
+    if require_consecutive:
+        bounds['consecutive'] = (1, None)
+    return bounds
+
+
+def constraint_predicate(min_even: int = 0, max_even: int = NUM_BALLS,
+                         min_sum: Optional[int] = None, max_sum: Optional[int] = None,
+                         min_primes: int = 0, require_consecutive: bool = False) -> Callable[[int], bool]:
+    """Test of a ticket bitmask against the same constraints, with the L_lotto_mask bit predicates."""
+    def satisfies(mask: int) -> bool:
+        if not min_even <= even_count(mask) <= max_even:
+            return False
+        if min_primes and prime_count(mask) < min_primes:
+            return False
+        if require_consecutive and not has_consecutive(mask):
+            return False
+        if min_sum is not None or max_sum is not None:
+            s = mask_sum(mask)
+            if (min_sum is not None and s < min_sum) or (max_sum is not None and s > max_sum):
+                return False
+        return True
+    return satisfies
+
+
+class ConstraintSampler:
+    """Exact uniform sampler over the 6/45 combinations that satisfy the built-in constraints.
+
+    A backward DP over the numbers 1..45 counts, for every partial state, how
+    many valid completions remain. Sampling then walks the numbers forward and
+    takes each one with probability (completions if taken) / (completions
+    from here), so every valid combination is equally likely, nothing is
+    rejected and the cost is at most 45 steps per ticket. The walk consumes a
+    single random rank per ticket: it unranks that rank among the valid
+    combinations.
+    """
+
+    def __init__(self, min_even: int = 0, max_even: int = NUM_BALLS,
+                 min_sum: Optional[int] = None, max_sum: Optional[int] = None,
+                 min_primes: int = 0, require_consecutive: bool = False) -> None:
+        self.min_even = max(0, min_even)
+        self.max_even = min(NUM_BALLS, max_even)
+        self.track_sum = min_sum is not None or max_sum is not None
+        self.min_sum = min_sum if min_sum is not None else 0
+        self.max_sum = max_sum if max_sum is not None else sum(range(MAX_NUM - NUM_BALLS + 1, MAX_NUM + 1))
+        self.min_primes = max(0, min_primes)
+        self.require_consecutive = require_consecutive
+
+        self._track_even = self.min_even > 0 or self.max_even < NUM_BALLS
+        self._even_dim = self.max_even + 1 if self._track_even else 1
+        self._prime_dim = self.min_primes + 1
+        self._consec_dim = 3 if require_consecutive else 1
+        self._sum_dim = max(0, self.max_sum + 1) if self.track_sum else 1
+        self._dense = None
+        # _moves[number][state] = _transitions(state, number), filled while building the levels
+        self._moves: List[Dict[State, Tuple[State, Optional[State]]]] = [{} for _ in range(MAX_NUM + 1)]
+        self._levels = self._build_levels()
+
+    def _states(self):
+        return product(range(NUM_BALLS + 1), range(self._even_dim), range(self._prime_dim), range(self._consec_dim))
+
+    def _transitions(self, state: State, number: int) -> Tuple[State, Optional[State]]:
+        """(state after skipping number, state after taking it or None if taking is not allowed)."""
+        k, e, p, c = state
+        skip = (k, e, p, 2 if c == 2 else 0)
+        if k >= NUM_BALLS:
+            return skip, None
+        if self._track_even and number % 2 == 0:
+            e += 1
+            if e >= self._even_dim:
+                return skip, None
+        if self.min_primes and number in PRIMES:
+            p = min(self.min_primes, p + 1)
+        if self.require_consecutive:
+            c = 2 if c else 1
+        return skip, (k + 1, e, p, c)
+
+    def _is_final(self, state: State, s: int) -> bool:
+        k, e, p, c = state
+        return (k == NUM_BALLS and (not self._track_even or e >= self.min_even)
+                and p >= self.min_primes and (not self.require_consecutive or c == 2)
+                and (not self.track_sum or self.min_sum <= s <= self.max_sum))
+
+    def _build_levels(self) -> List[Optional[Dict[State, List[int]]]]:
+        S = self._sum_dim
+        levels: List[Optional[Dict[State, List[int]]]] = [None] * (MAX_NUM + 2)
+        levels[MAX_NUM + 1] = {
+            state: [1 if self._is_final(state, s) else 0 for s in range(S)] for state in self._states()
+        }
+        for number in range(MAX_NUM, MIN_NUM - 1, -1):
+            nxt = levels[number + 1]
+            off = number if self.track_sum else 0
+            zeros = [0] * min(off, S)
+            cur = {}
+            moves = self._moves[number]
+            for state in self._states():
+                skip_state, take_state = moves[state] = self._transitions(state, number)
+                skip = nxt[skip_state]
+                if take_state is None:
+                    cur[state] = skip
+                    continue
+                take = nxt[take_state][off:] + zeros
+                cur[state] = [a + b for a, b in zip(skip, take)]
+            levels[number] = cur
+        return levels
+
+    def count(self) -> int:
+        """Number of combinations satisfying the constraints."""
+        return self._levels[MIN_NUM][(0, 0, 0, 0)][0] if self._sum_dim else 0
+
+    def unrank_mask(self, rank: int) -> int:
+        """The rank-th valid combination (0 <= rank < count()) as a bitmask; distinct ranks give distinct tickets."""
+        state: State = (0, 0, 0, 0)
+        s = 0
+        mask = 0
+        for number in range(MIN_NUM, MAX_NUM + 1):
+            if state[0] == NUM_BALLS:
+                break
+            skip_state, take_state = self._moves[number][state]
+            off = number if self.track_sum else 0
+            take_count = 0
+            if take_state is not None and s + off < self._sum_dim:
+                take_count = self._levels[number + 1][take_state][s + off]
+            if rank < take_count:
+                mask |= bit(number)
+                state, s = take_state, s + off
+            else:
+                state, rank = skip_state, rank - take_count
+        return mask
+
+    def sample_mask(self, rng=random) -> int:
+        total = self.count()
+        if total == 0:
+            raise ValueError("No 6/45 combination satisfies the constraints")
+        return self.unrank_mask(rng.randrange(total))
+
+    def sample(self, rng=random) -> List[int]:
+        return mask_to_numbers(self.sample_mask(rng))
+
+    def _dense_table(self):
+        """Levels as one int64 array indexed [number, k, even, prime, consec, sum]."""
+        if self._dense is None:
+            table = np.zeros((MAX_NUM + 2, NUM_BALLS + 1, self._even_dim, self._prime_dim,
+                              self._consec_dim, self._sum_dim), dtype=np.int64)
+            for number in range(MIN_NUM, MAX_NUM + 2):
+                for state, row in self._levels[number].items():
+                    table[(number,) + state] = row
+            self._dense = table
+        return self._dense
+
+    def sample_batch(self, n: int, rng) -> 'np.ndarray':
+        """n independent uniform tickets as an (n, 6) uint8 array; rng is a numpy Generator."""
+        if np is None:
+            raise ImportError("sample_batch requires numpy to be installed")
+        total = self.count()
+        if n and total == 0:
+            raise ValueError("No 6/45 combination satisfies the constraints")
+        table = self._dense_table()
+        rank = rng.integers(0, total, size=n, dtype=np.int64)
+        k = np.zeros(n, dtype=np.intp)
+        e = np.zeros(n, dtype=np.intp)
+        p = np.zeros(n, dtype=np.intp)
+        c = np.zeros(n, dtype=np.intp)
+        s = np.zeros(n, dtype=np.intp)
+        out = np.zeros((n, NUM_BALLS), dtype=np.uint8)
+        rows = np.arange(n)
+        for number in range(MIN_NUM, MAX_NUM + 1):
+            off = number if self.track_sum else 0
+            k2 = k + 1
+            e2 = e + 1 if (self._track_even and number % 2 == 0) else e
+            p2 = np.minimum(self.min_primes, p + 1) if (self.min_primes and number in PRIMES) else p
+            c2 = np.where(c > 0, 2, 1) if self.require_consecutive else c
+            s2 = s + off
+            allowed = (k2 <= NUM_BALLS) & (e2 < self._even_dim) & (s2 < self._sum_dim)
+            idx = (number + 1, np.minimum(k2, NUM_BALLS), np.minimum(e2, self._even_dim - 1), p2, c2,
+                   np.minimum(s2, self._sum_dim - 1))
+            take_count = np.where(allowed, table[idx], 0)
+            take = rank < take_count
+            out[rows[take], k[take]] = number
+            rank = np.where(take, rank, rank - take_count)
+            k = np.where(take, k2, k)
+            e = np.where(take, e2, e)
+            p = np.where(take, p2, p)
+            c = np.where(take, c2, np.where(c == 2, 2, 0)) if self.require_consecutive else c
+            s = np.where(take, s2, s)
+        return out
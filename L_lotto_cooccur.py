@@ -0,0 +1,132 @@
+import heapq
+from itertools import combinations
+from typing import Dict, List, Sequence, Set, Tuple
+
+from L_lotto_mask import MAX_NUM, MIN_NUM
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; it only speeds up the initial count
+    np = None
+
+BUILD_CHUNK = 100000
+
+# BINOM[n][k] = C(n, k) for the colex ranks below
+BINOM: List[List[int]] = [[1] + [0] * 6 for _ in range(MAX_NUM + 1)]
+for _n in range(1, MAX_NUM + 1):
+    for _k in range(1, 7):
+        BINOM[_n][_k] = BINOM[_n - 1][_k - 1] + BINOM[_n - 1][_k]
+
+
+def subset_key(numbers: Sequence[int]) -> int:
+    """Colex rank of a set of numbers: a dense integer key in [0, C(45, k))."""
+    return sum(BINOM[n - MIN_NUM][i + 1] for i, n in enumerate(sorted(numbers)))
+
+
+def key_numbers(key: int, order: int) -> Tuple[int, ...]:
+    """Inverse of subset_key for a subset of `order` numbers, sorted ascending."""
+    numbers = []
+    n = MAX_NUM
+    for k in range(order, 0, -1):
+        while BINOM[n - 1][k] > key:
+            n -= 1
+        key -= BINOM[n - 1][k]
+        numbers.append(n)
+        n -= 1
+    return tuple(reversed(numbers))
+
+
+class CooccurrenceIndex:
+    """How often each set of `order` numbers (3 = triples, 4 = quads) was drawn together.
+
+    Counts live in a dict keyed by subset_key, so only sets that occurred
+    take space, and there are at most C(45, order) of them (14190 triples,
+    148995 quads) however long the history is. A count -> keys bucket index
+    is kept in step with every increment, so top(k) and at_least(t) walk
+    the buckets from the highest count down instead of sorting every key.
+    """
+
+    def __init__(self, order: int, draws: Sequence[Sequence[int]] = ()) -> None:
+        if not 2 <= order <= 6:
+            raise ValueError("order must be between 2 and 6")
+        self.order = order
+        self.counts: Dict[int, int] = {}
+        self._buckets: Dict[int, Set[int]] = {}
+        self.max_count = 0
+        self._build(draws)
+
+    def _build(self, draws: Sequence[Sequence[int]]) -> None:
+        if np is not None and len(draws):
+            try:
+                self._count_numpy(draws)
+            except (ValueError, IndexError):
+                self.counts = {}  # ragged or out-of-range draws: count them one by one
+        if not self.counts:
+            counts = self.counts
+            for draw in draws:
+                for subset in combinations(draw, self.order):
+                    key = subset_key(subset)
+                    counts[key] = counts.get(key, 0) + 1
+        for key, count in self.counts.items():
+            self._buckets.setdefault(count, set()).add(key)
+        self.max_count = max(self._buckets, default=0)
+
+    def _count_numpy(self, draws: Sequence[Sequence[int]]) -> None:
+        # One dense bincount over all C(45, order) keys, BUILD_CHUNK draws at a time to bound memory
+        binom = np.array(BINOM, dtype=np.int64)
+        totals = np.zeros(BINOM[MAX_NUM][self.order], dtype=np.int64)
+        for start in range(0, len(draws), BUILD_CHUNK):
+            arr = np.sort(np.asarray(draws[start:start + BUILD_CHUNK], dtype=np.intp) - MIN_NUM, axis=1)
+            if arr.ndim != 2 or arr.min() < 0:
+                raise ValueError("draws must be a rectangular array of numbers 1..45")
+            keys = np.zeros((len(arr), BINOM[arr.shape[1]][self.order]), dtype=np.int64)
+            for c, cols in enumerate(combinations(range(arr.shape[1]), self.order)):
+                for i, col in enumerate(cols):
+                    keys[:, c] += binom[arr[:, col], i + 1]
+            totals += np.bincount(keys.ravel(), minlength=len(totals))
+        present = np.flatnonzero(totals)
+        self.counts = dict(zip(present.tolist(), totals[present].tolist()))
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def add(self, draw: Sequence[int]) -> None:
+        """Count one more draw: C(6, order) increments, each O(1)."""
+        counts, buckets = self.counts, self._buckets
+        for subset in combinations(draw, self.order):
+            key = subset_key(subset)
+            old = counts.get(key, 0)
+            counts[key] = old + 1
+            if old:
+                bucket = buckets[old]
+                bucket.discard(key)
+                if not bucket:
+                    del buckets[old]
+            buckets.setdefault(old + 1, set()).add(key)
+            if old + 1 > self.max_count:
+                self.max_count = old + 1
+
+    def count(self, numbers: Sequence[int]) -> int:
+        return self.counts.get(subset_key(numbers), 0)
+
+    def _walk(self, threshold: int, limit: int) -> List[Tuple[Tuple[int, ...], int]]:
+        result = []
+        for count in range(self.max_count, max(threshold, 1) - 1, -1):
+            bucket = self._buckets.get(count)
+            if not bucket:
+                continue
+            # Ties in key order, so results do not depend on set iteration order
+            room = limit - len(result)
+            keys = sorted(bucket) if len(bucket) <= room else heapq.nsmallest(room, bucket)
+            result.extend((key_numbers(key, self.order), count) for key in keys)
+            if len(result) == limit:
+                break
+        return result
+
+    def top(self, k: int) -> List[Tuple[Tuple[int, ...], int]]:
+        """The k most frequent sets as ((numbers...), count), most frequent first."""
+        return self._walk(1, k)
+
+    def at_least(self, threshold: int) -> List[Tuple[Tuple[int, ...], int]]:
+        """Every set drawn together at least threshold times, most frequent first."""
+        return self._walk(threshold, len(self.counts))
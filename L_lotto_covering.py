@@ -0,0 +1,81 @@
+from itertools import combinations
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from L_lotto_mask import NUM_BALLS, mask_bits, mask_to_numbers
+
+MAX_POOL = 32     # 풀 안의 위치를 uint32 비트셋으로 표현
+CHUNK = 256       # 한 번에 갱신하는 목표 부분집합 수
+
+
+def subset_masks(k: int, size: int) -> np.ndarray:
+    """Every size-subset of positions 0..k-1 as a uint32 bitset, in lexicographic order."""
+    rows = np.array(list(combinations(range(k), size)), dtype=np.uint32).reshape(-1, size)
+    return np.bitwise_or.reduce(np.uint32(1) << rows, axis=1) if size else np.zeros(1, dtype=np.uint32)
+
+
+def covering_design(pool: Sequence[int], match: int = 3, drawn: int = 4,
+                    rng: Optional[np.random.Generator] = None) -> List[List[int]]:
+    """Small set of tickets from pool that wins `match` numbers whenever `drawn` winning numbers fall in pool.
+
+    Every drawn-subset of the pool (a target) must share at least `match`
+    numbers with some ticket. Greedy construction over bitset-encoded
+    subsets of pool positions: the ticket covering the most uncovered
+    targets is taken, and only the gains of the targets it newly covers
+    are subtracted, so each target is charged once over the whole run. A
+    final pass drops tickets whose targets are all covered at least twice.
+    Ties are broken with rng, by default one seeded from the arguments so
+    the same pool always gets the same design.
+    """
+    pool = sorted(set(pool))
+    k = len(pool)
+    if not NUM_BALLS <= k <= MAX_POOL:
+        raise ValueError(f"pool must hold between {NUM_BALLS} and {MAX_POOL} distinct numbers")
+    if not 1 <= match <= drawn <= NUM_BALLS:
+        raise ValueError("need 1 <= match <= drawn <= 6")
+    rng = rng if rng is not None else np.random.default_rng([match, drawn, *pool])
+
+    tickets = subset_masks(k, NUM_BALLS)
+    targets = subset_masks(k, drawn)
+    # 0/1 float32 rows: products of two of them count common positions exactly
+    ticket_inc = mask_bits(tickets, k).astype(np.float32)
+    target_inc = mask_bits(targets, k).astype(np.float32)
+
+    def covers(target_idx: np.ndarray) -> np.ndarray:
+        # (len(target_idx), tickets) bool: ticket shares >= match positions with the target
+        return target_inc[target_idx] @ ticket_inc.T >= match
+
+    # By symmetry every ticket starts out covering the same number of targets
+    initial = int(np.count_nonzero(target_inc @ ticket_inc[0] >= match))
+    gains = np.full(len(tickets), initial, dtype=np.int64)
+
+    uncovered = np.ones(len(targets), dtype=bool)
+    chosen: List[int] = []
+    while uncovered.any():
+        best = np.flatnonzero(gains == gains.max())
+        t = int(best[rng.integers(len(best))])
+        chosen.append(t)
+        open_idx = np.flatnonzero(uncovered)
+        hit = open_idx[(target_inc[open_idx] @ ticket_inc[t]) >= match]
+        uncovered[hit] = False
+        for start in range(0, len(hit), CHUNK):
+            gains -= np.count_nonzero(covers(hit[start:start + CHUNK]), axis=0)
+
+    # Coverage counts over the chosen tickets; remove redundant ones, latest (smallest gain) first
+    cover = (target_inc @ ticket_inc[chosen].T) >= match
+    counts = cover.sum(axis=1)
+    keep = []
+    for j in reversed(range(len(chosen))):
+        mine = cover[:, j]
+        if (counts[mine] >= 2).all():
+            counts[mine] -= 1
+        else:
+            keep.append(chosen[j])
+
+    values = np.array(pool)
+    result = []
+    for t in sorted(keep):
+        # 위치 비트 i는 mask_to_numbers에서 i + 1로 나옴
+        result.append([int(values[p - 1]) for p in mask_to_numbers(int(tickets[t]))])
+    return result
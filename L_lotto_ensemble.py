@@ -0,0 +1,171 @@
+import hashlib
+import random
+from typing import Callable, Dict, List, Tuple
+
+from L_lotto_mask import MAX_NUM, MIN_NUM, NUM_BALLS
+from L_lotto_unique import method_constraints
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the scalar generators are sampled without it
+    np = None
+
+ENSEMBLE_SAMPLES = 512    # 데이터에 따라 바뀌는 방법: 데이터가 바뀔 때마다 추정
+STATIC_SAMPLES = 8192     # 데이터와 무관한 방법: 인스턴스당 한 번만 추정
+SCALAR_SAMPLES = 1024     # numpy 없이 티켓을 하나씩 생성할 때의 상한
+
+
+def marginals_seed(*parts: bytes) -> int:
+    """64-bit seed for a marginal estimate, derived from what it depends on (method, constraints, data digest)."""
+    return int.from_bytes(hashlib.sha256(b'\0'.join(parts)).digest()[:8], 'little')
+
+
+def estimate_marginals(logic, method_name: str, samples: int, seed: int) -> List[float]:
+    """P(number appears in a ticket) for one generator, indexed by number (index 0 unused), by sampling.
+
+    Sampling uses generators seeded from seed (logic.rng is swapped out for
+    the duration), so the estimate is the same on every run and in every
+    copy of logic, and the caller's random state is left untouched.
+    """
+    counts = [0] * (MAX_NUM + 1)
+    saved_rng = logic.rng
+    logic.rng = random.Random(seed)
+    try:
+        if np is not None:
+            from L_lotto_batch import BatchGenerator
+            tickets = BatchGenerator(logic, np.random.default_rng(seed)).generate(method_name, samples)
+            counts = np.bincount(tickets.ravel(), minlength=MAX_NUM + 1).tolist()
+        else:
+            samples = min(samples, SCALAR_SAMPLES)
+            method = getattr(logic, method_name)
+            for _ in range(samples):
+                for n in method():
+                    counts[n] += 1
+    finally:
+        logic.rng = saved_rng
+    return [c / samples for c in counts]
+
+
+def _picks_then_fill(picked: List[float], size: int) -> List[float]:
+    # `size` numbers are picked (number n with probability picked[n]), the rest of
+    # the ticket is uniform over the 45 - size numbers left
+    fill = (NUM_BALLS - size) / (MAX_NUM - size)
+    return [0.0] + [p + (1.0 - p) * fill for p in picked[1:]]
+
+
+def _uniform_pick(groups, size: int) -> List[float]:
+    # picked: one of `groups` (tuples of numbers) chosen uniformly
+    picked = [0.0] * (MAX_NUM + 1)
+    for group in groups:
+        for n in group:
+            picked[n] += 1.0 / len(groups)
+    return _picks_then_fill(picked, size)
+
+
+def _random_marginals(logic) -> List[float]:
+    return [0.0] + [NUM_BALLS / MAX_NUM] * MAX_NUM
+
+
+def _hot_cold_marginals(logic) -> List[float]:
+    if not logic.past_winnings:
+        return _random_marginals(logic)
+    picked = [0.0] * (MAX_NUM + 1)
+    size = 0
+    for pool in logic._hot_cold_plan():   # hot and cold are disjoint
+        k = min(3, len(pool))
+        for n in pool:
+            picked[n] = k / len(pool)
+        size += k
+    return _picks_then_fill(picked, size)
+
+
+def _pairs_marginals(logic) -> List[float]:
+    pairs = logic._pairs_plan().pairs
+    return _uniform_pick(pairs, 2) if pairs else _random_marginals(logic)
+
+
+def _triples_marginals(logic) -> List[float]:
+    triples = logic._triples_plan().triples
+    return _uniform_pick(triples, 3) if triples else _random_marginals(logic)
+
+
+def _carryover_marginals(logic) -> List[float]:
+    if len(logic.past_winnings) < logic.UNSEEN_WINDOW:
+        return _random_marginals(logic)
+    last_draw, unseen = logic._carryover_plan()   # unseen numbers are never in the last draw
+    # 1 or 2 carried numbers and 2 or 3 unseen ones (as many as exist), all four cases equally likely
+    total = [0.0] * (MAX_NUM + 1)
+    for carried in (1, 2):
+        for wanted in (2, 3):
+            k = min(wanted, len(unseen))
+            picked = [0.0] * (MAX_NUM + 1)
+            for n in last_draw:
+                picked[n] = carried / len(last_draw)
+            for n in unseen:
+                picked[n] = k / len(unseen)
+            total = [a + b / 4 for a, b in zip(total, _picks_then_fill(picked, carried + k))]
+    return total
+
+
+def _covering_marginals(logic) -> List[float]:
+    if len(logic.number_freq) < logic.COVERING_POOL_SIZE or np is None:
+        return _random_marginals(logic)
+    return _uniform_pick(logic._covering_plan(), NUM_BALLS)
+
+
+# Generators that pick uniformly from a few fixed sets and fill the rest uniformly: marginals in closed form
+EXACT_MARGINALS: Dict[str, Callable[..., List[float]]] = {
+    'generate_random': _random_marginals,
+    'generate_hot_cold_mix': _hot_cold_marginals,
+    'generate_frequent_pairs': _pairs_marginals,
+    'generate_frequent_triples': _triples_marginals,
+    'generate_carryover_unseen_mix': _carryover_marginals,
+    'generate_covering': _covering_marginals,
+}
+
+
+def ensemble_weights(logic, methods: List[Callable], data_driven: set,
+                     cache: Dict[Tuple, List[float]], current: Dict[str, List[float]],
+                     digest: bytes) -> Dict[int, float]:
+    """Average per-number inclusion probability over methods, i.e. the marginal of picking a method at random.
+
+    Methods listed in EXACT_MARGINALS are computed exactly; the rest are
+    estimated by sampling with a seed derived from the method and, for the
+    data-driven ones, the history digest, so the result is reproducible.
+    Marginals of methods that ignore the history are estimated once into
+    cache; the constrained generators are keyed by their constraints (the
+    sum bounds move only when a draw sets a new extreme), the others by name.
+    The rest go into current, which the caller drops when the data changes.
+    A method that raises is left out, as in the union-based mixes.
+    """
+    total = [0.0] * (MAX_NUM + 1)
+    used = 0
+    for method in methods:
+        name = method.__name__
+        constraints = method_constraints(logic, name)
+        if constraints is not None:
+            key = tuple(sorted(constraints.items()))
+        elif name not in data_driven:
+            key = (name,)
+        else:
+            key = None
+        store, slot = (cache, key) if key is not None else (current, name)
+        try:
+            marginals = store.get(slot)
+            if marginals is None:
+                if name in EXACT_MARGINALS:
+                    marginals = EXACT_MARGINALS[name](logic)
+                elif key is not None:
+                    marginals = estimate_marginals(logic, name, STATIC_SAMPLES,
+                                                   marginals_seed(name.encode(), repr(key).encode()))
+                else:
+                    marginals = estimate_marginals(logic, name, ENSEMBLE_SAMPLES,
+                                                   marginals_seed(name.encode(), digest))
+                store[slot] = marginals
+        except Exception:
+            continue
+        total = [a + b for a, b in zip(total, marginals)]
+        used += 1
+    if not used:
+        return {n: 1.0 for n in range(MIN_NUM, MAX_NUM + 1)}
+    return {n: total[n] / used for n in range(MIN_NUM, MAX_NUM + 1)}
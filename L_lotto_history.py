@@ -0,0 +1,193 @@
+import csv
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only __array__ needs it
+    np = None
+
+NUMBER_COLUMNS = ('num1', 'num2', 'num3', 'num4', 'num5', 'num6')
+COLUMNS = ('round',) + NUMBER_COLUMNS + ('bonus', 'draw_date')
+# 열별 array 타입코드: 회차/날짜(YYYYMMDD)는 32비트, 번호와 보너스는 1바이트
+_TYPECODES = {'round': 'I', 'bonus': 'B', 'draw_date': 'I', **{c: 'B' for c in NUMBER_COLUMNS}}
+
+
+def date_key(value) -> int:
+    """'2025-07-05' or '2025.07.05' -> 20250705 (0 when missing or unparsable)."""
+    digits = ''.join(ch for ch in str(value or '') if ch.isdigit())
+    return int(digits[:8]) if len(digits) >= 8 else 0
+
+
+def date_text(key: int) -> str:
+    return f"{key // 10000:04d}-{key // 100 % 100:02d}-{key % 100:02d}" if key else ''
+
+
+class DrawRow(NamedTuple):
+    """Read-only view of one draw; bonus 0 and draw_date '' mean unknown."""
+    round: int
+    numbers: List[int]
+    bonus: int
+    draw_date: str
+
+
+class DrawHistory:
+    """Draw history stored column by column in typed arrays.
+
+    Each of round, num1..num6, bonus and draw_date (as YYYYMMDD) is one
+    array, so a column is available in O(1) through column() and a row costs
+    seven index operations, with no dict per row. The history is also a
+    sequence of 6-number lists (draws in file order), which is what
+    LottoLogic.past_winnings expects, and converts to an (n, 6) numpy array.
+    Rows are only ever appended.
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, array] = {name: array(_TYPECODES[name]) for name in COLUMNS}
+        self._numbers = [self._columns[c] for c in NUMBER_COLUMNS]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict]) -> 'DrawHistory':
+        """From dicts with the lotto_data.json keys (round, num1..num6, bonus, draw_date)."""
+        history = cls()
+        for row in rows:
+            history.append([int(row[c]) for c in NUMBER_COLUMNS], row.get('bonus'),
+                           row.get('round'), row.get('draw_date'))
+        return history
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'DrawHistory':
+        """From a lotto_data.csv style file, reading the columns positionally without per-row dicts."""
+        history = cls()
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return history
+            idx = [header.index(name) for name in COLUMNS]
+            for row in reader:
+                if row:
+                    history.append([int(row[i]) for i in idx[1:7]], int(row[idx[7]] or 0),
+                                   int(row[idx[0]]), row[idx[8]])
+        return history
+
+    def append(self, numbers: Sequence[int], bonus: Optional[int] = None, round: Optional[int] = None,
+               draw_date=None) -> None:
+        """Add a draw; round defaults to the previous round + 1."""
+        cols = self._columns
+        if round is None:
+            round = cols['round'][-1] + 1 if cols['round'] else 1
+        cols['round'].append(int(round))
+        for col, n in zip(self._numbers, numbers):
+            col.append(n)
+        cols['bonus'].append(bonus or 0)
+        cols['draw_date'].append(draw_date if isinstance(draw_date, int) else date_key(draw_date))
+
+    def __len__(self) -> int:
+        return len(self._columns['round'])
+
+    def __getitem__(self, index):
+        """draws[i] -> [n1, ..., n6]; a slice gives a new DrawHistory."""
+        if isinstance(index, slice):
+            part = DrawHistory()
+            for name in COLUMNS:
+                part._columns[name] = self._columns[name][index]
+            part._numbers = [part._columns[c] for c in NUMBER_COLUMNS]
+            return part
+        return [col[index] for col in self._numbers]
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return map(list, zip(*self._numbers))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DrawHistory):
+            return self._columns == other._columns
+        return NotImplemented
+
+    def __array__(self, dtype=None, copy=None):
+        # Always a fresh array: exporting the buffers would stop append() from growing them
+        arr = np.empty((len(self), len(NUMBER_COLUMNS)), dtype=np.uint8)
+        for i, col in enumerate(self._numbers):
+            arr[:, i] = np.frombuffer(col, dtype=np.uint8)
+        return arr if dtype is None else arr.astype(dtype)
+
+    def column(self, name: str) -> array:
+        """The typed array of one column (owned by the history; do not modify)."""
+        return self._columns[name]
+
+    @property
+    def rounds(self) -> array:
+        return self._columns['round']
+
+    @property
+    def bonuses(self) -> array:
+        return self._columns['bonus']
+
+    def row(self, index: int) -> DrawRow:
+        cols = self._columns
+        return DrawRow(cols['round'][index], [col[index] for col in self._numbers],
+                       cols['bonus'][index], date_text(cols['draw_date'][index]))
+
+    def rows(self, start: int = 0) -> Iterator[DrawRow]:
+        return (self.row(i) for i in range(start, len(self)))
+
+    def tuples(self) -> Iterator[Tuple[int, ...]]:
+        """The draws as tuples zipped straight from the number columns (no list per draw)."""
+        return zip(*self._numbers)
+
+    def sums(self) -> List[int]:
+        """Sum of every draw, added column by column."""
+        return list(map(sum, self.tuples()))
+
+    def number_counts(self) -> Counter:
+        """Appearances of every drawn number, counted column by column.
+
+        Keys are in order of first appearance, draw by draw, exactly as
+        Counter(n for draw in history for n in draw) would insert them, so
+        most_common() breaks ties the same way.
+        """
+        counts: Counter = Counter()
+        for col in self._numbers:
+            counts.update(col)
+        order: Dict[int, None] = {}
+        for draw in self.tuples():  # stops as soon as every drawn number has been met
+            order.update(dict.fromkeys(draw))
+            if len(order) == len(counts):
+                break
+        return Counter({n: counts[n] for n in order})
+
+    def pair_counts(self) -> Counter:
+        """Co-occurrences of every (low, high) pair, counted one column pair at a time.
+
+        Keys are in order of first appearance, draw by draw and then by
+        position within the draw, like the row-by-row count.
+        """
+        cols, n = self._numbers, len(self)
+        counts: Counter = Counter()
+        first: Dict[Tuple[int, int], int] = {}
+        slot = 0
+        positions = len(cols) * (len(cols) - 1) // 2
+        for i in range(len(cols)):
+            for j in range(i + 1, len(cols)):
+                pairs = list(zip(map(min, cols[i], cols[j]), map(max, cols[i], cols[j])))
+                counts.update(pairs)
+                # Built back to front, so each pair keeps the earliest draw it appears in
+                for pair, draw in dict(zip(reversed(pairs), range(n - 1, -1, -1))).items():
+                    pos = draw * positions + slot
+                    if pos < first.get(pair, pos + 1):
+                        first[pair] = pos
+                slot += 1
+        return Counter({pair: counts[pair] for pair in sorted(first, key=first.__getitem__)})
+
+    def startswith(self, other: 'DrawHistory') -> bool:
+        """True if other's draws are the first len(other) draws of this history."""
+        n = len(other)
+        return n <= len(self) and all(self._columns[c][:n] == other._columns[c] for c in ('round',) + NUMBER_COLUMNS)
+
+    def number_bytes(self) -> bytes:
+        """The numbers of every draw, row by row, one byte each."""
+        flat = array('B', bytes(6 * len(self)))
+        for i, col in enumerate(self._numbers):
+            flat[i::6] = col
+        return flat.tobytes()
@@ -0,0 +1,207 @@
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from L_lotto_mask import MAX_NUM, NUM_BALLS, PRIMES
+
+logger = logging.getLogger(__name__)
+
+NUM_COMBINATIONS = 8145060  # C(45, 6)
+INDEX_FILE = "lotto_combo_index_v1.npy"
+
+# 행 번호 = 사전순(lexicographic) 조합 순위
+FEATURE_DTYPE = np.dtype([
+    ('sum', np.uint8),          # 21..255
+    ('even', np.uint8),         # 짝수 개수
+    ('prime', np.uint8),        # 소수 개수
+    ('consecutive', np.uint8),  # 연속 번호 쌍 개수 (0..5)
+    ('ending_mask', np.uint16), # 등장한 끝자리 10비트 마스크
+    ('ending_max', np.uint8),   # 같은 끝자리 최대 개수
+    ('decade', np.uint16),      # 구간(1-9, 10-19, 20-29, 30-39, 40-45) 개수의 7진수 코드
+    ('ac', np.uint8),           # AC값 (서로 다른 양의 차이 개수 - 5)
+])
+
+Bound = Union[int, Tuple[Optional[int], Optional[int]]]
+
+_DECADE_WEIGHTS = np.array([7 ** 4, 7 ** 3, 7 ** 2, 7, 1], dtype=np.uint16)
+
+
+def _binomial_table() -> np.ndarray:
+    table = np.zeros((MAX_NUM + 1, NUM_BALLS + 1), dtype=np.int64)
+    table[:, 0] = 1
+    for n in range(1, MAX_NUM + 1):
+        for k in range(1, NUM_BALLS + 1):
+            table[n, k] = table[n - 1, k - 1] + table[n - 1, k]
+    return table
+
+
+_BINOM = _binomial_table()
+# _RANK_OFFSETS[j][x]: 위치 j에 x보다 작은 번호가 오는 나머지 조합 수의 누적합
+_RANK_OFFSETS = np.array([
+    np.concatenate([[0], np.cumsum([_BINOM[MAX_NUM - x, NUM_BALLS - 1 - j] for x in range(1, MAX_NUM + 1)])])
+    for j in range(NUM_BALLS)
+], dtype=np.int64)
+
+
+def decade_code(counts: List[int]) -> int:
+    """Pack the per-decade ball counts (1-9, 10-19, 20-29, 30-39, 40-45) into the 'decade' column value."""
+    return int(np.dot(np.asarray(counts, dtype=np.int64), _DECADE_WEIGHTS.astype(np.int64)))
+
+
+def compute_features(rows: np.ndarray) -> np.ndarray:
+    """Feature rows for an (n, 6) array of sorted combinations."""
+    rows = rows.astype(np.int16)
+    out = np.empty(len(rows), dtype=FEATURE_DTYPE)
+    out['sum'] = rows.sum(axis=1)
+    out['even'] = (rows % 2 == 0).sum(axis=1)
+    prime_table = np.zeros(MAX_NUM + 1, dtype=bool)
+    prime_table[list(PRIMES)] = True
+    out['prime'] = prime_table[rows].sum(axis=1)
+    out['consecutive'] = (np.diff(rows, axis=1) == 1).sum(axis=1)
+
+    row_ids = np.arange(len(rows))
+    endings = rows % 10
+    ending_hist = np.zeros((len(rows), 10), dtype=np.uint8)
+    for c in range(NUM_BALLS):
+        ending_hist[row_ids, endings[:, c]] += 1
+    out['ending_mask'] = ((ending_hist > 0) * (1 << np.arange(10, dtype=np.uint16))).sum(axis=1)
+    out['ending_max'] = ending_hist.max(axis=1)
+
+    decade_hist = np.zeros((len(rows), 5), dtype=np.uint16)
+    for c in range(NUM_BALLS):
+        decade_hist[row_ids, rows[:, c] // 10] += 1
+    out['decade'] = decade_hist @ _DECADE_WEIGHTS
+
+    i, j = np.triu_indices(NUM_BALLS, 1)
+    diffs = (rows[:, j] - rows[:, i]).astype(np.uint64)
+    diff_bits = np.bitwise_or.reduce(np.left_shift(np.uint64(1), diffs), axis=1)
+    if hasattr(np, 'bitwise_count'):  # numpy 2.0+
+        distinct = np.bitwise_count(diff_bits)
+    else:
+        distinct = np.zeros(len(rows), dtype=np.uint8)
+        for b in range(1, MAX_NUM):
+            distinct += ((diff_bits >> np.uint64(b)) & np.uint64(1)).astype(np.uint8)
+    out['ac'] = distinct - (NUM_BALLS - 1)
+    return out
+
+
+def unrank(ranks: np.ndarray) -> np.ndarray:
+    """(n, 6) uint8 combinations for lexicographic ranks."""
+    ranks = np.asarray(ranks, dtype=np.int64)
+    out = np.empty((len(ranks), NUM_BALLS), dtype=np.uint8)
+    prev = np.zeros(len(ranks), dtype=np.int64)
+    remainder = ranks.copy()
+    for j in range(NUM_BALLS):
+        offsets = _RANK_OFFSETS[j]
+        target = remainder + offsets[prev]
+        x = np.searchsorted(offsets, target, side='right')
+        out[:, j] = x
+        remainder = target - offsets[x - 1]
+        prev = x
+    return out
+
+
+class CombinationIndex:
+    """Read-only feature table over every 6/45 combination, one row per lexicographic rank.
+
+    The table is built once into an .npy file and memory-mapped afterwards,
+    so a combined filter is a vectorized scan over 8,145,060 small rows.
+    """
+
+    def __init__(self, table: np.ndarray, cache_size: int = 8, path: Optional[str] = None) -> None:
+        if len(table) != NUM_COMBINATIONS or table.dtype != FEATURE_DTYPE:
+            raise ValueError("Not a 6/45 combination feature table")
+        self.table = table
+        self.path = path
+        self._cache_size = cache_size
+        self._selections: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+
+    def __getstate__(self) -> Dict:
+        # Pickle file-backed indexes by path so worker processes re-map the file instead of copying it
+        if self.path is not None:
+            return {'path': self.path, 'cache_size': self._cache_size}
+        return {'table': np.asarray(self.table), 'cache_size': self._cache_size}
+
+    def __setstate__(self, state: Dict) -> None:
+        table = np.load(state['path'], mmap_mode='r') if 'path' in state else state['table']
+        self.__init__(table, state['cache_size'], state.get('path'))
+
+    @staticmethod
+    def build(path: str = INDEX_FILE) -> 'CombinationIndex':
+        """Enumerate all combinations and write the feature table to path."""
+        logger.info(f"조합 인덱스 생성 중: {path}")
+        tmp_path = path + '.tmp.npy'
+        table = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=FEATURE_DTYPE, shape=(NUM_COMBINATIONS,))
+        chunk = 1 << 20
+        for start in range(0, NUM_COMBINATIONS, chunk):
+            stop = min(start + chunk, NUM_COMBINATIONS)
+            table[start:stop] = compute_features(unrank(np.arange(start, stop)))
+        table.flush()
+        del table
+        os.replace(tmp_path, path)
+        logger.info(f"조합 인덱스 생성 완료: {NUM_COMBINATIONS}개 조합")
+        return CombinationIndex.load(path)
+
+    @staticmethod
+    def load(path: str = INDEX_FILE) -> 'CombinationIndex':
+        return CombinationIndex(np.load(path, mmap_mode='r'), path=path)
+
+    @staticmethod
+    def open(path: str = INDEX_FILE) -> 'CombinationIndex':
+        """Load the index, building it first if the file does not exist yet."""
+        if os.path.exists(path):
+            return CombinationIndex.load(path)
+        return CombinationIndex.build(path)
+
+    def select(self, **bounds: Bound) -> np.ndarray:
+        """Ranks of the combinations matching every bound.
+
+        Each keyword names a column; an int means equality, a (low, high)
+        tuple an inclusive range where either end may be None. Example:
+        select(sum=(100, 170), even=(2, 4), ac=(7, None)).
+        """
+        key = tuple(sorted((k, v if isinstance(v, int) else tuple(v)) for k, v in bounds.items()))
+        ranks = self._selections.get(key)
+        if ranks is not None:
+            self._selections.move_to_end(key)
+            return ranks
+
+        mask = np.ones(NUM_COMBINATIONS, dtype=bool)
+        for column, bound in bounds.items():
+            if column not in FEATURE_DTYPE.names:
+                raise ValueError(f"Unknown index column: {column}")
+            values = self.table[column]
+            if isinstance(bound, int):
+                mask &= values == bound
+                continue
+            low, high = bound
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        ranks = np.flatnonzero(mask).astype(np.int32)
+
+        self._selections[key] = ranks
+        if len(self._selections) > self._cache_size:
+            self._selections.popitem(last=False)
+        return ranks
+
+    def count(self, **bounds: Bound) -> int:
+        return len(self.select(**bounds))
+
+    def combination(self, rank: int) -> List[int]:
+        return [int(x) for x in unrank(np.array([rank]))[0]]
+
+    def sample(self, n: int, rng: np.random.Generator, **bounds: Bound) -> np.ndarray:
+        """n combinations drawn uniformly from the filtered rows, as an (n, 6) uint8 array."""
+        ranks = self.select(**bounds)
+        if not len(ranks):
+            raise ValueError("No 6/45 combination matches the index filter")
+        return unrank(ranks[rng.integers(len(ranks), size=n)])
+
+    def features(self, rank: int) -> Dict[str, int]:
+        row = self.table[rank]
+        return {name: int(row[name]) for name in FEATURE_DTYPE.names}
@@ -0,0 +1,164 @@
+import functools
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from L_lotto_mask import popcount
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 2048      # 백분위 계산에 쓰는 최근 호출 수 (방법별)
+DEFAULT_LOG_INTERVAL = 60.0
+
+
+def percentile(sorted_values: List[int], q: float) -> int:
+    """Nearest-rank percentile of already sorted values (0 when empty)."""
+    if not sorted_values:
+        return 0
+    k = max(0, min(len(sorted_values) - 1, int(round(q / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+class MethodStats:
+    """Counters of one generator; latencies are nanoseconds, percentiles over the last LATENCY_WINDOW calls."""
+
+    def __init__(self, cost_keys: Iterable[str] = ()) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.latencies: Deque[int] = deque(maxlen=LATENCY_WINDOW)
+        self.costs = dict.fromkeys(cost_keys, 0)  # LottoLogic.cost_stats growth while this method ran
+        self.fallbacks = 0         # calls that ended in generate_random
+        self.topups = 0            # _fill_random calls that had to add numbers
+        self.topup_numbers = 0     # numbers added by them
+
+    def percentile_us(self, q: float) -> float:
+        return percentile(sorted(self.latencies), q) / 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        calls = self.calls or 1
+        return {
+            'calls': self.calls,
+            'total_ms': round(self.total_ns / 1e6, 3),
+            'mean_us': round(self.total_ns / calls / 1000, 2),
+            'p50_us': round(self.percentile_us(50), 2),
+            'p99_us': round(self.percentile_us(99), 2),
+            **self.costs,
+            'fallbacks': self.fallbacks,
+            'fallback_rate': round(self.fallbacks / calls, 4),
+            'topups': self.topups,
+            'topup_rate': round(self.topups / calls, 4),
+            'topup_numbers': self.topup_numbers,
+        }
+
+
+class GeneratorStats:
+    """Opt-in per-generator instrumentation of a LottoLogic instance.
+
+    install() shadows the instance's generators and its _fill_random
+    helper with timing and counting wrappers; uninstall() removes them
+    again, so an uninstrumented instance pays nothing. Top-ups, fallbacks
+    to generate_random and the growth of logic.cost_stats (constraint DP
+    builds, backtracking, generate_unique repeats and support walks) are
+    charged to the innermost generator running, so a nested call's costs
+    are not counted again by its caller. A summary line is logged at most
+    every log_interval seconds (None disables it).
+    """
+
+    def __init__(self, log_interval: Optional[float] = DEFAULT_LOG_INTERVAL) -> None:
+        self.methods: Dict[str, MethodStats] = {}
+        self.log_interval = log_interval
+        self.wrapped: List[str] = []
+        self._active: List[str] = []
+        self._costs_seen: Dict[str, int] = {}
+        self._last_log = time.monotonic()
+
+    def __getitem__(self, name: str) -> MethodStats:
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats(self._costs_seen)
+        return stats
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in sorted(self.methods.items())}
+
+    def reset(self) -> None:
+        self.methods.clear()
+
+    def summary_line(self) -> str:
+        parts = []
+        for name, stats in sorted(self.methods.items(), key=lambda item: -item[1].total_ns):
+            d = stats.to_dict()
+            parts.append(f"{name.replace('generate_', '')} {d['calls']}회 p50 {d['p50_us']}us p99 {d['p99_us']}us "
+                         f"재시작 {d.get('restarts', 0)} 백트래킹 {d.get('backtracks', 0)} 중복 {d.get('unique_duplicates', 0)} "
+                         f"대체 {d['fallback_rate']:.1%} 보충 {d['topup_rate']:.1%}")
+        return "생성기 통계: " + ("; ".join(parts) if parts else "호출 없음")
+
+    def _maybe_log(self) -> None:
+        if self.log_interval is None:
+            return
+        now = time.monotonic()
+        if now - self._last_log >= self.log_interval:
+            self._last_log = now
+            logger.info(self.summary_line())
+
+    def install(self, logic, method_names: List[str]) -> None:
+        for name in method_names:
+            setattr(logic, name, self._wrap_generator(logic, name, getattr(logic, name)))
+        logic._fill_random = self._wrap_fill(logic._fill_random)
+        self.wrapped = list(method_names) + ['_fill_random']
+        self._costs_seen = dict(logic.cost_stats)
+
+    def uninstall(self, logic) -> None:
+        for name in self.wrapped:
+            logic.__dict__.pop(name, None)
+        self.wrapped = []
+
+    def _charge_costs(self, logic) -> None:
+        # cost_stats growth since the last checkpoint belongs to the innermost running generator
+        seen = self._costs_seen
+        for key, value in logic.cost_stats.items():
+            delta = value - seen.get(key, 0)
+            if delta and self._active:
+                costs = self[self._active[-1]].costs
+                costs[key] = costs.get(key, 0) + delta
+            seen[key] = value
+
+    def _wrap_generator(self, logic, name: str, method):
+        clock = time.perf_counter_ns
+        active = self._active
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            # generate_unique('generate_random') asks for random tickets; that is no fallback
+            if name == 'generate_random' and active and active[-1] != 'generate_unique':
+                self[active[-1]].fallbacks += 1
+            self._charge_costs(logic)
+            active.append(name)
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                self._charge_costs(logic)
+                active.pop()
+                stats = self[name]
+                stats.calls += 1
+                stats.total_ns += elapsed
+                stats.latencies.append(elapsed)
+                if not active:
+                    self._maybe_log()
+        return wrapper
+
+    def _wrap_fill(self, fill):
+        active = self._active
+
+        @functools.wraps(fill)
+        def wrapper(mask: int) -> int:
+            missing = 6 - popcount(mask)
+            if missing > 0 and active:
+                stats = self[active[-1]]
+                stats.topups += 1
+                stats.topup_numbers += missing
+            return fill(mask)
+        return wrapper
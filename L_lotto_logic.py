@@ -1,256 +1,850 @@
 import random
 from collections import Counter
-from typing import List, Optional, Callable, Dict, Any, Set, Tuple
+from typing import List, Optional, Callable, Dict, Any, Iterable, NamedTuple, Sequence, Tuple
+
+from L_lotto_constraint import ConstraintSampler, constraint_index_bounds
+from L_lotto_weighted import WeightedSampler
+from L_lotto_recency import RecencyIndex
+from L_lotto_history import DrawHistory, DrawRow
+from L_lotto_mask import (
+    FULL_MASK, bit, numbers_to_mask, mask_to_numbers, pair_mask, popcount,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the pure-Python engine is used without it
+    np = None
+
+ANALYSIS_ENGINES = ('auto', 'numpy', 'python')
+
+# Dataset-independent tables shared by every instance
+ENDING_GROUPS: Tuple[Tuple[int, ...], ...] = tuple(tuple(n for n in range(1, 46) if n % 10 == i) for i in range(10))
+PAIRED_ENDING_GROUPS: Tuple[Tuple[int, ...], ...] = tuple(g for g in ENDING_GROUPS if len(g) >= 2)
+RANGE_BANDS: Tuple[range, ...] = (range(1, 16), range(16, 31), range(31, 46))
+
+
+class PairsPlan(NamedTuple):
+    """generate_frequent_pairs: the top pairs, most frequent first, and their bitmasks."""
+    pairs: Tuple[Tuple[int, int], ...]
+    masks: Tuple[int, ...]
+
+
+class TriplesPlan(NamedTuple):
+    """generate_frequent_triples: the top triples, most frequent first, and their bitmasks."""
+    triples: Tuple[Tuple[int, int, int], ...]
+    masks: Tuple[int, ...]
+
+
+class HotColdPlan(NamedTuple):
+    hot: Tuple[int, ...]
+    cold: Tuple[int, ...]
+
+
+class CarryoverPlan(NamedTuple):
+    last_draw: Tuple[int, ...]
+    unseen: Tuple[int, ...]
+
+
+class CompatibilityPlan(NamedTuple):
+    """generate_compatibility_mix: per-number incompatibility masks and, with numpy, a read-only 45x45 bool matrix."""
+    masks: Tuple[int, ...]
+    matrix: Any
+
+
+def _statistic(name: str, group: str) -> property:
+    """Attribute computed by LottoLogic._compute_<group>() on first access and cached per data_version."""
+    def getter(self):
+        if self._stats_version.get(group) != self.data_version:
+            getattr(self, '_compute_' + group)()
+            self._stats_version[group] = self.data_version
+        return self._stats[name]
+
+    def setter(self, value) -> None:
+        getter(self)
+        self._stats[name] = value
+
+    return property(getter, setter)
+
 
 class LottoLogic:
     MIN_NUM: int = 1
     MAX_NUM: int = 45
     NUM_BALLS: int = 6
+    # Draws that count as "recent" for long_term_unseen and generate_carryover_unseen_mix
+    UNSEEN_WINDOW: int = 15
+    # Statistic groups that add_draws can update in place; the others are rebuilt on next access in O(45)
+    INCREMENTAL_GROUPS = ('numbers', 'pairs', 'recency', 'sums', 'triples', 'quads')
+    # generate_covering: the most frequent numbers form the pool, covered for 3 matches if 4 of them are drawn
+    COVERING_POOL_SIZE: int = 12
+    COVERING_MATCH: int = 3
+    COVERING_DRAWN: int = 4
+    # generate_compatibility_mix: dead ends that restart a ticket before backtracking takes over
+    COMPATIBILITY_RESTARTS: int = 100
 
-    def __init__(self, past_winnings: Optional[List[List[int]]] = None) -> None:
-        self.past_winnings = past_winnings if past_winnings is not None else []
-        self._patterns_analyzed = False
-        
-        # Initialize properties
-        self.number_freq: Counter = Counter()
-        self.hot_numbers: List[int] = []
-        self.cold_numbers: List[int] = []
-        self.pair_freq: Counter = Counter()
-        self.incompatible_pairs: Set[Tuple[int, int]] = set()
-        self.long_term_unseen: List[int] = []
-        self.sum_stats: Dict[str, float] = {'min': 0, 'max': 0, 'avg': 0}
-
-        if self.past_winnings:
-            self._analyze_patterns()
+    # Statistics are computed lazily, one group at a time, and invalidated when data_version changes
+    number_freq = _statistic('number_freq', 'numbers')                 # Counter: number -> appearances
+    hot_numbers = _statistic('hot_numbers', 'hot_cold')                # above-average numbers, most frequent first
+    cold_numbers = _statistic('cold_numbers', 'hot_cold')              # below-average numbers, least frequent first
+    pair_freq = _statistic('pair_freq', 'pairs')                       # Counter: (a, b) -> co-occurrences
+    incompatible_pairs = _statistic('incompatible_pairs', 'pairs')     # pairs seen at most once
+    # incompatible_masks[n]: bitmask of the numbers that form an incompatible pair with n
+    incompatible_masks = _statistic('incompatible_masks', 'pairs')
+    # 45x45 co-occurrence matrix (index = number - 1); only built by the numpy engine
+    pair_matrix = _statistic('pair_matrix', 'pairs')
+    recency = _statistic('recency', 'recency')                         # L_lotto_recency.RecencyIndex
+    long_term_unseen = _statistic('long_term_unseen', 'unseen')        # not drawn in the last UNSEEN_WINDOW draws
+    sum_stats = _statistic('sum_stats', 'sums')                        # {'min', 'max', 'avg'} of draw sums
+    # L_lotto_cooccur.CooccurrenceIndex of numbers drawn together in threes / fours
+    triple_freq = _statistic('triple_freq', 'triples')
+    quad_freq = _statistic('quad_freq', 'quads')
+
+    def __init__(self, past_winnings: Optional[Sequence[List[int]]] = None, engine: str = 'auto',
+                 rng: Optional[random.Random] = None, seed: Optional[int] = None) -> None:
+        """rng (a random.Random or compatible object) or seed makes the instance own its generator;
+        with neither, a fresh unseeded random.Random is used. Never touches the global random state."""
+        if engine not in ANALYSIS_ENGINES:
+            raise ValueError(f"Unknown analysis engine: {engine!r} (expected one of {ANALYSIS_ENGINES})")
+        if engine == 'numpy' and np is None:
+            raise ImportError("The 'numpy' analysis engine requires numpy to be installed")
+        self.engine = engine
+        if rng is not None and seed is not None:
+            raise ValueError("Pass either rng or seed, not both")
+        self.rng = rng if rng is not None else random.Random(seed)
+        # numpy Generator for the batch paths, derived from the same seed so batch runs replay too
+        self.np_rng = None
+        if np is not None:
+            self.np_rng = np.random.default_rng(seed if seed is not None else self.rng.getrandbits(64))
+        # L_lotto_history.DrawHistory when one was passed in: it then also receives every added draw.
+        # Any other sequence is copied, so add_draws never changes the caller's list.
+        self.history = past_winnings if isinstance(past_winnings, DrawHistory) else None
+        if self.history is not None:
+            self.past_winnings = self.history
+        else:
+            self.past_winnings = list(past_winnings) if past_winnings is not None else []
+        # Bonus balls come from the history when there is one, otherwise only from add_draw(s)
+        self.bonus_numbers: List[Optional[int]] = (
+            [b or None for b in self.history.bonuses] if self.history is not None
+            else [None] * len(self.past_winnings))
+        # Bumped whenever the history changes; caches built from the statistics compare against it
+        self.data_version = 0
+
+        # Lazily computed statistics (see _statistic) and the data_version each group was computed for
+        self._stats: Dict[str, Any] = {}
+        self._stats_version: Dict[str, int] = {}
+        # L_lotto_window.DrawPrefixSums, built on the first windowed query when numpy is available
+        self._prefix_sums = None
+        # hashlib sha256 of the history's numbers (see _data_digest), extended by add_draws once built
+        self._digest_hash = None
+        self._batch_generator = None
+        self._constraint_samplers: Dict[Tuple, ConstraintSampler] = {}
+        # Generator plans: name -> (data_version, immutable tables/weights/samplers built for it)
+        self._plans: Dict[str, Tuple[int, Any]] = {}
+        # covering_design results keyed by (pool, match, drawn); they do not depend on the history
+        self._covering_designs: Dict[Tuple, Tuple[Tuple[int, ...], ...]] = {}
+        # Per-number marginals of the generators that ignore the history (see L_lotto_ensemble)
+        self._static_marginals: Dict[Tuple, List[float]] = {}
+        # Optional L_lotto_index.CombinationIndex; see use_combination_index()
+        self.combination_index = None
+        # Cumulative counts of the costs generating can still incur beyond sampling from a plan:
+        # ConstraintSampler DP builds, generate_compatibility_mix dead-end restarts and backtracking
+        # steps, and in generate_unique repeated tickets and switches to walking a finite support
+        self.cost_stats: Dict[str, int] = {'constraint_builds': 0, 'restarts': 0, 'backtracks': 0,
+                                           'unique_duplicates': 0, 'support_walks': 0}
+        # L_lotto_instrument.GeneratorStats while enable_instrumentation() is in effect
+        self.instrumentation = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Instrumentation wrappers close over this instance; copies and pickles start uninstrumented
+        state = self.__dict__.copy()
+        if self.instrumentation is not None:
+            for name in self.instrumentation.wrapped:
+                state.pop(name, None)
+            state['instrumentation'] = None
+        state['_digest_hash'] = None  # hash objects do not pickle; rebuilt on demand
+        return state
+
+    def enable_instrumentation(self, log_interval: Optional[float] = 60.0):
+        """Start recording per-generator calls, latency, fallbacks, top-ups and cost_stats.
+
+        Returns the L_lotto_instrument.GeneratorStats object (also kept as
+        self.instrumentation); a summary is logged every log_interval
+        seconds while generating (None = never).
+        """
+        if self.instrumentation is None:
+            from L_lotto_instrument import GeneratorStats
+            names = [m.__name__ for m in self._get_generation_methods(all_methods=True)]
+            names += ['generate_data_driven_mix', 'generate_all_methods', 'generate_unique']
+            self.instrumentation = GeneratorStats(log_interval)
+            self.instrumentation.install(self, names)
+        self.instrumentation.log_interval = log_interval
+        return self.instrumentation
+
+    def disable_instrumentation(self) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.uninstall(self)
+            self.instrumentation = None
+
+    def invalidate_statistics(self) -> None:
+        """Drop every cached statistic; call after modifying past_winnings in place."""
+        self.data_version += 1
+        self._stats_version.clear()
+        self._prefix_sums = None
+        self._digest_hash = None
 
     def _analyze_patterns(self) -> None:
-        if self._patterns_analyzed:
-            return
-        
-        if not self.past_winnings:
+        """Compute every statistic now instead of on first access."""
+        for name in ('number_freq', 'hot_numbers', 'pair_freq', 'recency', 'long_term_unseen', 'sum_stats',
+                     'triple_freq', 'quad_freq'):
+            getattr(self, name)
+
+    def save_snapshot(self, path: str) -> None:
+        """Store the statistics in a binary sidecar file (see L_lotto_snapshot)."""
+        from L_lotto_snapshot import save_snapshot
+        save_snapshot(self, path)
+
+    def load_snapshot(self, path: str) -> bool:
+        """Use the statistics saved at path instead of analyzing, if they match the current draws."""
+        from L_lotto_snapshot import load_snapshot
+        return load_snapshot(self, path)
+
+    def _uses_numpy(self) -> bool:
+        return bool(self.past_winnings) and self.engine != 'python' and np is not None
+
+    def _compute_with_engine(self, group: str) -> None:
+        """Run _compute_<group>_numpy when the numpy engine applies, otherwise _compute_<group>_python."""
+        if self._uses_numpy():
+            try:
+                getattr(self, f'_compute_{group}_numpy')()
+                return
+            except ValueError:
+                # Ragged or out-of-range draws: let the Python engine deal with them
+                if self.engine == 'numpy':
+                    raise
+        getattr(self, f'_compute_{group}_python')()
+
+    def _draws_array(self):
+        """The history as a validated (n, 6) intp array, built once per data_version for the numpy engine."""
+        def build():
+            draws = np.asarray(self.past_winnings, dtype=np.intp)
+            if draws.ndim != 2 or draws.shape[1] != self.NUM_BALLS:
+                raise ValueError("past_winnings must be a rectangular list of 6-number draws")
+            if draws.min() < self.MIN_NUM or draws.max() > self.MAX_NUM:
+                raise ValueError("past_winnings contains numbers outside 1..45")
+            return draws
+        return self._plan('draws_array', build)
+
+    def _compute_numbers(self) -> None:
+        self._compute_with_engine('numbers')
+
+    def _compute_numbers_python(self) -> None:
+        if self.history is not None:
+            self._stats['number_freq'] = self.history.number_counts()
             return
+        self._stats['number_freq'] = Counter(num for game in self.past_winnings for num in game)
+
+    def _compute_numbers_numpy(self) -> None:
+        flat = self._draws_array().ravel() - self.MIN_NUM
+        counts = np.bincount(flat, minlength=self.MAX_NUM)
+        # The Counter keeps first-appearance insertion order so most_common() ties match the Python engine
+        seen, first_pos = np.unique(flat, return_index=True)
+        order = seen[np.argsort(first_pos, kind='stable')]
+        self._stats['number_freq'] = Counter(dict(zip((order + self.MIN_NUM).tolist(), counts[order].tolist())))
+
+    def _compute_hot_cold(self) -> None:
+        # O(45) from number_freq, whichever engine built it
+        number_freq = self.number_freq
+        hot_numbers: List[int] = []
+        cold_numbers: List[int] = []
+        if number_freq:
+            avg_freq = sum(number_freq.values()) / len(number_freq)
             
-        # Use list comprehensions for better performance
-        all_numbers_flat = [num for game in self.past_winnings for num in game]
-        sums = [sum(game) for game in self.past_winnings]
-        
-        # Clear and rebuild pair frequency counter
-        self.pair_freq.clear()
+            # Use more efficient filtering
+            hot_items = [(n, f) for n, f in number_freq.items() if f > avg_freq]
+            hot_numbers = [n for n, f in sorted(hot_items, key=lambda x: x[1], reverse=True)]
+            
+            cold_items = [(n, number_freq.get(n, 0)) for n in range(self.MIN_NUM, self.MAX_NUM + 1)
+                          if number_freq.get(n, 0) < avg_freq]
+            cold_numbers = [n for n, f in sorted(cold_items, key=lambda x: x[1])]
+        self._stats['hot_numbers'] = hot_numbers
+        self._stats['cold_numbers'] = cold_numbers
+
+    def _compute_pairs(self) -> None:
+        self._compute_with_engine('pairs')
+
+    def _compute_pairs_python(self) -> None:
+        if self.history is not None:
+            self._set_pairs(self.history.pair_counts(), None)
+            return
+        pair_freq: Counter = Counter()
         for game in self.past_winnings:
             # Generate pairs more efficiently
             for i in range(self.NUM_BALLS):
                 for j in range(i + 1, self.NUM_BALLS):
                     pair = tuple(sorted((game[i], game[j])))
-                    self.pair_freq[pair] += 1
-        
-        if not all_numbers_flat:
-            return
+                    pair_freq[pair] += 1
+        self._set_pairs(pair_freq, None)
 
-        self.number_freq = Counter(all_numbers_flat)
-        total_freq = sum(self.number_freq.values())
-        unique_numbers = len(self.number_freq)
-        
-        if unique_numbers > 0:
-            avg_freq = total_freq / unique_numbers
-            
-            # Use more efficient filtering
-            hot_items = [(n, f) for n, f in self.number_freq.items() if f > avg_freq]
-            self.hot_numbers = [n for n, f in sorted(hot_items, key=lambda x: x[1], reverse=True)]
-            
-            all_numbers = set(range(self.MIN_NUM, self.MAX_NUM + 1))
-            cold_numbers = [(n, self.number_freq.get(n, 0)) for n in all_numbers if self.number_freq.get(n, 0) < avg_freq]
-            self.cold_numbers = [n for n, f in sorted(cold_numbers, key=lambda x: x[1])]
-        
+    def _compute_pairs_numpy(self) -> None:
+        """Vectorized equivalent of _compute_pairs_python built on a draws x 45 incidence matrix."""
+        idx = self._draws_array() - self.MIN_NUM
+        num_draws = len(idx)
+        # float64 so the product goes through BLAS (integer matmul does not); counts stay exact below 2**53
+        incidence = np.zeros((num_draws, self.MAX_NUM), dtype=np.float64)
+        incidence[np.arange(num_draws)[:, None], idx] = 1
+        if (incidence.sum(axis=1) != self.NUM_BALLS).any():
+            raise ValueError("past_winnings contains draws with repeated numbers")
+
+        pair_matrix = (incidence.T @ incidence).astype(np.int32)
+        np.fill_diagonal(pair_matrix, 0)
+
+        # The Counter keeps first-appearance insertion order so ties behave exactly like the Python engine
+        cols = [(i, j) for i in range(self.NUM_BALLS) for j in range(i + 1, self.NUM_BALLS)]
+        a = idx[:, [c[0] for c in cols]]
+        b = idx[:, [c[1] for c in cols]]
+        codes = (np.minimum(a, b) * self.MAX_NUM + np.maximum(a, b)).ravel()
+        seen, first_pos = np.unique(codes, return_index=True)
+        order = seen[np.argsort(first_pos, kind='stable')]
+        lo, hi = np.divmod(order, self.MAX_NUM)
+        freqs = pair_matrix[lo, hi]
+        pair_freq = Counter({
+            (int(x) + self.MIN_NUM, int(y) + self.MIN_NUM): int(f)
+            for x, y, f in zip(lo, hi, freqs)
+        })
+        self._set_pairs(pair_freq, pair_matrix)
+
+    def _set_pairs(self, pair_freq: Counter, pair_matrix) -> None:
         # Only keep pairs that appear very rarely
-        self.incompatible_pairs = {p for p, f in self.pair_freq.items() if f <= 1}
-        
-        # Use set operations for better performance
-        recent_limit = min(15, len(self.past_winnings))
-        recent_numbers = set()
-        for game in self.past_winnings[-recent_limit:]:
-            recent_numbers.update(game)
-        
-        self.long_term_unseen = [n for n in range(self.MIN_NUM, self.MAX_NUM + 1) if n not in recent_numbers]
-        
-        if sums:
-            self.sum_stats = {'min': min(sums), 'max': max(sums), 'avg': sum(sums) / len(sums)}
-        
-        self._patterns_analyzed = True
+        incompatible_pairs = {p for p, f in pair_freq.items() if f <= 1}
+        masks = [0] * (self.MAX_NUM + 1)
+        for a, b in incompatible_pairs:
+            masks[a] |= bit(b)
+            masks[b] |= bit(a)
+        self._stats.update(pair_freq=pair_freq, incompatible_pairs=incompatible_pairs,
+                           incompatible_masks=masks, pair_matrix=pair_matrix)
+
+    def _compute_recency(self) -> None:
+        self._compute_with_engine('recency')
+
+    def _compute_recency_python(self) -> None:
+        draws = self.history.tuples() if self.history is not None else self.past_winnings
+        self._stats['recency'] = RecencyIndex(draws)
+
+    def _compute_recency_numpy(self) -> None:
+        self._stats['recency'] = RecencyIndex.from_array(self._draws_array())
+
+    def _compute_unseen(self) -> None:
+        # O(45) from the recency index, whichever engine built it
+        unseen = self.recency.unseen(self.UNSEEN_WINDOW) if self.past_winnings else []
+        self._stats['long_term_unseen'] = unseen
+
+    def _compute_sums(self) -> None:
+        self._compute_with_engine('sums')
+
+    def _compute_sums_python(self) -> None:
+        sums = self.history.sums() if self.history is not None else [sum(game) for game in self.past_winnings]
+        self._set_sums(sum(sums), min(sums, default=0), max(sums, default=0), len(sums))
+
+    def _compute_sums_numpy(self) -> None:
+        sums = self._draws_array().sum(axis=1)
+        self._set_sums(int(sums.sum()), int(sums.min()), int(sums.max()), len(sums))
+
+    def _set_sums(self, total: int, low: int, high: int, count: int) -> None:
+        self._stats['sum_total'] = total
+        self._stats['sum_stats'] = {'min': low, 'max': high, 'avg': total / count if count else 0}
+
+    def _cooccurrence_draws(self):
+        # The shared array when the numpy engine applies; CooccurrenceIndex falls back to counting draw by draw
+        if self._uses_numpy():
+            try:
+                return self._draws_array()
+            except ValueError:
+                pass
+        return self.past_winnings
+
+    def _compute_triples(self) -> None:
+        from L_lotto_cooccur import CooccurrenceIndex
+        self._stats['triple_freq'] = CooccurrenceIndex(3, self._cooccurrence_draws())
+
+    def _compute_quads(self) -> None:
+        from L_lotto_cooccur import CooccurrenceIndex
+        self._stats['quad_freq'] = CooccurrenceIndex(4, self._cooccurrence_draws())
 
-    def _generate_with_filter(self, condition: Callable[[List[int]], bool], max_trials: int = 100) -> List[int]:
-        """Helper to generate numbers satisfying a condition."""
-        for _ in range(max_trials):
-            numbers = sorted(random.sample(range(self.MIN_NUM, self.MAX_NUM + 1), self.NUM_BALLS))
-            if condition(numbers):
-                return numbers
-        return self.generate_random()
+    def add_draw(self, numbers: List[int], bonus: Optional[int] = None) -> None:
+        """Append one draw and update every computed statistic in O(1) instead of re-analyzing the history."""
+        self.add_draws([(numbers, bonus)])
+
+    def add_draws(self, batch: List[Any]) -> None:
+        """Append draws in order. Items are 6-number lists, (numbers, bonus) pairs or DrawHistory rows."""
+        draws = []
+        for item in batch:
+            round_no = draw_date = None
+            if isinstance(item, DrawRow):
+                round_no, numbers, bonus, draw_date = item
+            elif len(item) == 2 and not isinstance(item[0], int):
+                numbers, bonus = item
+            else:
+                numbers, bonus = item, None
+            # Plain ints: numpy rows (e.g. uint8 from generate_batch) would overflow the running sums
+            game = [int(x) for x in numbers]
+            if (len(game) != self.NUM_BALLS or len(set(game)) != self.NUM_BALLS
+                    or not all(self.MIN_NUM <= x <= self.MAX_NUM for x in game)):
+                raise ValueError(f"Invalid draw: {numbers}")
+            draws.append((game, int(bonus) if bonus else None, round_no, draw_date))
+        if not draws:
+            return
+
+        # Groups already computed for the current data are updated in place; the rest stay lazy
+        fresh = [g for g in self.INCREMENTAL_GROUPS if self._stats_version.get(g) == self.data_version]
+        self.data_version += 1
+        for game, bonus, round_no, draw_date in draws:
+            if self.history is not None:
+                self.history.append(game, bonus, round_no, draw_date)
+            else:
+                self.past_winnings.append(game)
+            self.bonus_numbers.append(bonus)
+            self._apply_draw(game, fresh)
+            if self._prefix_sums is not None:
+                self._prefix_sums.append(game)
+            if self._digest_hash is not None:
+                self._digest_hash.update(bytes(game))
+        for group in fresh:
+            self._stats_version[group] = self.data_version
+
+    def _apply_draw(self, game: List[int], groups: List[str]) -> None:
+        """Fold one (already appended) draw into the given computed statistic groups."""
+        stats = self._stats
+        if 'numbers' in groups:
+            stats['number_freq'].update(game)
+        if 'recency' in groups:
+            stats['recency'].append(game)
+        if 'triples' in groups:
+            stats['triple_freq'].add(game)
+        if 'quads' in groups:
+            stats['quad_freq'].add(game)
+        if 'pairs' in groups:
+            pair_freq = stats['pair_freq']
+            incompatible_pairs = stats['incompatible_pairs']
+            incompatible_masks = stats['incompatible_masks']
+            for i in range(self.NUM_BALLS):
+                for j in range(i + 1, self.NUM_BALLS):
+                    pair = tuple(sorted((game[i], game[j])))
+                    pair_freq[pair] += 1
+                    count = pair_freq[pair]
+                    if count == 1:
+                        incompatible_pairs.add(pair)
+                        incompatible_masks[pair[0]] |= bit(pair[1])
+                        incompatible_masks[pair[1]] |= bit(pair[0])
+                    elif count == 2:
+                        incompatible_pairs.discard(pair)
+                        incompatible_masks[pair[0]] &= ~bit(pair[1])
+                        incompatible_masks[pair[1]] &= ~bit(pair[0])
+
+            pair_matrix = stats['pair_matrix']
+            if pair_matrix is not None:
+                idx = np.asarray(game) - self.MIN_NUM
+                pair_matrix[np.ix_(idx, idx)] += 1
+                pair_matrix[idx, idx] -= 1
+        if 'sums' in groups:
+            s = sum(game)
+            stats['sum_total'] += s
+            sum_stats = stats['sum_stats']
+            first = len(self.past_winnings) == 1
+            stats['sum_stats'] = {
+                'min': s if first else min(sum_stats['min'], s),
+                'max': s if first else max(sum_stats['max'], s),
+                'avg': stats['sum_total'] / len(self.past_winnings),
+            }
+
+    def prefix_sums(self):
+        """Per-number/per-pair prefix sums over the draw index (L_lotto_window.DrawPrefixSums). Requires numpy."""
+        if np is None:
+            raise ImportError("prefix_sums requires numpy to be installed")
+        if self._prefix_sums is None:
+            from L_lotto_window import DrawPrefixSums
+            self._prefix_sums = DrawPrefixSums(self.past_winnings)
+        return self._prefix_sums
+
+    def _window_bounds(self, window: Optional[int], as_of: Optional[int]) -> Tuple[int, int]:
+        """Draw index range [start, stop) of the last `window` draws before index as_of (None = all / latest)."""
+        stop = len(self.past_winnings) if as_of is None else max(0, min(as_of, len(self.past_winnings)))
+        if window is None:
+            return 0, stop
+        if window <= 0:
+            raise ValueError("window must be positive")
+        return max(0, stop - window), stop
+
+    def window_number_freq(self, window: Optional[int] = None, as_of: Optional[int] = None) -> Dict[int, int]:
+        """Appearances of every number 1..45 in the last `window` draws before draw index as_of.
+
+        O(45) from the prefix sums with numpy; without numpy the window is scanned.
+        """
+        start, stop = self._window_bounds(window, as_of)
+        if np is not None:
+            counts = self.prefix_sums().number_counts(start, stop)
+            return {n: int(counts[n - self.MIN_NUM]) for n in range(self.MIN_NUM, self.MAX_NUM + 1)}
+        window = self.past_winnings[start:stop]
+        counter = window.number_counts() if self.history is not None else Counter(num for game in window for num in game)
+        return {n: counter.get(n, 0) for n in range(self.MIN_NUM, self.MAX_NUM + 1)}
+
+    def window_pair_matrix(self, window: Optional[int] = None, as_of: Optional[int] = None):
+        """45x45 co-occurrence counts (index = number - 1) for the same window, in O(45^2). Requires numpy."""
+        start, stop = self._window_bounds(window, as_of)
+        return self.prefix_sums().pair_counts(start, stop)
+
+    def window_hot_cold(self, window: Optional[int] = None, as_of: Optional[int] = None) -> Tuple[List[int], List[int]]:
+        """(hot, cold) numbers of a window, by the rule of _analyze_patterns; ties in ascending number order."""
+        freq = self.window_number_freq(window, as_of)
+        appeared = [f for f in freq.values() if f]
+        if not appeared:
+            return [], []
+        avg_freq = sum(appeared) / len(appeared)
+        hot = sorted((n for n, f in freq.items() if f > avg_freq), key=lambda n: -freq[n])
+        cold = sorted((n for n, f in freq.items() if f < avg_freq), key=lambda n: freq[n])
+        return hot, cold
+
+    def window_unseen(self, window: int = UNSEEN_WINDOW, as_of: Optional[int] = None) -> List[int]:
+        """Numbers absent from the last `window` draws before draw index as_of."""
+        if as_of is None or as_of >= len(self.past_winnings):
+            return self.recency.unseen(window)
+        return [n for n, f in self.window_number_freq(window, as_of).items() if not f]
+
+    def overdue_numbers(self, percentile: float = 90) -> List[int]:
+        """Numbers whose current gap exceeds their own `percentile` gap, most overdue first; O(45)."""
+        return self.recency.overdue(percentile)
+
+    def _fill_random(self, mask: int) -> int:
+        """Top a partial ticket up to NUM_BALLS numbers with uniformly random extra numbers."""
+        while popcount(mask) < self.NUM_BALLS:
+            mask |= bit(self.rng.randint(self.MIN_NUM, self.MAX_NUM))
+        return mask
+
+    def _constraint_sampler(self, **constraints) -> ConstraintSampler:
+        """Cached exact sampler for a combination of the built-in constraints."""
+        key = tuple(sorted(constraints.items()))
+        sampler = self._constraint_samplers.get(key)
+        if sampler is None:
+            sampler = self._constraint_samplers[key] = ConstraintSampler(**constraints)
+            self.cost_stats['constraint_builds'] += 1
+        return sampler
+
+    def use_combination_index(self, index) -> None:
+        """Serve the constrained generators from a precomputed CombinationIndex (None to stop)."""
+        self.combination_index = index
+
+    def _sample_constrained(self, **constraints) -> List[int]:
+        """Uniform ticket satisfying the built-in constraints, from the index when one is attached."""
+        if self.combination_index is not None:
+            ranks = self.combination_index.select(**constraint_index_bounds(**constraints))
+            if not len(ranks):
+                raise ValueError("No 6/45 combination satisfies the constraints")
+            return self.combination_index.combination(int(ranks[self.rng.randrange(len(ranks))]))
+        return self._constraint_sampler(**constraints).sample(self.rng)
 
     def generate_random(self) -> List[int]: 
-        return sorted(random.sample(range(self.MIN_NUM, self.MAX_NUM + 1), self.NUM_BALLS))
+        return sorted(self.rng.sample(range(self.MIN_NUM, self.MAX_NUM + 1), self.NUM_BALLS))
 
-    def generate_pattern(self) -> List[int]: 
+    def _plan(self, name: str, build: Callable[[], Any]) -> Any:
+        """Generator plan built once per data_version; generating a ticket then only samples from it."""
+        cached = self._plans.get(name)
+        if cached is None or cached[0] != self.data_version:
+            cached = self._plans[name] = (self.data_version, build())
+        return cached[1]
+
+    def _pattern_sampler(self) -> WeightedSampler:
+        return self._plan('pattern', lambda: WeightedSampler(dict(self.number_freq)))
+
+    def _inverse_pattern_sampler(self) -> WeightedSampler:
+        def build() -> WeightedSampler:
+            max_f = max(self.number_freq.values()) if self.number_freq else 0
+            return WeightedSampler({n: (max_f - self.number_freq.get(n, 0)) + 1
+                                    for n in range(self.MIN_NUM, self.MAX_NUM + 1)})
+        return self._plan('inverse_pattern', build)
+
+    def _pairs_plan(self) -> PairsPlan:
+        def build() -> PairsPlan:
+            pairs = tuple(p for p, _ in self.pair_freq.most_common(10))
+            return PairsPlan(pairs, tuple(pair_mask(a, b) for a, b in pairs))
+        return self._plan('frequent_pairs', build)
+
+    def _triples_plan(self) -> TriplesPlan:
+        def build() -> TriplesPlan:
+            triples = tuple(t for t, _ in self.triple_freq.top(10))
+            return TriplesPlan(triples, tuple(numbers_to_mask(t) for t in triples))
+        return self._plan('frequent_triples', build)
+
+    def _hot_cold_plan(self) -> HotColdPlan:
+        return self._plan('hot_cold', lambda: HotColdPlan(tuple(self.hot_numbers), tuple(self.cold_numbers)))
+
+    def _carryover_plan(self) -> CarryoverPlan:
+        return self._plan('carryover', lambda: CarryoverPlan(tuple(self.past_winnings[-1]), tuple(self.long_term_unseen)))
+
+    def _compatibility_plan(self) -> CompatibilityPlan:
+        def build() -> CompatibilityPlan:
+            matrix = None
+            if np is not None:
+                matrix = np.zeros((self.MAX_NUM, self.MAX_NUM), dtype=bool)
+                for a, b in self.incompatible_pairs:
+                    matrix[a - 1, b - 1] = matrix[b - 1, a - 1] = True
+                matrix.setflags(write=False)
+            return CompatibilityPlan(tuple(self.incompatible_masks), matrix)
+        return self._plan('compatibility', build)
+
+    def _covering_plan(self) -> Tuple[Tuple[int, ...], ...]:
+        def build() -> Tuple[Tuple[int, ...], ...]:
+            pool = [n for n, _ in self.number_freq.most_common(self.COVERING_POOL_SIZE)]
+            return tuple(map(tuple, self.covering_design(pool, self.COVERING_MATCH, self.COVERING_DRAWN)))
+        return self._plan('covering', build)
+
+    def _data_digest(self) -> bytes:
+        """Content hash of the history (L_lotto_snapshot.draws_digest), seeding anything sampled from this data."""
+        if self._digest_hash is None:
+            from L_lotto_snapshot import draws_hash
+            self._digest_hash = draws_hash(self.past_winnings)
+        return self._digest_hash.digest()
+
+    def _ensemble_sampler(self, data_driven_only: bool) -> WeightedSampler:
+        """generate_data_driven_mix / generate_all_methods: one weighted draw from the methods' averaged marginals."""
+        def build() -> WeightedSampler:
+            from L_lotto_ensemble import ensemble_weights
+            data_driven = {m.__name__ for m in self._get_generation_methods(data_driven_only=True)}
+            methods = self._get_generation_methods(data_driven_only=data_driven_only, all_methods=not data_driven_only)
+            current = self._plan('method_marginals', dict)  # shared by both mixes for this data_version
+            return WeightedSampler(ensemble_weights(self, methods, data_driven, self._static_marginals, current,
+                                                    self._data_digest()))
+        return self._plan('ensemble_data_driven' if data_driven_only else 'ensemble_all', build)
+
+    def compile_plans(self) -> None:
+        """Build every generator plan for the current data now (e.g. before handing the instance to workers)."""
         if not self.past_winnings:
+            return
+        self._pattern_sampler()
+        self._inverse_pattern_sampler()
+        self._pairs_plan()
+        self._triples_plan()
+        self._hot_cold_plan()
+        self._carryover_plan()
+        self._compatibility_plan()
+        if np is not None:
+            self._covering_plan()
+        self._ensemble_sampler(data_driven_only=True)
+        self._ensemble_sampler(data_driven_only=False)
+
+    def generate_pattern(self) -> List[int]: 
+        if not self.past_winnings or not self.number_freq:
             return self.generate_random()
-        population = list(self.number_freq.keys())
-        weights = list(self.number_freq.values())
-        if not population:
-            return self.generate_random()
-        
-        numbers = set()
-        max_attempts = 100
-        attempt = 0
-        while len(numbers) < self.NUM_BALLS and attempt < max_attempts: 
-            numbers.add(random.choices(population, weights=weights, k=1)[0])
-            attempt += 1
-        return sorted(list(numbers))
+        return self._pattern_sampler().sample(self.rng)
 
     def generate_inverse_pattern(self) -> List[int]:
         if not self.past_winnings:
             return self.generate_random()
-        all_possible_nums = list(range(self.MIN_NUM, self.MAX_NUM + 1))
-        max_f = max(self.number_freq.values()) if self.number_freq else 0
-        weights = [(max_f - self.number_freq.get(num, 0)) + 1 for num in all_possible_nums]
-        
-        numbers = set()
-        max_attempts = 100
-        attempt = 0
-        while len(numbers) < self.NUM_BALLS and attempt < max_attempts:
-            numbers.add(random.choices(all_possible_nums, weights=weights, k=1)[0])
-            attempt += 1
-        return sorted(list(numbers))
+        return self._inverse_pattern_sampler().sample(self.rng)
 
     def generate_balance(self) -> List[int]:
-        return self._generate_with_filter(lambda n: 2 <= sum(1 for x in n if x % 2 == 0) <= 4)
+        return self._sample_constrained(min_even=2, max_even=4)
 
     def generate_range_distribution(self) -> List[int]:
         try:
-            n = set()
-            ranges = [(1, 15), (16, 30), (31, 45)]
-            for s, e in ranges:
-                n.update(random.sample(range(s, e + 1), 2))
-            while len(n) < self.NUM_BALLS:
-                n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-            # Ensure we don't try to sample more than available
-            sample_size = min(self.NUM_BALLS, len(n))
-            return sorted(random.sample(list(n), sample_size))
+            mask = 0
+            for band in RANGE_BANDS:
+                mask |= numbers_to_mask(self.rng.sample(band, 2))
+            return mask_to_numbers(self._fill_random(mask))
         except (ValueError, IndexError): 
             return self.generate_random()
 
     def generate_prime(self) -> List[int]:
-        primes = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43}
-        return self._generate_with_filter(lambda n: sum(1 for x in n if x in primes) >= 2)
+        return self._sample_constrained(min_primes=2)
 
     def generate_sum_range(self, min_sum: Optional[int] = None, max_sum: Optional[int] = None) -> List[int]:
         min_s = min_sum or (self.sum_stats['min'] if self.past_winnings else 111)
         max_s = max_sum or (self.sum_stats['max'] if self.past_winnings else 170)
-        return self._generate_with_filter(lambda n: min_s <= sum(n) <= max_s)
+        return self._sample_constrained(min_sum=min_s, max_sum=max_s)
 
     def generate_consecutive(self) -> List[int]:
-        def has_consecutive(n: List[int]) -> bool:
-            for i in range(len(n) - 1):
-                if n[i+1] == n[i] + 1:
-                    return True
-            return False
-        return self._generate_with_filter(has_consecutive)
-
-    def generate_hot_cold_mix(self) -> List[int]:
+        return self._sample_constrained(require_consecutive=True)
+
+    def generate_hot_cold_mix(self, window: Optional[int] = None) -> List[int]:
+        """window limits hot/cold to the last `window` draws (None = whole history)."""
         if not self.past_winnings:
             return self.generate_random()
         
-        n = set()
-        if self.hot_numbers: 
-            n.update(random.sample(self.hot_numbers, min(3, len(self.hot_numbers))))
-        if self.cold_numbers: 
-            n.update(random.sample(self.cold_numbers, min(3, len(self.cold_numbers))))
-        
-        while len(n) < self.NUM_BALLS: 
-            n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        # Ensure we don't try to sample more than available
-        sample_size = min(self.NUM_BALLS, len(n))
-        return sorted(random.sample(list(n), sample_size))
+        hot_numbers, cold_numbers = self._hot_cold_plan() if window is None else self.window_hot_cold(window)
+        mask = 0
+        if hot_numbers: 
+            mask |= numbers_to_mask(self.rng.sample(hot_numbers, min(3, len(hot_numbers))))
+        if cold_numbers: 
+            mask |= numbers_to_mask(self.rng.sample(cold_numbers, min(3, len(cold_numbers))))
+        return mask_to_numbers(self._fill_random(mask))
 
     def generate_frequent_pairs(self) -> List[int]:
-        if not self.pair_freq:
+        top_masks = self._pairs_plan().masks
+        if not top_masks:
             return self.generate_random()
-        
-        top_pairs = self.pair_freq.most_common(10)
-        if not top_pairs:
+
+        mask = self.rng.choice(top_masks)
+        return mask_to_numbers(self._fill_random(mask))
+
+    def generate_frequent_triples(self) -> List[int]:
+        top_masks = self._triples_plan().masks
+        if not top_masks:
             return self.generate_random()
 
-        n = set(random.choice(top_pairs)[0])
-        while len(n) < self.NUM_BALLS: 
-            n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        # Ensure we don't try to sample more than available
-        sample_size = min(self.NUM_BALLS, len(n))
-        return sorted(random.sample(list(n), sample_size))
+        mask = self.rng.choice(top_masks)
+        return mask_to_numbers(self._fill_random(mask))
 
     def generate_ending_pattern(self) -> List[int]:
-        groups = {i: [n for n in range(self.MIN_NUM, self.MAX_NUM + 1) if n % 10 == i] for i in range(10)}
-        n = set()
+        mask = 0
         # Pick 1 to 3 numbers from a random ending group
-        for _ in range(random.randint(1, 3)): 
-            chosen_ending = random.choice(list(groups.keys()))
-            if groups[chosen_ending]: 
-                n.add(random.choice(groups[chosen_ending]))
-        
-        while len(n) < self.NUM_BALLS: 
-            n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        # Ensure we don't try to sample more than available
-        sample_size = min(self.NUM_BALLS, len(n))
-        return sorted(random.sample(list(n), sample_size))
+        for _ in range(self.rng.randint(1, 3)): 
+            mask |= bit(self.rng.choice(self.rng.choice(ENDING_GROUPS)))
+        return mask_to_numbers(self._fill_random(mask))
 
     def generate_statistical_optimal(self) -> List[int]:
         if not self.past_winnings:
             return self.generate_random()
         
         min_s, max_s = self.sum_stats['min'], self.sum_stats['max']
-        
-        def is_optimal(n: List[int]) -> bool:
-            s = sum(n)
-            even_count = sum(1 for x in n if x % 2 == 0)
-            return (2 <= even_count <= 4) and (min_s <= s <= max_s)
+        return self._sample_constrained(min_even=2, max_even=4, min_sum=min_s, max_sum=max_s)
 
-        return self._generate_with_filter(is_optimal, max_trials=200)
-
-    def generate_carryover_unseen_mix(self) -> List[int]:
-        if len(self.past_winnings) < 15:
+    def generate_carryover_unseen_mix(self, window: int = UNSEEN_WINDOW) -> List[int]:
+        """Carry over numbers from the last draw and add numbers unseen in the last `window` draws."""
+        if len(self.past_winnings) < window:
             return self.generate_random()
         
-        n = set(random.sample(self.past_winnings[-1], random.randint(1, 2)))
-        if self.long_term_unseen: 
-            n.update(random.sample(self.long_term_unseen, random.randint(2, 3)))
-        
-        while len(n) < self.NUM_BALLS: 
-            n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        # Ensure we don't try to sample more than available
-        sample_size = min(self.NUM_BALLS, len(n))
-        return sorted(random.sample(list(n), sample_size))
+        plan = self._carryover_plan()
+        unseen = plan.unseen if window == self.UNSEEN_WINDOW else self.recency.unseen(window)
+        mask = numbers_to_mask(self.rng.sample(plan.last_draw, self.rng.randint(1, 2)))
+        if unseen: 
+            mask |= numbers_to_mask(self.rng.sample(unseen, min(len(unseen), self.rng.randint(2, 3))))
+        return mask_to_numbers(self._fill_random(mask))
 
     def generate_same_ending_mix(self) -> List[int]:
-        groups = {i: [n for n in range(self.MIN_NUM, self.MAX_NUM + 1) if n % 10 == i] for i in range(10)}
-        endings_with_pairs = [i for i, g in groups.items() if len(g) >= 2]
-        if not endings_with_pairs:
+        if not PAIRED_ENDING_GROUPS:
             return self.generate_random()
         
-        chosen_ending = random.choice(endings_with_pairs)
-        n = set(random.sample(groups[chosen_ending], 2))
-        
-        while len(n) < self.NUM_BALLS: 
-            n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        return sorted(list(n))
+        mask = numbers_to_mask(self.rng.sample(self.rng.choice(PAIRED_ENDING_GROUPS), 2))
+        return mask_to_numbers(self._fill_random(mask))
+
+    def is_compatible(self, mask: int) -> bool:
+        """True if the ticket mask contains no incompatible pair (one AND per number)."""
+        incompatible = self.incompatible_masks
+        m = mask
+        while m:
+            low = m & -m
+            if mask & incompatible[low.bit_length()]:
+                return False
+            m ^= low
+        return True
 
     def generate_compatibility_mix(self) -> List[int]:
         if not self.incompatible_pairs:
             return self.generate_random()
 
-        def is_compatible(n: List[int]) -> bool:
-            for i in range(self.NUM_BALLS):
-                for j in range(i + 1, self.NUM_BALLS):
-                    if tuple(sorted((n[i], n[j]))) in self.incompatible_pairs:
-                        return False
-            return True
-        
-        return self._generate_with_filter(is_compatible, max_trials=200)
+        # Build the ticket one number at a time, uniformly from the numbers still compatible
+        # with everything chosen so far. A dead end restarts the ticket, exactly as the batch
+        # version does; after COMPATIBILITY_RESTARTS of them a backtracking search finishes it.
+        incompatible = self._compatibility_plan().masks
+        for _ in range(self.COMPATIBILITY_RESTARTS):
+            chosen = 0
+            candidates = FULL_MASK
+            for _ in range(self.NUM_BALLS):
+                if not candidates:
+                    break
+                number = self.rng.choice(mask_to_numbers(candidates))
+                chosen |= bit(number)
+                candidates &= ~bit(number) & ~incompatible[number]
+            else:
+                return mask_to_numbers(chosen)
+            self.cost_stats['restarts'] += 1
+        return self._backtrack_compatible()
+
+    def _backtrack_compatible(self) -> List[int]:
+        """generate_compatibility_mix after persistent dead ends: on a dead end, drop the last pick and exclude it."""
+        incompatible = self._compatibility_plan().masks
+        picks: List[Tuple[int, int]] = []  # (number bit, candidates it was drawn from)
+        chosen = 0
+        candidates = FULL_MASK
+        while len(picks) < self.NUM_BALLS:
+            if not candidates:
+                if not picks:
+                    return self.generate_random()  # no compatible ticket exists at all
+                low, candidates = picks.pop()
+                self.cost_stats['backtracks'] += 1
+                chosen ^= low
+                candidates &= ~low
+                continue
+            numbers = mask_to_numbers(candidates)
+            number = self.rng.choice(numbers)
+            low = bit(number)
+            picks.append((low, candidates))
+            chosen |= low
+            candidates &= ~low & ~incompatible[number]
+        return mask_to_numbers(chosen)
+
+    def covering_design(self, pool: List[int], match: int = 3, drawn: int = 4) -> List[List[int]]:
+        """Ticket set from pool guaranteeing `match` numbers whenever `drawn` winning numbers are in pool.
+
+        Built greedily (see L_lotto_covering), deterministic for a given pool
+        and cached per pool. Requires numpy.
+        """
+        if np is None:
+            raise ImportError("covering_design requires numpy to be installed")
+        key = (tuple(sorted(set(pool))), match, drawn)
+        design = self._covering_designs.get(key)
+        if design is None:
+            from L_lotto_covering import covering_design
+            design = self._covering_designs[key] = tuple(map(tuple, covering_design(pool, match, drawn)))
+        return [list(ticket) for ticket in design]
+
+    def generate_covering(self) -> List[int]:
+        """A ticket of the covering design over the COVERING_POOL_SIZE most frequent numbers."""
+        if len(self.number_freq) < self.COVERING_POOL_SIZE or np is None:
+            return self.generate_random()
+        return list(self.rng.choice(self._covering_plan()))
+
+    def generate_batch(self, method_name: str, n: int, **kwargs):
+        """Generate n tickets in one vectorized call as an (n, 6) uint8 numpy array.
+
+        method_name is a generator name such as 'generate_pattern' (the
+        'generate_' prefix may be omitted). Requires numpy.
+        """
+        if np is None:
+            raise ImportError("generate_batch requires numpy to be installed")
+        if self._batch_generator is None:
+            from L_lotto_batch import BatchGenerator
+            self._batch_generator = BatchGenerator(self, self.np_rng)
+        return self._batch_generator.generate(method_name, n, **kwargs)
+
+    def generate_parallel(self, method_name: str, n: int, seed: Optional[int] = None,
+                          workers: Optional[int] = None, **kwargs):
+        """generate_batch sharded over a process pool; deterministic for a fixed seed. Requires numpy."""
+        if np is None:
+            raise ImportError("generate_parallel requires numpy to be installed")
+        from L_lotto_parallel import generate_parallel
+        return generate_parallel(self, method_name, n, seed=seed, workers=workers, **kwargs)
+
+    def generate_unique(self, method_name: str, n: int, exclude_drawn: bool = False,
+                        exclude: Optional[Iterable] = None) -> List[List[int]]:
+        """n pairwise-distinct tickets from one generator.
+
+        exclude_drawn also rules out every past winning combination; exclude
+        takes further tickets (number lists or bitmasks), e.g. ones handed
+        out in an earlier session. Raises ValueError if the generator cannot
+        produce n distinct tickets.
+        """
+        from L_lotto_unique import UniqueTicketGenerator
+        return UniqueTicketGenerator(self).generate(method_name, n, exclude_drawn=exclude_drawn, exclude=exclude)
+
+    def score_tickets(self, tickets, models: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Log-likelihood of each ticket under each generator's model, as {model: (n,) float64 array}.
+
+        tickets is an (n, 6) array/list or n bitmasks; models limits the
+        result to some of L_lotto_score.MODELS (default: all). The models are
+        built once per data version. Requires numpy.
+        """
+        if np is None:
+            raise ImportError("score_tickets requires numpy to be installed")
+        from L_lotto_score import TicketScorer
+        return self._plan('scorer', lambda: TicketScorer(self)).score(tickets, models)
 
     def _get_generation_methods(self, data_driven_only: bool = False, all_methods: bool = False) -> List[Callable[[], List[int]]]:
         """Helper to get a list of generation methods."""
@@ -266,11 +860,13 @@ class LottoLogic:
             (self.generate_consecutive, False),
             (self.generate_hot_cold_mix, True),
             (self.generate_frequent_pairs, True),
+            (self.generate_frequent_triples, True),
             (self.generate_ending_pattern, False), # Doesn't strictly need past data
             (self.generate_statistical_optimal, True),
             (self.generate_carryover_unseen_mix, True),
             (self.generate_same_ending_mix, False), # Doesn't strictly need past data
             (self.generate_compatibility_mix, True),
+            (self.generate_covering, True),
         ]
         
         if data_driven_only:
@@ -283,33 +879,7 @@ class LottoLogic:
     def generate_data_driven_mix(self) -> List[int]:
         if not self.past_winnings:
             return self.generate_random()
-        
-        methods = self._get_generation_methods(data_driven_only=True)
-        all_n = set()
-        for method in methods:
-            try:
-                all_n.update(method())
-            except Exception:
-                continue # Ignore errors in sub-methods
-        
-        while len(all_n) < self.NUM_BALLS: 
-            all_n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        # Ensure we don't try to sample more than available
-        sample_size = min(self.NUM_BALLS, len(all_n))
-        return sorted(random.sample(list(all_n), sample_size))
+        return self._ensemble_sampler(data_driven_only=True).sample(self.rng)
 
     def generate_all_methods(self) -> List[int]:
-        methods = self._get_generation_methods(all_methods=True)
-        all_n = set()
-        
-        for method in methods:
-            try: 
-                all_n.update(method())
-            except Exception: 
-                continue
-        
-        while len(all_n) < self.NUM_BALLS: 
-            all_n.add(random.randint(self.MIN_NUM, self.MAX_NUM))
-        # Ensure we don't try to sample more than available
-        sample_size = min(self.NUM_BALLS, len(all_n))
-        return sorted(random.sample(list(all_n), sample_size))
+        return self._ensemble_sampler(data_driven_only=False).sample(self.rng)
@@ -0,0 +1,125 @@
+from typing import Iterable, Iterator, List
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the array decoders need it
+    np = None
+
+# 번호 n은 비트 (n - 1)에 대응 (1~45 -> 45비트 정수)
+MIN_NUM: int = 1
+MAX_NUM: int = 45
+NUM_BALLS: int = 6
+FULL_MASK: int = (1 << MAX_NUM) - 1
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43)
+
+
+def bit(number: int) -> int:
+    return 1 << (number - MIN_NUM)
+
+
+def numbers_to_mask(numbers: Iterable[int]) -> int:
+    mask = 0
+    for n in numbers:
+        mask |= 1 << (n - MIN_NUM)
+    return mask
+
+
+if hasattr(int, 'bit_count'):  # Python 3.10+
+    def popcount(mask: int) -> int:
+        return mask.bit_count()
+else:
+    def popcount(mask: int) -> int:
+        return bin(mask).count('1')
+
+
+# 바이트 단위 조회 테이블 (6바이트 = 48비트로 45비트를 덮음)
+_BYTE_NUMBERS = [[b for b in range(8) if v >> b & 1] for v in range(256)]
+_BYTE_SUMS = [
+    [sum(8 * k + b + MIN_NUM for b in _BYTE_NUMBERS[v]) for v in range(256)]
+    for k in range(6)
+]
+
+
+def mask_to_numbers(mask: int) -> List[int]:
+    """Sorted list of the numbers set in mask."""
+    numbers = []
+    k = 0
+    while mask:
+        base = 8 * k + MIN_NUM
+        numbers.extend(base + b for b in _BYTE_NUMBERS[mask & 0xFF])
+        mask >>= 8
+        k += 1
+    return numbers
+
+
+def mask_bits(masks, width: int = MAX_NUM) -> 'np.ndarray':
+    """(n, width) 0/1 uint8 array of n integer bitmasks; column i is bit i (number i + 1 of a ticket)."""
+    if np is None:
+        raise ImportError("mask_bits requires numpy to be installed")
+    masks = np.asarray(masks, dtype=np.uint64)
+    return ((masks[:, None] >> np.arange(width, dtype=np.uint64)) & np.uint64(1)).astype(np.uint8)
+
+
+def masks_to_numbers(masks) -> 'np.ndarray':
+    """(n, 6) sorted numbers of n ticket masks, the array form of mask_to_numbers."""
+    bits = mask_bits(masks)
+    masks = np.asarray(masks, dtype=np.uint64)
+    if (masks >> np.uint64(MAX_NUM)).any() or (bits.sum(axis=1) != NUM_BALLS).any():
+        raise ValueError("ticket masks must have exactly 6 of the 45 bits set")
+    return np.nonzero(bits)[1].reshape(-1, NUM_BALLS) + MIN_NUM
+
+
+def mask_sum(mask: int) -> int:
+    return (_BYTE_SUMS[0][mask & 0xFF] + _BYTE_SUMS[1][mask >> 8 & 0xFF]
+            + _BYTE_SUMS[2][mask >> 16 & 0xFF] + _BYTE_SUMS[3][mask >> 24 & 0xFF]
+            + _BYTE_SUMS[4][mask >> 32 & 0xFF] + _BYTE_SUMS[5][mask >> 40 & 0xFF])
+
+
+PRIME_MASK: int = numbers_to_mask(PRIMES)
+EVEN_MASK: int = numbers_to_mask(range(MIN_NUM + 1, MAX_NUM + 1, 2))
+
+
+def even_count(mask: int) -> int:
+    return popcount(mask & EVEN_MASK)
+
+
+def prime_count(mask: int) -> int:
+    return popcount(mask & PRIME_MASK)
+
+
+def has_consecutive(mask: int) -> bool:
+    return (mask & (mask >> 1)) != 0
+
+
+def pair_mask(a: int, b: int) -> int:
+    return (1 << (a - MIN_NUM)) | (1 << (b - MIN_NUM))
+
+
+def contains_pair(mask: int, pair: int) -> bool:
+    return (mask & pair) == pair
+
+
+class Ticket(int):
+    """Hashable 45-bit bitmask of a combination; compares and hashes as the underlying int."""
+    __slots__ = ()
+
+    @classmethod
+    def from_numbers(cls, numbers: Iterable[int]) -> 'Ticket':
+        return cls(numbers_to_mask(numbers))
+
+    @property
+    def numbers(self) -> List[int]:
+        return mask_to_numbers(self)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(mask_to_numbers(self))
+
+    def __len__(self) -> int:
+        return popcount(self)
+
+    def __contains__(self, number: int) -> bool:
+        return MIN_NUM <= number <= MAX_NUM and bool(self >> (number - MIN_NUM) & 1)
+
+    def __repr__(self) -> str:
+        return f"Ticket({mask_to_numbers(self)})"
@@ -0,0 +1,111 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from L_lotto_mask import MAX_NUM, NUM_BALLS, mask_bits
+
+NUM_TIERS = 6  # 0 = 낙첨, 1~5 = 1등~5등
+# 일치 개수 -> 등수 (5개 일치는 보너스 여부로 2등/3등 구분)
+TIER_BY_MATCHES = np.array([0, 0, 0, 5, 4, 3, 1], dtype=np.uint8)
+MATCH_CHUNK = 2048
+
+Tickets = Union[np.ndarray, Sequence[Sequence[int]], Sequence[int]]
+
+
+def incidence_matrix(tickets: Tickets) -> np.ndarray:
+    """(n, 45) 0/1 float32 matrix of tickets given as (n, 6) numbers or n 45-bit masks."""
+    arr = np.asarray(tickets)
+    if arr.ndim == 1:
+        return mask_bits(arr).astype(np.float32)
+    out = np.zeros((len(arr), MAX_NUM), dtype=np.float32)
+    out[np.arange(len(arr))[:, None], arr.astype(np.intp) - 1] = 1
+    return out
+
+
+def tiers_from_matches(matches: np.ndarray, bonus_hits: np.ndarray) -> np.ndarray:
+    """Prize tier (1-5, 0 for no prize) from match counts and bonus-ball flags of the same shape."""
+    tiers = TIER_BY_MATCHES[matches]
+    tiers[(matches == 5) & bonus_hits] = 2
+    return tiers
+
+
+class MatchResult:
+    """Tickets x draws comparison.
+
+    matches[i, r] is how many numbers of ticket i were drawn in draw r and
+    bonus[i, r] whether ticket i holds that draw's bonus ball. tiers[i, r],
+    the resulting prize tier (0 when there is no prize), is derived on first
+    access since it costs another full pass over the matrix.
+    """
+
+    def __init__(self, matches: np.ndarray, bonus: np.ndarray) -> None:
+        self.matches = matches
+        self.bonus = bonus
+        self._tiers: Optional[np.ndarray] = None
+
+    @property
+    def tiers(self) -> np.ndarray:
+        if self._tiers is None:
+            self._tiers = tiers_from_matches(self.matches, self.bonus)
+        return self._tiers
+
+    def tier_counts(self) -> np.ndarray:
+        """(n, 6) number of draws each ticket would have won per tier."""
+        tiers = self.tiers
+        counts = np.zeros((len(tiers), NUM_TIERS), dtype=np.int64)
+        for tier in range(1, NUM_TIERS):
+            counts[:, tier] = (tiers == tier).sum(axis=1)
+        counts[:, 0] = tiers.shape[1] - counts[:, 1:].sum(axis=1)
+        return counts
+
+    def best_tier(self) -> np.ndarray:
+        """Best prize tier each ticket ever reached (0 = never won)."""
+        won = np.where(self.tiers > 0, self.tiers, NUM_TIERS)
+        best = won.min(axis=1) if won.shape[1] else np.full(len(won), NUM_TIERS)
+        return np.where(best == NUM_TIERS, 0, best).astype(np.uint8)
+
+
+def match_history(tickets: Tickets, draws: Sequence[Sequence[int]],
+                  bonuses: Optional[Sequence[Optional[int]]] = None,
+                  chunk_size: int = MATCH_CHUNK) -> MatchResult:
+    """Match every ticket against every draw with incidence-matrix products.
+
+    tickets is an (n, 6) array/list or n bitmasks; draws and bonuses are the
+    history as returned by load_lotto_data_with_bonus_from_local (a bonus of
+    0 or None means unknown, so 5 matches count as tier 3 for that draw).
+    The product runs chunk_size tickets at a time so the float32
+    intermediate stays small; only the uint8 result is full size.
+    """
+    ticket_inc = incidence_matrix(tickets)
+    draw_inc_t = np.ascontiguousarray(incidence_matrix(np.asarray(draws).reshape(-1, NUM_BALLS)).T)
+    n, r = len(ticket_inc), draw_inc_t.shape[1]
+    # float32 sums of 0/1 products are exact here (at most 6)
+    matches = np.empty((n, r), dtype=np.uint8)
+    for start in range(0, n, chunk_size):
+        matches[start:start + chunk_size] = ticket_inc[start:start + chunk_size] @ draw_inc_t
+
+    bonus = np.zeros((n, r), dtype=bool)
+    if bonuses is not None:
+        b = np.array([x or 0 for x in bonuses], dtype=np.intp)
+        known = np.flatnonzero(b > 0)
+        bonus[:, known] = ticket_inc[:, b[known] - 1] > 0
+    return MatchResult(matches, bonus)
+
+
+def prize_tiers(tickets: Tickets, draw: Sequence[int], bonus: Optional[int] = None) -> np.ndarray:
+    """Prize tier of each (k, 6) ticket against a single draw."""
+    drawn = np.zeros(MAX_NUM + 1, dtype=bool)
+    drawn[list(draw)] = True
+    tickets = np.asarray(tickets, dtype=np.intp)
+    matches = drawn[tickets].sum(axis=1)
+    bonus_hits = (tickets == bonus).any(axis=1) if bonus else np.zeros(len(tickets), dtype=bool)
+    return tiers_from_matches(matches, bonus_hits)
+
+
+def load_and_match(tickets: Tickets) -> MatchResult:
+    """match_history against the local lotto_data history (bonus included)."""
+    from L_database_local import load_lotto_data_with_bonus_from_local
+    draws, bonuses, message = load_lotto_data_with_bonus_from_local()
+    if not draws:
+        raise ValueError(message)
+    return match_history(tickets, draws, bonuses)
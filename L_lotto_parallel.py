@@ -0,0 +1,86 @@
+import copy
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from L_lotto_batch import BatchGenerator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 50000
+
+# 워커 프로세스마다 한 번 전달받는 분석 상태 (읽기 전용으로 사용)
+_worker_logic = None
+
+
+def _init_worker(logic) -> None:
+    global _worker_logic
+    _worker_logic = logic
+
+
+def _run_chunk(logic, method_name: str, size: int, seed: np.random.SeedSequence, kwargs: Dict[str, Any]) -> np.ndarray:
+    numpy_seed, python_seed = seed.spawn(2)
+    # Scalar fallbacks inside the batch paths draw from the logic's own generator
+    logic.rng = random.Random(int(python_seed.generate_state(1)[0]))
+    generator = BatchGenerator(logic, np.random.default_rng(numpy_seed))
+    return generator.generate(method_name, size, **kwargs)
+
+
+def _worker_chunk(task: Tuple[str, int, np.random.SeedSequence, Dict[str, Any]]) -> np.ndarray:
+    return _run_chunk(_worker_logic, *task)
+
+
+def _plan_chunks(n: int, chunk_size: int, seed: Optional[int]) -> List[Tuple[int, np.random.SeedSequence]]:
+    """Fixed-size chunks with one spawned SeedSequence each, independent of the worker count."""
+    sizes = [min(chunk_size, n - start) for start in range(0, n, chunk_size)]
+    children = np.random.SeedSequence(seed).spawn(len(sizes))
+    return list(zip(sizes, children))
+
+
+def iter_generate_parallel(logic, method_name: str, n: int, seed: Optional[int] = None,
+                           workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           **kwargs) -> Iterator[np.ndarray]:
+    """Generate n tickets across a process pool, yielding (k, 6) uint8 chunks in order.
+
+    The request is split into chunks of chunk_size tickets, each with its own
+    child of SeedSequence(seed), so for a fixed seed the output is identical
+    whatever the number of workers (including workers=1, which runs in-process).
+    Each worker receives one pickled copy of logic and only reads from it.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    chunks = _plan_chunks(n, chunk_size, seed)
+    # Build the plans once here so every worker's copy shares them instead of rebuilding its own
+    logic.compile_plans()
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(chunks))
+
+    if workers <= 1:
+        # Same chunks and seeds as the pool, on a copy so the caller's generators are untouched
+        local = copy.deepcopy(logic)
+        for size, child in chunks:
+            yield _run_chunk(local, method_name, size, child, kwargs)
+        return
+
+    logger.info(f"병렬 생성: {n}개 티켓, {len(chunks)}개 청크, 워커 {workers}개")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(logic,)) as pool:
+        tasks = [(method_name, size, child, kwargs) for size, child in chunks]
+        for result in pool.map(_worker_chunk, tasks):
+            yield result
+
+
+def generate_parallel(logic, method_name: str, n: int, seed: Optional[int] = None,
+                      workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      **kwargs) -> np.ndarray:
+    """All n tickets from iter_generate_parallel as one (n, 6) uint8 array."""
+    parts = list(iter_generate_parallel(logic, method_name, n, seed=seed, workers=workers,
+                                        chunk_size=chunk_size, **kwargs))
+    if not parts:
+        return np.empty((0, 6), dtype=np.uint8)
+    return np.concatenate(parts)
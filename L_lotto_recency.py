@@ -0,0 +1,104 @@
+from collections import Counter
+from typing import Dict, List, Sequence
+
+from L_lotto_mask import MAX_NUM, MIN_NUM
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only from_array needs it
+    np = None
+
+
+class RecencyIndex:
+    """Per-number recency and gap statistics, updated one draw at a time.
+
+    For each number it keeps the index of the last draw it appeared in, the
+    current gap (draws since then, so 1 right after appearing) and a
+    histogram of every completed gap between two consecutive appearances.
+    A number that never appeared is treated as last seen just before the
+    first draw. Gap percentiles are cached per quantile and only recomputed
+    for the six numbers of each appended draw, so overdue() is O(45).
+    """
+
+    def __init__(self, draws: Sequence[Sequence[int]] = ()) -> None:
+        self.size = 0
+        self.last_seen: List[int] = [-1] * (MAX_NUM + 1)
+        self.gap_hist: List[Counter] = [Counter() for _ in range(MAX_NUM + 1)]
+        self._percentiles: Dict[float, List[int]] = {}
+        for draw in draws:
+            self.append(draw)
+
+    @classmethod
+    def from_array(cls, draws: 'np.ndarray') -> 'RecencyIndex':
+        """The index of an (n, 6) array of draws, built with a few array passes instead of n appends."""
+        if np is None:
+            raise ImportError("from_array requires numpy to be installed")
+        index = cls()
+        numbers = np.asarray(draws, dtype=np.intp).ravel()
+        rows = np.repeat(np.arange(len(draws)), np.asarray(draws).shape[1] if len(draws) else 0)
+        # Appearances grouped by number, in draw order: consecutive ones of the same number give a gap
+        order = np.lexsort((rows, numbers))
+        numbers, rows = numbers[order], rows[order]
+        same = numbers[1:] == numbers[:-1]
+        span = len(draws) + 1
+        codes, counts = np.unique(numbers[1:][same] * span + (rows[1:] - rows[:-1])[same], return_counts=True)
+        for code, count in zip(codes.tolist(), counts.tolist()):
+            index.gap_hist[code // span][code % span] = count
+        last_seen = np.full(MAX_NUM + 1, -1, dtype=np.intp)
+        np.maximum.at(last_seen, numbers, rows)
+        index.last_seen = last_seen.tolist()
+        index.size = len(draws)
+        return index
+
+    def append(self, draw: Sequence[int]) -> None:
+        t = self.size
+        for n in draw:
+            if self.last_seen[n] >= 0:
+                self.gap_hist[n][t - self.last_seen[n]] += 1
+            self.last_seen[n] = t
+        self.size += 1
+        for q, cached in self._percentiles.items():
+            for n in draw:
+                cached[n] = self._gap_percentile(n, q)
+
+    def current_gap(self, n: int) -> int:
+        return self.size - self.last_seen[n]
+
+    def current_gaps(self) -> Dict[int, int]:
+        return {n: self.size - self.last_seen[n] for n in range(MIN_NUM, MAX_NUM + 1)}
+
+    def unseen(self, window: int) -> List[int]:
+        """Numbers that did not appear in the last `window` draws."""
+        cutoff = max(0, self.size - window)  # window longer than the history: never drawn
+        return [n for n in range(MIN_NUM, MAX_NUM + 1) if self.last_seen[n] < cutoff]
+
+    def _gap_percentile(self, n: int, q: float) -> int:
+        """Nearest-rank q-th percentile of the completed gaps of n (0 if it has none)."""
+        hist = self.gap_hist[n]
+        total = sum(hist.values())
+        if not total:
+            return 0
+        rank = max(1, -(-q * total // 100))
+        seen = 0
+        for gap in sorted(hist):
+            seen += hist[gap]
+            if seen >= rank:
+                return gap
+        return gap
+
+    def gap_percentile(self, n: int, q: float = 90) -> int:
+        cached = self._percentiles.get(q)
+        if cached is None:
+            cached = self._percentiles[q] = [0] + [self._gap_percentile(m, q) for m in range(MIN_NUM, MAX_NUM + 1)]
+        return cached[n]
+
+    def overdue(self, q: float = 90) -> List[int]:
+        """Numbers whose current gap exceeds their own q-th percentile gap, most overdue first.
+
+        Numbers without any completed gap yet are left out.
+        """
+        self.gap_percentile(MIN_NUM, q)
+        limits = self._percentiles[q]
+        late = [n for n in range(MIN_NUM, MAX_NUM + 1)
+                if self.gap_hist[n] and self.size - self.last_seen[n] > limits[n]]
+        return sorted(late, key=lambda n: limits[n] - (self.size - self.last_seen[n]))
@@ -0,0 +1,150 @@
+import math
+from typing import Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from L_lotto_mask import MAX_NUM, MIN_NUM, NUM_BALLS, PRIMES, masks_to_numbers
+from L_lotto_unique import method_constraints
+
+MAX_SUM = sum(range(MAX_NUM - NUM_BALLS + 1, MAX_NUM + 1))
+SCORE_CHUNK = 1 << 16   # 한 번에 점수를 계산하는 티켓 수 (중간 배열 메모리 상한)
+LOG_UNIFORM = -math.log(math.comb(MAX_NUM, NUM_BALLS))
+
+Tickets = Union[np.ndarray, Sequence[Sequence[int]], Sequence[int]]
+
+# Generators whose ticket distribution is known exactly, scored by TicketScorer
+WEIGHTED_METHODS = ('generate_pattern', 'generate_inverse_pattern')
+CONSTRAINED_METHODS = ('generate_balance', 'generate_prime', 'generate_consecutive',
+                       'generate_sum_range', 'generate_statistical_optimal')
+HISTORY_MODELS = ('history_sum', 'history_even')
+MODELS = ('generate_random',) + WEIGHTED_METHODS + CONSTRAINED_METHODS + HISTORY_MODELS
+
+_IS_PRIME = np.zeros(MAX_NUM + 1, dtype=bool)
+_IS_PRIME[list(PRIMES)] = True
+
+
+def ticket_numbers(tickets: Tickets) -> np.ndarray:
+    """(n, 6) sorted numbers of tickets given as (n, 6) numbers or n 45-bit masks."""
+    arr = np.asarray(tickets)
+    if arr.ndim == 1:
+        return masks_to_numbers(arr)
+    if arr.ndim != 2 or arr.shape[1] != NUM_BALLS:
+        raise ValueError("tickets must be an (n, 6) array of numbers or n bitmasks")
+    numbers = np.sort(arr.astype(np.intp), axis=1)
+    if len(numbers) and (numbers[:, 0].min() < MIN_NUM or numbers[:, -1].max() > MAX_NUM
+                         or (np.diff(numbers, axis=1) == 0).any()):
+        raise ValueError("tickets must hold 6 distinct numbers between 1 and 45")
+    return numbers
+
+
+def _combinations_by_sum() -> np.ndarray:
+    # counts[k, s]: k-subsets of 1..45 with sum s, added one number at a time
+    counts = np.zeros((NUM_BALLS + 1, MAX_SUM + 1), dtype=np.int64)
+    counts[0, 0] = 1
+    for n in range(MIN_NUM, MAX_NUM + 1):
+        for k in range(NUM_BALLS, 0, -1):
+            counts[k, n:] += counts[k - 1, :-n]
+    return counts[NUM_BALLS]
+
+
+def _combinations_by_even() -> np.ndarray:
+    evens = MAX_NUM // 2
+    return np.array([math.comb(evens, k) * math.comb(MAX_NUM - evens, NUM_BALLS - k)
+                     for k in range(NUM_BALLS + 1)], dtype=np.int64)
+
+
+def history_table(values: np.ndarray, combinations: np.ndarray) -> np.ndarray:
+    """log P(ticket) per feature value when the value follows the history and the ticket is uniform given it.
+
+    The value's frequency is Laplace-smoothed over every value some ticket
+    can have, so values never drawn keep a small probability; the result is
+    divided by how many tickets share the value.
+    """
+    counts = np.bincount(np.asarray(values, dtype=np.intp), minlength=len(combinations))[:len(combinations)]
+    possible = combinations > 0
+    table = np.full(len(combinations), -np.inf)
+    table[possible] = (np.log((counts[possible] + 1) / (counts.sum() + possible.sum()))
+                       - np.log(combinations[possible]))
+    return table
+
+
+class TicketScorer:
+    """Vectorized log-likelihood of tickets under each generator whose model is known exactly.
+
+    Built from one LottoLogic data version:
+    - generate_random is uniform over all C(45, 6) tickets;
+    - generate_pattern / generate_inverse_pattern use the exact probability
+      of their weighted samplers (WeightedSampler.log_likelihood);
+    - the constrained generators are uniform over their exact support
+      (-inf outside it), sized by the same DP that samples them;
+    - history_sum / history_even draw the ticket's sum or even count from
+      the history's distribution and the ticket uniformly among those
+      sharing it (see history_table).
+    A generator that falls back to generate_random for lack of data, and
+    the history models of an empty history, are scored as uniform.
+    """
+
+    def __init__(self, logic) -> None:
+        self.samplers = {}
+        if logic.past_winnings and logic.number_freq:
+            self.samplers['generate_pattern'] = logic._pattern_sampler()
+        if logic.past_winnings:
+            self.samplers['generate_inverse_pattern'] = logic._inverse_pattern_sampler()
+        self.constraints = {}
+        for name in CONSTRAINED_METHODS:
+            constraints = method_constraints(logic, name)
+            if constraints is not None:
+                support = logic._constraint_sampler(**constraints).count()
+                self.constraints[name] = (constraints, -math.log(support) if support else -np.inf)
+        self.sum_table = self.even_table = None
+        if logic.past_winnings:
+            draws = np.asarray(logic.past_winnings, dtype=np.intp)
+            self.sum_table = history_table(draws.sum(axis=1), _combinations_by_sum())
+            self.even_table = history_table((draws % 2 == 0).sum(axis=1), _combinations_by_even())
+
+    def _score_chunk(self, numbers: np.ndarray, models: Sequence[str]) -> Dict[str, np.ndarray]:
+        sums = numbers.sum(axis=1)
+        evens = (numbers % 2 == 0).sum(axis=1)
+        scores = {}
+        for name in models:
+            if name in self.samplers:
+                scores[name] = self.samplers[name].log_likelihood(numbers)
+            elif name in self.constraints:
+                constraints, log_p = self.constraints[name]
+                ok = np.ones(len(numbers), dtype=bool)
+                if 'min_even' in constraints:
+                    ok &= evens >= constraints['min_even']
+                if 'max_even' in constraints:
+                    ok &= evens <= constraints['max_even']
+                if 'min_sum' in constraints:
+                    ok &= sums >= constraints['min_sum']
+                if 'max_sum' in constraints:
+                    ok &= sums <= constraints['max_sum']
+                if 'min_primes' in constraints:
+                    ok &= _IS_PRIME[numbers].sum(axis=1) >= constraints['min_primes']
+                if constraints.get('require_consecutive'):
+                    ok &= (np.diff(numbers, axis=1) == 1).any(axis=1)
+                scores[name] = np.where(ok, log_p, -np.inf)
+            elif name == 'history_sum' and self.sum_table is not None:
+                scores[name] = self.sum_table[sums]
+            elif name == 'history_even' and self.even_table is not None:
+                scores[name] = self.even_table[evens]
+            else:
+                scores[name] = np.full(len(numbers), LOG_UNIFORM)
+        return scores
+
+    def score(self, tickets: Tickets, models: Optional[Iterable[str]] = None,
+              chunk_size: int = SCORE_CHUNK) -> Dict[str, np.ndarray]:
+        """{model: (n,) float64 natural log-likelihoods} for tickets as (n, 6) numbers or n bitmasks."""
+        models = list(MODELS if models is None else models)
+        unknown = [name for name in models if name not in MODELS]
+        if unknown:
+            raise ValueError(f"Unknown scoring model: {', '.join(unknown)}")
+        arr = np.asarray(tickets)
+        n = len(arr)
+        scores = {name: np.empty(n) for name in models}
+        for start in range(0, n, chunk_size):
+            part = self._score_chunk(ticket_numbers(arr[start:start + chunk_size]), models)
+            for name in models:
+                scores[name][start:start + chunk_size] = part[name]
+        return scores
@@ -0,0 +1,150 @@
+import hashlib
+import logging
+import os
+import struct
+from collections import Counter
+from typing import Dict, List, Sequence
+
+from L_lotto_recency import RecencyIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b'LTST'
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_SUFFIX = '.stats'
+# magic, format, draw count, sha256 of the draws
+_HEADER = struct.Struct('<4sHI32s')
+_LENGTH = struct.Struct('<I')
+# Sections in file order; each is a little-endian int32 array prefixed by its length
+_SECTIONS = ('number_freq', 'hot', 'cold', 'pair_freq', 'sums', 'last_seen', 'gaps')
+
+
+def snapshot_path(data_file: str = "lotto_data.json") -> str:
+    """Sidecar file next to the data file (lotto_data.json -> lotto_data.stats)."""
+    return os.path.splitext(data_file)[0] + SNAPSHOT_SUFFIX
+
+
+def draws_hash(draws: Sequence[Sequence[int]]):
+    """sha256 object over the history's numbers in draw order; appending a draw is update(bytes(draw))."""
+    number_bytes = getattr(draws, 'number_bytes', None)  # DrawHistory: straight from its columns
+    data = number_bytes() if number_bytes is not None else bytes(n for draw in draws for n in draw)
+    return hashlib.sha256(data)
+
+
+def draws_digest(draws: Sequence[Sequence[int]]) -> bytes:
+    """Content hash of the history; a snapshot is only used for exactly the draws it was built from."""
+    return draws_hash(draws).digest()
+
+
+def _pack(values: List[int]) -> bytes:
+    return _LENGTH.pack(len(values)) + struct.pack(f'<{len(values)}i', *values)
+
+
+def save_snapshot(logic, path: str) -> None:
+    """Write the statistics of logic (computed now if needed) to path."""
+    recency = logic.recency
+    sums = logic.sum_stats
+    sections = {
+        # Counters keep their insertion order so most_common() ties match a fresh analysis
+        'number_freq': [x for item in logic.number_freq.items() for x in item],
+        'hot': list(logic.hot_numbers),
+        'cold': list(logic.cold_numbers),
+        'pair_freq': [x for (a, b), f in logic.pair_freq.items() for x in (a, b, f)],
+        'sums': [sums['min'], sums['max'], logic._stats['sum_total']],
+        'last_seen': [recency.size] + recency.last_seen,
+        'gaps': [x for n, hist in enumerate(recency.gap_hist) for gap, c in hist.items() for x in (n, gap, c)],
+    }
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, len(logic.past_winnings), draws_digest(logic.past_winnings))
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(header + b''.join(_pack(sections[name]) for name in _SECTIONS))
+    os.replace(tmp, path)
+
+
+def _read_sections(payload: bytes) -> Dict[str, List[int]]:
+    sections = {}
+    offset = _HEADER.size
+    for name in _SECTIONS:
+        (count,) = _LENGTH.unpack_from(payload, offset)
+        offset += _LENGTH.size
+        sections[name] = list(struct.unpack_from(f'<{count}i', payload, offset))
+        offset += 4 * count
+    return sections
+
+
+def load_snapshot(logic, path: str) -> bool:
+    """Install the statistics stored at path into logic if they were built from its current draws.
+
+    Returns False (leaving logic untouched) when the file is missing,
+    unreadable or belongs to a different history.
+    """
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            payload = f.read()
+        magic, fmt, count, digest = _HEADER.unpack_from(payload)
+        if magic != SNAPSHOT_MAGIC or fmt != SNAPSHOT_FORMAT:
+            return False
+        draws = logic.past_winnings
+        if count != len(draws) or digest != draws_digest(draws):
+            return False
+        sections = _read_sections(payload)
+    except (OSError, struct.error, ValueError) as e:
+        logger.warning(f"분석 스냅샷을 읽을 수 없습니다: {e}")
+        return False
+
+    number_freq = sections['number_freq']
+    pairs = sections['pair_freq']
+    pair_freq = Counter({(pairs[i], pairs[i + 1]): pairs[i + 2] for i in range(0, len(pairs), 3)})
+    pair_matrix = None
+    if logic._uses_numpy():
+        from L_lotto_logic import np
+        pair_matrix = np.zeros((logic.MAX_NUM, logic.MAX_NUM), dtype=np.int32)
+        for (a, b), f in pair_freq.items():
+            pair_matrix[a - 1, b - 1] = pair_matrix[b - 1, a - 1] = f
+
+    recency = RecencyIndex()
+    last_seen = sections['last_seen']
+    recency.size = last_seen[0]
+    recency.last_seen = last_seen[1:]
+    gaps = sections['gaps']
+    for i in range(0, len(gaps), 3):
+        recency.gap_hist[gaps[i]][gaps[i + 1]] = gaps[i + 2]
+
+    sum_min, sum_max, sum_total = sections['sums']
+    stats = logic._stats
+    stats['number_freq'] = Counter({number_freq[i]: number_freq[i + 1] for i in range(0, len(number_freq), 2)})
+    stats['hot_numbers'] = sections['hot']
+    stats['cold_numbers'] = sections['cold']
+    logic._set_pairs(pair_freq, pair_matrix)
+    stats['recency'] = recency
+    stats['sum_total'] = sum_total
+    stats['sum_stats'] = {'min': sum_min, 'max': sum_max, 'avg': sum_total / len(draws) if draws else 0}
+    for group in ('numbers', 'hot_cold', 'pairs', 'recency', 'sums'):
+        logic._stats_version[group] = logic.data_version
+    return True
+
+
+def write_snapshot(data: List[Dict], data_file: str, logic=None) -> bool:
+    """Rebuild the sidecar of data_file from its rows (as saved, in file order); never raises.
+
+    logic is the app's live LottoLogic, if any. When its history is the
+    start of the saved rows, the new rows are added to it (add_draws only
+    analyzes those) and its statistics are written; otherwise the rows are
+    analyzed from scratch in a fresh LottoLogic.
+    """
+    try:
+        from L_lotto_history import DrawHistory
+        from L_lotto_logic import LottoLogic
+        history = DrawHistory.from_rows(data)
+        if logic is not None and logic.history is not None and history.startswith(logic.history):
+            logic.add_draws(list(history.rows(len(logic.past_winnings))))
+        else:
+            logic = LottoLogic(history)
+        save_snapshot(logic, snapshot_path(data_file))
+        logger.info(f"분석 스냅샷 갱신 완료: {snapshot_path(data_file)}")
+        return True
+    except Exception as e:
+        logger.error(f"분석 스냅샷 저장 실패: {e}")
+        return False
@@ -0,0 +1,231 @@
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Union
+
+from L_lotto_constraint import constraint_index_bounds, constraint_predicate
+from L_lotto_mask import Ticket, numbers_to_mask, mask_to_numbers, masks_to_numbers
+from L_lotto_weighted import WeightedSampler
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it weighted supports are only counted, not walked
+    np = None
+
+logger = logging.getLogger(__name__)
+
+NUM_COMBINATIONS = 8145060  # C(45, 6)
+DUPLICATE_WINDOW = 32       # 중복률 판정 단위 (시도 횟수)
+MAX_DUPLICATE_RATE = 0.5
+MAX_DUPLICATE_RUN = 1024    # 연속 중복이 이만큼 나오면 생성기의 지지집합이 소진된 것으로 판단
+PERMUTE_LIMIT = 1 << 20     # 이 크기 이하의 지지집합은 순위를 통째로 섞어 순회
+ENUMERATE_LIMIT = 1 << 16   # 이 크기 이하의 가중 지지집합은 전부 나열해 확률 순서로 순회
+
+TicketLike = Union[int, Iterable[int]]  # a Ticket / bitmask or the ticket's numbers
+
+# Generators that sample uniformly from an exact constraint set
+_FIXED_CONSTRAINTS: Dict[str, Dict] = {
+    'generate_balance': {'min_even': 2, 'max_even': 4},
+    'generate_prime': {'min_primes': 2},
+    'generate_consecutive': {'require_consecutive': True},
+}
+
+
+def method_constraints(logic, method_name: str) -> Optional[Dict]:
+    """Constraints of a constrained generator for the current data, or None for any other method."""
+    if method_name in _FIXED_CONSTRAINTS:
+        return dict(_FIXED_CONSTRAINTS[method_name])
+    if method_name == 'generate_sum_range':
+        if not logic.past_winnings:
+            return {'min_sum': 111, 'max_sum': 170}
+        return {'min_sum': logic.sum_stats['min'], 'max_sum': logic.sum_stats['max']}
+    if method_name == 'generate_statistical_optimal' and logic.past_winnings:
+        return {'min_even': 2, 'max_even': 4,
+                'min_sum': logic.sum_stats['min'], 'max_sum': logic.sum_stats['max']}
+    return None
+
+
+def method_sampler(logic, method_name: str) -> Optional[WeightedSampler]:
+    """The WeightedSampler a generator draws from for the current data, or None for any other method."""
+    if method_name == 'generate_pattern' and logic.past_winnings and logic.number_freq:
+        return logic._pattern_sampler()
+    if method_name == 'generate_inverse_pattern' and logic.past_winnings:
+        return logic._inverse_pattern_sampler()
+    if method_name == 'generate_data_driven_mix' and logic.past_winnings:
+        return logic._ensemble_sampler(data_driven_only=True)
+    if method_name == 'generate_all_methods':
+        return logic._ensemble_sampler(data_driven_only=False)
+    return None
+
+
+class Support(NamedTuple):
+    """The finite set of tickets a generator can return."""
+    size: int
+    contains: Callable[[int], bool]
+    # Distinct masks outside a given set, in the order the generator would reach them; None if unavailable
+    walk: Optional[Callable[[Set[int]], Iterator[int]]]
+
+
+def _as_mask(ticket: TicketLike) -> Ticket:
+    return Ticket(ticket) if isinstance(ticket, int) else Ticket.from_numbers(ticket)
+
+
+class UniqueTicketGenerator:
+    """Draws n pairwise-distinct tickets from one LottoLogic generator.
+
+    Tickets are kept as 45-bit masks in a set. The generator is sampled
+    directly while most draws are new; once more than max_duplicate_rate of
+    a DUPLICATE_WINDOW block are repeats, generators with a known finite
+    support (the constrained ones, the covering design and small weighted
+    samplers) switch to walking what is left of it: uniformly in random
+    rank order, or by weighted keys for a WeightedSampler, so the tickets
+    keep the generator's own distribution and never repeat. Any other
+    generator keeps being sampled, and MAX_DUPLICATE_RUN repeats in a row
+    are taken to mean its support is used up. A ValueError is raised when
+    fewer than n distinct tickets exist, up front whenever the support size
+    is known.
+    """
+
+    def __init__(self, logic, max_duplicate_rate: float = MAX_DUPLICATE_RATE) -> None:
+        self.logic = logic
+        self.max_duplicate_rate = max_duplicate_rate
+
+    def generate(self, method_name: str, n: int, exclude_drawn: bool = False,
+                 exclude: Optional[Iterable[TicketLike]] = None) -> List[List[int]]:
+        logic = self.logic
+        name = method_name if method_name.startswith('generate_') else f'generate_{method_name}'
+        method = getattr(logic, name, None)
+        if method is None:
+            raise ValueError(f"Unknown generation method: {method_name}")
+        if n < 0:
+            raise ValueError("n must be non-negative")
+
+        blocked: Set[int] = {_as_mask(t) for t in exclude} if exclude is not None else set()
+        if exclude_drawn:
+            blocked.update(numbers_to_mask(draw) for draw in logic.past_winnings)
+
+        support = self._support(name)
+        if support is not None:
+            available = support.size - sum(1 for mask in blocked if support.contains(mask))
+            if n > available:
+                if blocked:
+                    raise ValueError(f"{name} has only {available} distinct tickets outside the excluded ones")
+                raise ValueError(f"{name} has only {available} distinct tickets")
+        if n > NUM_COMBINATIONS - len(blocked):
+            raise ValueError(f"Only {NUM_COMBINATIONS - len(blocked)} distinct tickets are not excluded")
+        walk = support.walk if support is not None else None
+
+        seen: Set[int] = set(blocked)
+        tickets: List[int] = []
+        attempts = duplicates = run = 0
+        while len(tickets) < n:
+            mask = numbers_to_mask(method())
+            attempts += 1
+            if mask in seen:
+                duplicates += 1
+                run += 1
+                logic.cost_stats['unique_duplicates'] += 1
+                if walk is None and run == MAX_DUPLICATE_RUN:
+                    raise ValueError(f"{name} produced only {len(tickets)} distinct tickets "
+                                     f"({MAX_DUPLICATE_RUN} repeats in a row)")
+            else:
+                run = 0
+                seen.add(mask)
+                tickets.append(mask)
+            if attempts == DUPLICATE_WINDOW:
+                if walk is not None and duplicates > self.max_duplicate_rate * attempts:
+                    break
+                attempts = duplicates = 0
+
+        if len(tickets) < n:
+            logger.info(f"{name}: 중복률이 높아 나머지 {n - len(tickets)}개는 생성 가능한 조합을 순회해 채웁니다")
+            logic.cost_stats['support_walks'] += 1
+            for mask in walk(seen):
+                seen.add(mask)
+                tickets.append(mask)
+                if len(tickets) == n:
+                    break
+            if len(tickets) < n:
+                raise ValueError(f"{name} has only {len(tickets)} distinct tickets outside the excluded ones")
+        return [mask_to_numbers(m) for m in tickets]
+
+    def _support(self, name: str) -> Optional[Support]:
+        logic = self.logic
+        constraints = method_constraints(logic, name)
+        if constraints is not None:
+            return self._constraint_support(constraints)
+        if name == 'generate_covering' and np is not None and len(logic.number_freq) >= logic.COVERING_POOL_SIZE:
+            return self._listed_support([numbers_to_mask(t) for t in logic._covering_plan()])
+        sampler = method_sampler(logic, name)
+        if sampler is not None:
+            return self._weighted_support(sampler)
+        return None
+
+    def _constraint_support(self, constraints: Dict) -> Support:
+        """The exact constraint set, unranked from the combination index when attached."""
+        logic = self.logic
+        if logic.combination_index is not None:
+            index = logic.combination_index
+            ranks = index.select(**constraint_index_bounds(**constraints))
+            total, unrank = len(ranks), lambda i: numbers_to_mask(index.combination(int(ranks[i])))
+        else:
+            sampler = logic._constraint_sampler(**constraints)
+            total, unrank = sampler.count(), sampler.unrank_mask
+
+        def walk(seen: Set[int]) -> Iterator[int]:
+            # Visit distinct ranks in uniformly random order: a full shuffle for small
+            # supports, rejection on the ranks themselves otherwise (tickets already
+            # taken occupy a tiny fraction of a large support).
+            if total <= PERMUTE_LIMIT:
+                order = list(range(total))
+                logic.rng.shuffle(order)
+                ranks = iter(order)
+            else:
+                ranks = self._random_ranks(total)
+            for rank in ranks:
+                mask = unrank(rank)
+                if mask not in seen:
+                    yield mask
+
+        return Support(total, constraint_predicate(**constraints), walk)
+
+    def _listed_support(self, masks: List[int]) -> Support:
+        """A uniform choice from a fixed list of tickets (generate_covering)."""
+        listed = set(masks)
+
+        def walk(seen: Set[int]) -> Iterator[int]:
+            rest = sorted(listed - seen)
+            self.logic.rng.shuffle(rest)
+            return iter(rest)
+
+        return Support(len(listed), listed.__contains__, walk)
+
+    def _weighted_support(self, sampler: WeightedSampler) -> Support:
+        """The 6-subsets a WeightedSampler can draw; walked only when small enough to enumerate."""
+        total = sampler.support_size()
+        positive = numbers_to_mask(sampler.numbers)
+        if sampler._fixed_mask is not None:
+            contains = lambda mask: mask & positive == positive
+        else:
+            contains = lambda mask: mask & ~positive == 0
+        if np is None or total > ENUMERATE_LIMIT:
+            return Support(total, contains, None)
+
+        def walk(seen: Set[int]) -> Iterator[int]:
+            # Gumbel-top-k on the log-probabilities: the order of successive draws
+            # without replacement, i.e. what rejecting repeats would produce.
+            rest = [mask for mask in sampler.support_masks() if mask not in seen]
+            if not rest:
+                return iter(())
+            log_p = sampler.log_likelihood(masks_to_numbers(rest))
+            keys = log_p - np.log(-np.log1p(-self.logic.np_rng.random(len(rest))))
+            return (rest[i] for i in np.argsort(-keys, kind='stable'))
+
+        return Support(total, contains, walk)
+
+    def _random_ranks(self, total: int) -> Iterator[int]:
+        rng = self.logic.rng
+        used: Set[int] = set()
+        while len(used) < total:
+            rank = rng.randrange(total)
+            if rank not in used:
+                used.add(rank)
+                yield rank
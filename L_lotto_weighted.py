@@ -0,0 +1,106 @@
+import heapq
+import itertools
+import math
+import random
+from typing import Dict, List
+
+from L_lotto_mask import MAX_NUM, MIN_NUM, NUM_BALLS, mask_to_numbers, numbers_to_mask
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only sample_batch and log_likelihood need it
+    np = None
+
+
+# log_likelihood DP over the subsets of a ticket's 6 positions (as bitsets): (subset, subset without i, i)
+_SUBSET_STEPS = [(a, a & ~(1 << i), i) for a in range(1, 1 << NUM_BALLS) for i in range(NUM_BALLS) if a >> i & 1]
+if np is not None:
+    _SUBSETS = ((np.arange(1 << NUM_BALLS)[:, None] >> np.arange(NUM_BALLS)) & 1).astype(np.float64)
+
+
+class WeightedSampler:
+    """Weighted sampling of 6 distinct numbers without replacement (Efraimidis-Spirakis keys).
+
+    Each number with weight w gets the key log(u) / w for a uniform u; the 6
+    largest keys are a sample with the same distribution as drawing numbers
+    proportionally to weight and discarding repeats, but in a single pass with
+    no retries. Numbers with zero weight are only used, uniformly, when fewer
+    than 6 numbers have positive weight, so a ticket always has 6 numbers.
+    """
+
+    def __init__(self, weights: Dict[int, float]) -> None:
+        self.numbers = [n for n in range(MIN_NUM, MAX_NUM + 1) if weights.get(n, 0) > 0]
+        self._inv_weights = [1.0 / weights[n] for n in self.numbers]
+        self._fixed_mask = numbers_to_mask(self.numbers) if len(self.numbers) < NUM_BALLS else None
+        self._weights_array = None
+        if np is not None:
+            self._weights_array = np.zeros(MAX_NUM)
+            self._weights_array[np.asarray(self.numbers, dtype=np.intp) - MIN_NUM] = [weights[n] for n in self.numbers]
+
+    def sample_mask(self, rng=random) -> int:
+        if self._fixed_mask is not None:
+            mask = self._fixed_mask
+            rest = [n for n in range(MIN_NUM, MAX_NUM + 1) if n not in self.numbers]
+            return mask | numbers_to_mask(rng.sample(rest, NUM_BALLS - len(self.numbers)))
+        keys = [(math.log(1.0 - rng.random()) * inv, n) for n, inv in zip(self.numbers, self._inv_weights)]
+        return numbers_to_mask(n for _, n in heapq.nlargest(NUM_BALLS, keys))
+
+    def sample(self, rng=random) -> List[int]:
+        return mask_to_numbers(self.sample_mask(rng))
+
+    def support_size(self) -> int:
+        """Number of distinct tickets sample() can return."""
+        k = len(self.numbers)
+        if self._fixed_mask is not None:
+            return math.comb(MAX_NUM - k, NUM_BALLS - k)
+        return math.comb(k, NUM_BALLS)
+
+    def support_masks(self) -> List[int]:
+        """Every ticket sample() can return, as bitmasks (support_size() of them)."""
+        if self._fixed_mask is not None:
+            rest = [n for n in range(MIN_NUM, MAX_NUM + 1) if n not in self.numbers]
+            return [self._fixed_mask | numbers_to_mask(c)
+                    for c in itertools.combinations(rest, NUM_BALLS - len(self.numbers))]
+        return [numbers_to_mask(c) for c in itertools.combinations(self.numbers, NUM_BALLS)]
+
+    def sample_batch(self, n: int, rng) -> 'np.ndarray':
+        """n independent tickets as an (n, 6) uint8 array; rng is a numpy Generator."""
+        if np is None:
+            raise ImportError("sample_batch requires numpy to be installed")
+        if self._fixed_mask is not None:
+            positive = self._weights_array > 0
+            keys = rng.random((n, MAX_NUM)) - positive
+        else:
+            with np.errstate(divide='ignore'):
+                keys = -np.log1p(-rng.random((n, MAX_NUM))) / self._weights_array
+        idx = np.argpartition(keys, NUM_BALLS - 1, axis=1)[:, :NUM_BALLS]
+        idx.sort(axis=1)
+        return (idx + MIN_NUM).astype(np.uint8)
+
+    def log_likelihood(self, numbers: 'np.ndarray') -> 'np.ndarray':
+        """Natural log of the probability that sample() returns each row of an (n, 6) number array.
+
+        sample() has the distribution of drawing numbers one at a time with
+        probability proportional to weight among those left, so the
+        probability of a set is summed over the orders it can be drawn in.
+        A DP over its 64 subsets does that with 192 array steps and only
+        positive terms, so it stays accurate for very uneven weights.
+        """
+        if np is None:
+            raise ImportError("log_likelihood requires numpy to be installed")
+        numbers = np.asarray(numbers, dtype=np.intp)
+        w = self._weights_array[numbers - MIN_NUM]
+        if self._fixed_mask is not None:
+            # Every positive number is taken and the rest is uniform over the zero-weight ones
+            k = len(self.numbers)
+            inside = (w > 0).sum(axis=1) == k
+            return np.where(inside, -math.log(math.comb(MAX_NUM - k, NUM_BALLS - k)), -np.inf)
+        # left[a]: weight not yet drawn after the subset a; p[a]: P(the first |a| draws are a) (subset-major rows)
+        w = np.ascontiguousarray(w.T)
+        left = self._weights_array.sum() - _SUBSETS @ w
+        p = np.zeros_like(left)
+        p[0] = 1.0
+        for a, prev, i in _SUBSET_STEPS:
+            p[a] += p[prev] * w[i] / left[prev]
+        with np.errstate(divide='ignore'):
+            return np.log(p[-1])
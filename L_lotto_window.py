@@ -0,0 +1,86 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from L_lotto_mask import MAX_NUM, NUM_BALLS
+
+# 번호쌍 (i < j)의 열 위치; 인덱스 = 번호 - 1
+PAIR_I, PAIR_J = np.triu_indices(MAX_NUM, 1)
+_PAIR_COLUMN = np.full((MAX_NUM, MAX_NUM), -1, dtype=np.intp)
+_PAIR_COLUMN[PAIR_I, PAIR_J] = np.arange(len(PAIR_I))
+# 한 회차 안의 15개 번호쌍 (정렬된 6개 번호의 위치)
+_BALL_I, _BALL_J = np.triu_indices(NUM_BALLS, 1)
+
+
+class DrawPrefixSums:
+    """Per-number and per-pair prefix sums over the draw index.
+
+    Row t of each table holds the counts over draws[:t], so any window of
+    draws [start, stop) costs one subtraction of two rows: O(45) for
+    number counts and O(45^2) for pair counts, whatever the window length.
+    Rows live in arrays with spare capacity so append() is amortized O(45^2).
+    The pair table (990 columns) is only built on the first pair query.
+    """
+
+    def __init__(self, draws: Sequence[Sequence[int]] = ()) -> None:
+        draws = np.asarray(draws, dtype=np.intp).reshape(-1, NUM_BALLS)
+        n = len(draws)
+        capacity = max(16, 2 * n)
+        # Sorted number indices (number - 1) of every draw, kept to build the pair table later
+        self._draws = np.zeros((capacity + 1, NUM_BALLS), dtype=np.uint8)
+        self._draws[:n] = np.sort(draws - 1, axis=1)
+        self._numbers = np.zeros((capacity + 1, MAX_NUM), dtype=np.int32)
+        self._pairs = None
+        self._size = n
+        if n:
+            incidence = np.zeros((n, MAX_NUM), dtype=np.int32)
+            incidence[np.arange(n)[:, None], draws - 1] = 1
+            np.cumsum(incidence, axis=0, out=self._numbers[1:n + 1])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _pair_table(self) -> np.ndarray:
+        if self._pairs is None:
+            n = self._size
+            lo = self._draws[:n].astype(np.intp)
+            self._pairs = np.zeros((len(self._numbers), len(PAIR_I)), dtype=np.int32)
+            pair_hits = np.zeros((n, len(PAIR_I)), dtype=np.int32)
+            pair_hits[np.arange(n)[:, None], _PAIR_COLUMN[lo[:, _BALL_I], lo[:, _BALL_J]]] = 1
+            np.cumsum(pair_hits, axis=0, out=self._pairs[1:n + 1])
+        return self._pairs
+
+    def append(self, draw: Sequence[int]) -> None:
+        if self._size + 1 >= len(self._numbers):
+            self._draws = np.concatenate([self._draws, np.zeros_like(self._draws)])
+            self._numbers = np.concatenate([self._numbers, np.zeros_like(self._numbers)])
+            if self._pairs is not None:
+                self._pairs = np.concatenate([self._pairs, np.zeros_like(self._pairs)])
+        t = self._size
+        idx = np.sort(np.asarray(draw, dtype=np.intp) - 1)
+        self._draws[t] = idx
+        self._numbers[t + 1] = self._numbers[t]
+        self._numbers[t + 1, idx] += 1
+        if self._pairs is not None:
+            self._pairs[t + 1] = self._pairs[t]
+            self._pairs[t + 1, _PAIR_COLUMN[idx[_BALL_I], idx[_BALL_J]]] += 1
+        self._size += 1
+
+    def _bounds(self, start: Optional[int], stop: Optional[int]) -> Tuple[int, int]:
+        start, stop, _ = slice(start, stop).indices(self._size)
+        return start, max(start, stop)
+
+    def number_counts(self, start: Optional[int] = None, stop: Optional[int] = None) -> np.ndarray:
+        """(45,) appearances of each number (index = number - 1) in draws[start:stop]."""
+        start, stop = self._bounds(start, stop)
+        return self._numbers[stop] - self._numbers[start]
+
+    def pair_counts(self, start: Optional[int] = None, stop: Optional[int] = None) -> np.ndarray:
+        """(45, 45) symmetric co-occurrence counts in draws[start:stop], zero diagonal."""
+        start, stop = self._bounds(start, stop)
+        pairs = self._pair_table()
+        flat = pairs[stop] - pairs[start]
+        out = np.zeros((MAX_NUM, MAX_NUM), dtype=np.int32)
+        out[PAIR_I, PAIR_J] = flat
+        out[PAIR_J, PAIR_I] = flat
+        return out
@@ -8,13 +8,15 @@ from datetime import datetime
 import os
 
 from L_config import SUPABASE_URL, SUPABASE_KEY
+from L_lotto_snapshot import write_snapshot
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class LottoDataManager:
-    def __init__(self, data_file: str = "lotto_data.json"):
+    def __init__(self, data_file: str = "lotto_data.json", logic=None):
         self.data_file = data_file
+        self.logic = logic  # 앱의 LottoLogic (있으면 스냅샷을 새 회차만 분석해 갱신)
         self.csv_file = data_file.replace('.json', '.csv')
         self.supabase_headers = {
             'apikey': SUPABASE_KEY,
@@ -126,6 +128,9 @@ class LottoDataManager:
                     writer.writeheader()
                     writer.writerows(data)
             
+            # 분석 스냅샷 재생성 (앱 시작 시 분석 생략용)
+            write_snapshot(data, self.data_file, self.logic)
+            
             logger.info(f"{len(data)}개 회차 데이터를 {self.data_file}와 {self.csv_file}에 저장")
             return True
             
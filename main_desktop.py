@@ -93,8 +93,9 @@ from kivy.core.text import DEFAULT_FONT
 import logging
 from lotto_dataman import LottoDataManager
 
-from L_lotto_logic import LottoLogic
+from L_lotto_logic import LottoLogic, np
 from L_database_local import init_local_database, load_lotto_data_from_local, LocalDatabaseUpdater
+from L_lotto_snapshot import snapshot_path
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -215,12 +216,28 @@ class LottoGeneratorLayout(BoxLayout):
     def load_data_from_local_database(self):
         if not self.local_db_connected or hasattr(self, '_data_loaded'): 
             return
-        self.past_winnings, msg = load_lotto_data_from_local()
-        self.past_winnings = self.past_winnings or []
+        self.past_winnings, msg = load_lotto_data_from_local()  # DrawHistory (열 단위 저장)
         self.logic = LottoLogic(self.past_winnings)
-        self.update_method_spinner()
+        self.logic.load_snapshot(snapshot_path(self.local_db.data_file))  # 저장된 분석 결과가 있으면 재분석 생략
+        self.populate_methods()  # 새 LottoLogic 인스턴스에 생성 메서드 다시 연결
         self._data_loaded = True
 
+    def append_new_draws(self):
+        """업데이트 후 새 회차만 LottoLogic에 추가 (전체 재분석 없이 증분 갱신)"""
+        history, msg = load_lotto_data_from_local()
+        if not history:
+            return
+        known = len(self.logic.past_winnings)
+        if known and self.logic.history is not None and history.startswith(self.logic.history):
+            self.logic.add_draws(list(history.rows(known)))  # 회차/보너스/추첨일까지 함께 추가
+        else:
+            self.logic = LottoLogic(history)
+            self.logic.load_snapshot(snapshot_path(self.local_db.data_file))
+            self.populate_methods()
+        self.past_winnings = self.logic.past_winnings
+        self.update_method_spinner()
+        logger.info(f"분석 데이터 갱신: {len(self.past_winnings) - known}개 회차 추가")
+
     def update_default_round_values(self):
         """최신 회차를 기준으로 조회 기본값 설정 (최신-4회 ~ 최신회)"""
         if not self.local_db_connected:
@@ -262,19 +279,24 @@ class LottoGeneratorLayout(BoxLayout):
             {'name': "8. 연속 번호 포함", 'method': self.logic.generate_consecutive, 'data_dependent': False},
             {'name': "9. 핫/콜드 번호 조합", 'method': self.logic.generate_hot_cold_mix, 'data_dependent': True},
             {'name': "10. 자주 나온 번호 쌍 기반", 'method': self.logic.generate_frequent_pairs, 'data_dependent': True},
-            {'name': "11. 끝자리 패턴 분석", 'method': self.logic.generate_ending_pattern, 'data_dependent': True},
-            {'name': "12. 통계적 최적화", 'method': self.logic.generate_statistical_optimal, 'data_dependent': True},
-            {'name': "13. 이월수/미출현수 조합", 'method': self.logic.generate_carryover_unseen_mix, 'data_dependent': True},
-            {'name': "14. 동일 끝수 조합", 'method': self.logic.generate_same_ending_mix, 'data_dependent': True},
-            {'name': "15. 궁합수 분석(상극 제외)", 'method': self.logic.generate_compatibility_mix, 'data_dependent': True},
-            {'name': "16. 데이터 기반 조합", 'method': self.logic.generate_data_driven_mix, 'data_dependent': True},
-            {'name': "17. 모든 방법 조합", 'method': self.logic.generate_all_methods, 'data_dependent': True}
+            {'name': "11. 자주 나온 번호 3개 조합 기반", 'method': self.logic.generate_frequent_triples, 'data_dependent': True},
+            {'name': "12. 끝자리 패턴 분석", 'method': self.logic.generate_ending_pattern, 'data_dependent': True},
+            {'name': "13. 통계적 최적화", 'method': self.logic.generate_statistical_optimal, 'data_dependent': True},
+            {'name': "14. 이월수/미출현수 조합", 'method': self.logic.generate_carryover_unseen_mix, 'data_dependent': True},
+            {'name': "15. 동일 끝수 조합", 'method': self.logic.generate_same_ending_mix, 'data_dependent': True},
+            {'name': "16. 궁합수 분석(상극 제외)", 'method': self.logic.generate_compatibility_mix, 'data_dependent': True},
+            {'name': "17. 커버링 디자인 (상위 12개 번호)", 'method': self.logic.generate_covering, 'data_dependent': True, 'requires_numpy': True},
+            {'name': "18. 데이터 기반 조합", 'method': self.logic.generate_data_driven_mix, 'data_dependent': True},
+            {'name': "19. 모든 방법 조합", 'method': self.logic.generate_all_methods, 'data_dependent': True}
         ]
         self.update_method_spinner()
 
     def update_method_spinner(self):
         spinner = self.ids.method_spinner
-        spinner.values = [m['name'] for m in self.method_definitions if not m['data_dependent'] or self.past_winnings]
+        # numpy가 없는 환경(모바일 빌드)에서는 numpy 전용 방법을 숨김
+        spinner.values = [m['name'] for m in self.method_definitions
+                          if (not m['data_dependent'] or self.past_winnings)
+                          and (np is not None or not m.get('requires_numpy'))]
         if spinner.text not in spinner.values: spinner.text = "1. 기본 랜덤"
 
     def generate_numbers(self):
@@ -286,11 +308,16 @@ class LottoGeneratorLayout(BoxLayout):
         try: num_games = int(self.ids.games_input.text)
         except ValueError: num_games = 5
 
-        self.generated_numbers_cache = []
-        for _ in range(num_games):
-            try: numbers = selected_method['method']()
-            except Exception as e: numbers = self.logic.generate_random()
-            self.generated_numbers_cache.append(numbers)
+        # 한 번에 생성하는 게임끼리는 조합이 겹치지 않도록 생성
+        try:
+            self.generated_numbers_cache = self.logic.generate_unique(selected_method['method'].__name__, num_games)
+        except ValueError as e:
+            # 서로 다른 조합이 부족하면 다른 방법으로 대신 채우지 않고 알림
+            popup = Popup(title='생성 오류', content=Label(text=f'{num_games}게임을 만들 수 없습니다: {e}'), size_hint=(0.8, 0.4))
+            popup.open()
+            return
+        except Exception as e:
+            self.generated_numbers_cache = self.logic.generate_unique('generate_random', num_games)
 
         if not self.generated_numbers_cache: return
 
@@ -394,7 +421,7 @@ class LottoGeneratorLayout(BoxLayout):
     def _check_updates_async(self, dt):
         """비동기로 업데이트 확인"""
         try:
-            updater = LocalDatabaseUpdater(database_instance=self.local_db)
+            updater = LocalDatabaseUpdater(database_instance=self.local_db, logic=self.logic)
             needs_update, message = updater.start()
             
             if needs_update:
@@ -436,9 +463,8 @@ class LottoGeneratorLayout(BoxLayout):
             
             if success:
                 self.ids.db_status_label.text = f"업데이트 완료: {message}"
-                # 데이터 다시 로드
-                self._data_loaded = False
-                self.load_data_from_local_database()
+                # 새 회차만 증분 반영
+                self.append_new_draws()
                 self.update_default_round_values()
                 logger.info(f"로컬 파일 업데이트 성공: {message}")
             else:
@@ -452,14 +478,13 @@ class LottoGeneratorLayout(BoxLayout):
     def _perform_update_async(self, dt):
         """비동기로 업데이트 수행"""
         try:
-            manager = LottoDataManager()
+            manager = LottoDataManager(logic=self.logic)
             success, message = manager.update_data_file()
             
             if success:
                 self.ids.db_status_label.text = f"업데이트 완료: {message}"
-                # 데이터 다시 로드
-                self._data_loaded = False
-                self.load_data_from_local_database()
+                # 새 회차만 증분 반영
+                self.append_new_draws()
                 self.update_default_round_values()
             else:
                 self.ids.db_status_label.text = f"업데이트 실패: {message}"
@@ -0,0 +1,15 @@
+import os
+import random
+import sys
+
+import pytest
+
+# The modules live flat in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def draws():
+    """300 reproducible 6/45 draws, sorted like the bundled data."""
+    rng = random.Random(1234)
+    return [sorted(rng.sample(range(1, 46), 6)) for _ in range(300)]
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="the backtest requires numpy")
+
+METHODS = ['generate_pattern', 'generate_random']
+
+
+def brute_tier(ticket, draw, bonus):
+    hits = len(set(ticket) & set(draw))
+    if hits == 5:
+        return 2 if bonus and bonus in ticket else 3
+    return {6: 1, 4: 4, 3: 5}.get(hits, 0)
+
+
+@pytest.fixture
+def bonuses(draws):
+    rng = random.Random(31)
+    return [rng.choice([n for n in range(1, 46) if n not in d]) for d in draws]
+
+
+def test_backtest_matches_a_manual_replay(draws, bonuses):
+    from L_lotto_backtest import backtest
+    draws, bonuses = draws[:120], bonuses[:120]
+    start, k = 100, 40
+    result = backtest(draws, bonuses, k=k, methods=METHODS, start=start, seed=9)
+
+    # Same seed and order: random tickets for every round up front, pattern tickets round by round
+    logic = LottoLogic([list(d) for d in draws[:start]], seed=9)
+    random_tickets = logic.generate_batch('generate_random', (len(draws) - start) * k).reshape(-1, k, 6)
+    for t, r in enumerate(range(start, len(draws))):
+        pattern_tickets = logic.generate_batch('generate_pattern', k)
+        for m, tickets in enumerate((pattern_tickets, random_tickets[t])):
+            expected = np.bincount([brute_tier(list(x), draws[r], bonuses[r]) for x in tickets], minlength=6)
+            assert (result.hits[m, t] == expected).all()
+        logic.add_draw(draws[r], bonuses[r])
+    assert result.rounds.tolist() == list(range(start + 1, len(draws) + 1))
+    assert result.summary()['generate_random']['none'] == result.method_hits('generate_random')[:, 0].sum()
+    assert (result.cumulative('generate_pattern')[-1] == result.hits[0].sum(axis=0)).all()
+
+
+def test_tickets_never_see_the_round_they_are_scored_on(draws, bonuses):
+    from L_lotto_backtest import backtest
+    start, k = 100, 20
+    changed = [list(d) for d in draws[:130]]
+    changed[115:] = [sorted(random.Random(r).sample(range(1, 46), 6)) for r in range(115, 130)]
+    a = backtest(draws[:130], bonuses[:130], k=k, methods=['generate_pattern'], start=start, seed=4)
+    b = backtest(changed, bonuses[:130], k=k, methods=['generate_pattern'], start=start, seed=4)
+    # Rounds before the first changed draw are scored identically
+    assert (a.hits[:, :115 - start] == b.hits[:, :115 - start]).all()
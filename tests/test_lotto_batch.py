@@ -0,0 +1,28 @@
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="generate_batch requires numpy")
+
+
+def test_constrained_batches_do_not_depend_on_the_batch_size():
+    from L_lotto_constraint import ConstraintSampler
+    sampler = ConstraintSampler(min_even=2, max_even=4, min_sum=100, max_sum=175)
+    small = sampler.sample_batch(10, np.random.default_rng(4))
+    large = sampler.sample_batch(500, np.random.default_rng(4))
+    assert (small == large[:10]).all()
+
+
+def test_compatibility_batch_matches_the_scalar_generator(draws):
+    # A short history leaves many incompatible pairs, so dead ends (and restarts) are common
+    logic = LottoLogic(draws[:60], seed=8)
+    n = 20000
+    scalar = np.array([logic.generate_compatibility_mix() for _ in range(n)])
+    batch = logic.generate_batch('generate_compatibility_mix', n)
+    assert logic.cost_stats['restarts'] > 0
+    incompatible = logic._compatibility_plan().matrix
+    rows = batch.astype(np.intp) - 1
+    assert not incompatible[rows[:, :, None], rows[:, None, :]].any()
+    scalar_freq = np.bincount(scalar.ravel(), minlength=46) / n
+    batch_freq = np.bincount(batch.ravel(), minlength=46) / n
+    assert np.abs(scalar_freq - batch_freq).max() < 0.02
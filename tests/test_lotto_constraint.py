@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from L_lotto_constraint import ConstraintSampler, constraint_index_bounds
+from L_lotto_index import CombinationIndex, compute_features
+from L_lotto_mask import mask_to_numbers
+
+CONSTRAINTS = [
+    {},
+    {'min_even': 2, 'max_even': 4},                                  # generate_balance
+    {'min_primes': 2},                                               # generate_prime
+    {'require_consecutive': True},                                   # generate_consecutive
+    {'min_sum': 111, 'max_sum': 170},                                # generate_sum_range
+    {'min_even': 2, 'max_even': 4, 'min_sum': 100, 'max_sum': 175},  # generate_statistical_optimal
+    {'min_even': 1, 'max_even': 3, 'min_primes': 3, 'require_consecutive': True, 'max_sum': 120},
+    {'min_sum': 21, 'max_sum': 21},
+    {'min_even': 6},
+    {'min_sum': 300},
+]
+
+
+@pytest.fixture(scope='module')
+def index(tmp_path_factory):
+    # Enumerates all 8,145,060 combinations with their features (a few seconds)
+    return CombinationIndex.build(str(tmp_path_factory.mktemp('index') / 'combo_index.npy'))
+
+
+@pytest.mark.parametrize('constraints', CONSTRAINTS)
+def test_count_matches_enumeration(index, constraints):
+    expected = index.count(**constraint_index_bounds(**constraints))
+    assert ConstraintSampler(**constraints).count() == expected
+
+
+@pytest.mark.parametrize('constraints', CONSTRAINTS)
+def test_unrank_matches_index_order(index, constraints):
+    # Both order the valid combinations lexicographically, so rank r is the same ticket
+    sampler = ConstraintSampler(**constraints)
+    ranks = index.select(**constraint_index_bounds(**constraints))
+    total = len(ranks)
+    rng = random.Random(7)
+    probes = {0, total - 1, total // 2} | {rng.randrange(total) for _ in range(200)} if total else set()
+    for r in sorted(probes):
+        assert mask_to_numbers(sampler.unrank_mask(r)) == index.combination(int(ranks[r]))
+
+
+@pytest.mark.parametrize('constraints', CONSTRAINTS[:-1])
+def test_samples_satisfy_constraints(index, constraints):
+    sampler = ConstraintSampler(**constraints)
+    tickets = np.vstack([sampler.sample_batch(2000, np.random.default_rng(1)),
+                         sampler.sample_batch(10, np.random.default_rng(2))])
+    features = compute_features(tickets)
+    assert (np.diff(tickets.astype(int), axis=1) > 0).all()
+    assert (features['even'] >= constraints.get('min_even', 0)).all()
+    assert (features['even'] <= constraints.get('max_even', 6)).all()
+    assert (features['sum'] >= constraints.get('min_sum', 0)).all()
+    assert (features['sum'] <= constraints.get('max_sum', 255)).all()
+    assert (features['prime'] >= constraints.get('min_primes', 0)).all()
+    if constraints.get('require_consecutive'):
+        assert (features['consecutive'] >= 1).all()
+
+
+def test_empty_constraint_set_raises():
+    sampler = ConstraintSampler(min_sum=300)
+    assert sampler.count() == 0
+    with pytest.raises(ValueError):
+        sampler.sample()
+
+
+@pytest.mark.parametrize('constraints', CONSTRAINTS)
+def test_predicate_matches_features(constraints):
+    from L_lotto_constraint import constraint_predicate
+    from L_lotto_mask import numbers_to_mask
+    satisfies = constraint_predicate(**constraints)
+    rng = np.random.default_rng(3)
+    tickets = np.sort(np.argsort(rng.random((5000, 45)), axis=1)[:, :6] + 1, axis=1)
+    features = compute_features(tickets)
+    expected = ((features['even'] >= constraints.get('min_even', 0))
+                & (features['even'] <= constraints.get('max_even', 6))
+                & (features['sum'] >= constraints.get('min_sum', 0))
+                & (features['sum'] <= constraints.get('max_sum', 255))
+                & (features['prime'] >= constraints.get('min_primes', 0))
+                & ((features['consecutive'] > 0) | (not constraints.get('require_consecutive'))))
+    assert [satisfies(numbers_to_mask(t.tolist())) for t in tickets] == expected.tolist()
@@ -0,0 +1,45 @@
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from L_lotto_cooccur import CooccurrenceIndex, subset_key
+from L_lotto_logic import LottoLogic
+
+
+def brute_counts(draws, order):
+    return Counter(subset for draw in draws for subset in combinations(sorted(draw), order))
+
+
+def brute_top(counts, k):
+    # Most frequent first, ties in subset_key order like CooccurrenceIndex
+    return sorted(counts.items(), key=lambda item: (-item[1], subset_key(item[0])))[:k]
+
+
+@pytest.mark.parametrize('order', [3, 4])
+def test_counts_and_top_k_match_brute_force(draws, order):
+    counts = brute_counts(draws, order)
+    index = CooccurrenceIndex(order, draws)
+    assert len(index) == len(counts)
+    assert all(index.count(subset) == c for subset, c in counts.items())
+    for k in (1, 10, 57, len(counts) + 5):
+        assert index.top(k) == brute_top(counts, k)
+    assert index.at_least(2) == [(s, c) for s, c in brute_top(counts, len(counts)) if c >= 2]
+
+
+@pytest.mark.parametrize('order', [3, 4])
+def test_incremental_updates_match_a_rebuild(draws, order):
+    index = CooccurrenceIndex(order, draws[:150])
+    for draw in draws[150:]:
+        index.add(draw)
+    rebuilt = CooccurrenceIndex(order, draws)
+    assert index.counts == rebuilt.counts
+    assert index.max_count == rebuilt.max_count
+    assert index.top(25) == rebuilt.top(25) == brute_top(brute_counts(draws, order), 25)
+
+
+def test_logic_keeps_triples_current(draws):
+    logic = LottoLogic([d[:] for d in draws[:150]])
+    logic.triple_freq  # built now, then updated by add_draws
+    logic.add_draws(draws[150:])
+    assert logic.triple_freq.top(10) == brute_top(brute_counts(draws, 3), 10)
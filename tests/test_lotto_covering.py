@@ -0,0 +1,43 @@
+from itertools import combinations
+
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="covering designs require numpy")
+
+
+def assert_covers(design, pool, match, drawn):
+    assert all(len(t) == 6 == len(set(t)) and set(t) <= set(pool) for t in design)
+    assert len({tuple(sorted(t)) for t in design}) == len(design)
+    for target in combinations(pool, drawn):
+        assert any(len(set(target) & set(t)) >= match for t in design), target
+
+
+@pytest.mark.parametrize('size, match, drawn', [(8, 3, 4), (10, 3, 4), (12, 3, 4), (10, 2, 3), (9, 4, 5), (7, 6, 6)])
+def test_every_target_is_covered(size, match, drawn):
+    from L_lotto_covering import covering_design
+    pool = [3 * i + 1 for i in range(size)]
+    design = covering_design(pool, match, drawn)
+    assert_covers(design, pool, match, drawn)
+    assert covering_design(pool, match, drawn) == design  # seeded from the arguments
+
+
+def test_full_match_needs_every_ticket():
+    from L_lotto_covering import covering_design
+    pool = list(range(1, 9))
+    assert len(covering_design(pool, 6, 6)) == 28  # C(8, 6): no ticket can cover another's target
+
+
+def test_logic_design_covers_its_pool(draws):
+    logic = LottoLogic(draws)
+    pool = [n for n, _ in logic.number_freq.most_common(logic.COVERING_POOL_SIZE)]
+    assert_covers(logic._covering_plan(), pool, logic.COVERING_MATCH, logic.COVERING_DRAWN)
+
+
+def test_invalid_arguments():
+    from L_lotto_covering import covering_design
+    with pytest.raises(ValueError):
+        covering_design(range(1, 6))
+    with pytest.raises(ValueError):
+        covering_design(range(1, 10), match=4, drawn=3)
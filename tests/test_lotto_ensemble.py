@@ -0,0 +1,32 @@
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+from L_lotto_snapshot import draws_digest
+
+pytestmark = pytest.mark.skipif(np is None, reason="the ensemble tests sample with numpy")
+
+
+@pytest.mark.parametrize('name', ['generate_random', 'generate_hot_cold_mix', 'generate_frequent_pairs',
+                                  'generate_frequent_triples', 'generate_carryover_unseen_mix',
+                                  'generate_covering'])
+def test_exact_marginals_match_sampling(draws, name):
+    from L_lotto_ensemble import EXACT_MARGINALS, estimate_marginals
+    logic = LottoLogic(draws)
+    exact = EXACT_MARGINALS[name](logic)
+    sampled = estimate_marginals(logic, name, 50000, seed=7)
+    assert sum(exact) == pytest.approx(6)
+    assert max(abs(a - b) for a, b in zip(exact, sampled)) < 0.01
+
+
+def test_ensemble_weights_are_reproducible(draws):
+    first, second = LottoLogic(draws, seed=1), LottoLogic(draws, seed=2)
+    for data_driven_only in (True, False):
+        assert (first._ensemble_sampler(data_driven_only)._weights_array
+                == second._ensemble_sampler(data_driven_only)._weights_array).all()
+
+
+def test_data_digest_follows_added_draws(draws):
+    logic = LottoLogic([d[:] for d in draws[:200]])
+    assert logic._data_digest() == draws_digest(draws[:200])
+    logic.add_draws(draws[200:])
+    assert logic._data_digest() == draws_digest(draws)
@@ -0,0 +1,72 @@
+import csv
+from collections import Counter
+
+import pytest
+
+from L_lotto_history import COLUMNS, DrawHistory, DrawRow
+from L_lotto_logic import LottoLogic, np
+from test_lotto_logic import ENGINES, assert_same_statistics
+
+
+@pytest.fixture
+def history(draws):
+    h = DrawHistory()
+    for i, draw in enumerate(draws):
+        h.append(draw, bonus=(i % 45) + 1, round=i + 1, draw_date=f"2020-01-{i % 28 + 1:02d}")
+    return h
+
+
+def test_columnar_counts_match_rows(draws, history):
+    assert list(history.number_counts().items()) == list(Counter(n for d in draws for n in d).items())
+    pairs = Counter()
+    for d in draws:
+        for i in range(6):
+            for j in range(i + 1, 6):
+                pairs[tuple(sorted((d[i], d[j])))] += 1
+    assert list(history.pair_counts().items()) == list(pairs.items())
+    assert history.sums() == [sum(d) for d in draws]
+    assert [list(t) for t in history.tuples()] == draws
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_logic_on_history_matches_lists(draws, history, engine):
+    a = LottoLogic(history, engine=engine)
+    b = LottoLogic([d[:] for d in draws], engine=engine)
+    assert_same_statistics(a, b)
+    assert list(a.pair_freq.items()) == list(b.pair_freq.items())
+    assert a.bonus_numbers == list(history.bonuses)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_add_rows(draws, history, engine):
+    head = history[:200]
+    logic = LottoLogic(head, engine=engine)
+    logic._analyze_patterns()
+    logic.add_draws(list(history.rows(200)))
+    assert head == history
+    assert logic.bonus_numbers[-1] == history.bonuses[-1]
+    assert_same_statistics(logic, LottoLogic([d[:] for d in draws], engine=engine))
+    logic.add_draw([1, 2, 3, 4, 5, 6], 7)
+    assert head.row(-1) == DrawRow(len(draws) + 1, [1, 2, 3, 4, 5, 6], 7, '')
+
+
+def test_rows_and_slices(draws, history):
+    assert len(history) == len(draws)
+    assert history[5] == draws[5]
+    assert list(history[10:20]) == draws[10:20]
+    assert history.row(0) == DrawRow(1, draws[0], 1, '2020-01-01')
+    assert history.startswith(history[:50]) and not history[:50].startswith(history)
+    if np is not None:
+        assert np.asarray(history).tolist() == draws
+
+
+def test_csv_round_trip(history, tmp_path):
+    path = tmp_path / 'lotto_data.csv'
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for row in history.rows():
+            writer.writerow([row.round, *row.numbers, row.bonus, row.draw_date])
+    assert DrawHistory.from_csv(str(path)) == history
+    rows = [dict(zip(COLUMNS, [r.round, *r.numbers, r.bonus, r.draw_date])) for r in history.rows()]
+    assert DrawHistory.from_rows(rows) == history
@@ -0,0 +1,18 @@
+from L_lotto_logic import LottoLogic
+
+
+def test_costs_are_charged_to_the_running_generator(draws):
+    logic = LottoLogic(draws[:100], seed=3)
+    stats = logic.enable_instrumentation(log_interval=None)
+    for _ in range(200):
+        logic.generate_compatibility_mix()
+    logic.generate_unique('generate_range_distribution', 3000)
+    logic.generate_unique('generate_random', 5)
+
+    assert stats['generate_compatibility_mix'].costs['restarts'] == logic.cost_stats['restarts'] > 0
+    assert stats['generate_unique'].costs['unique_duplicates'] == logic.cost_stats['unique_duplicates'] > 0
+    assert stats['generate_range_distribution'].calls >= 3000
+    assert stats['generate_unique'].calls == 2
+    assert stats['generate_unique'].fallbacks == 0
+    logic.disable_instrumentation()
+    assert 'generate_unique' not in logic.__dict__
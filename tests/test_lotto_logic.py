@@ -0,0 +1,107 @@
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+ENGINES = ['python'] + (['numpy'] if np is not None else [])
+
+
+def assert_same_statistics(a: LottoLogic, b: LottoLogic) -> None:
+    assert list(a.number_freq.items()) == list(b.number_freq.items())
+    assert a.hot_numbers == b.hot_numbers
+    assert a.cold_numbers == b.cold_numbers
+    assert dict(a.pair_freq) == dict(b.pair_freq)
+    assert a.incompatible_pairs == b.incompatible_pairs
+    assert a.incompatible_masks == b.incompatible_masks
+    assert a.sum_stats == b.sum_stats
+    assert a.recency.last_seen == b.recency.last_seen
+    assert a.recency.gap_hist == b.recency.gap_hist
+    assert a.long_term_unseen == b.long_term_unseen
+    assert a.triple_freq.counts == b.triple_freq.counts
+    assert a.quad_freq.counts == b.quad_freq.counts
+    if a.pair_matrix is not None and b.pair_matrix is not None:
+        assert (a.pair_matrix == b.pair_matrix).all()
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_add_draws_matches_fresh_analysis(draws, engine):
+    logic = LottoLogic([d[:] for d in draws[:200]], engine=engine)
+    logic._analyze_patterns()
+    logic.add_draws(draws[200:250])
+    for draw in draws[250:]:
+        logic.add_draw(draw)
+    assert_same_statistics(logic, LottoLogic([d[:] for d in draws], engine=engine))
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_add_draws_before_analysis(draws, engine):
+    logic = LottoLogic([d[:] for d in draws[:100]], engine=engine)
+    logic.add_draws(draws[100:])
+    assert_same_statistics(logic, LottoLogic([d[:] for d in draws], engine=engine))
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+@pytest.mark.parametrize('size', [1, 15, 300])
+def test_engines_agree(draws, size):
+    numpy_logic = LottoLogic([d[:] for d in draws[:size]], engine='numpy')
+    assert_same_statistics(numpy_logic, LottoLogic([d[:] for d in draws[:size]], engine='python'))
+    assert numpy_logic.pair_matrix is not None
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+def test_add_draw_uint8(draws):
+    logic = LottoLogic([d[:] for d in draws])
+    logic._analyze_patterns()
+    logic.add_draw(np.array([40, 41, 42, 43, 44, 45], dtype=np.uint8), np.uint8(7))
+    logic.add_draws(logic.generate_batch('generate_random', 5))
+    expected = LottoLogic([list(map(int, d)) for d in logic.past_winnings])
+    assert_same_statistics(logic, expected)
+    assert logic.sum_stats['max'] == 255
+    assert all(type(x) is int for x in logic.past_winnings[-1])
+    assert logic.bonus_numbers[-6] == 7
+
+
+@pytest.mark.parametrize('bad', [[1, 2, 3, 4, 5], [1, 1, 2, 3, 4, 5], [0, 1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 46]])
+def test_add_draw_rejects_invalid(draws, bad):
+    logic = LottoLogic([d[:] for d in draws])
+    with pytest.raises(ValueError):
+        logic.add_draw(bad)
+    assert len(logic.past_winnings) == len(draws)
+
+
+@pytest.mark.parametrize('size', [0, 1, 5, 14, 15, 16, 40])
+def test_long_term_unseen(draws, size):
+    logic = LottoLogic([d[:] for d in draws[:size]])
+    recent = {n for draw in draws[max(0, size - LottoLogic.UNSEEN_WINDOW):size] for n in draw}
+    expected = [n for n in range(1, 46) if n not in recent] if size else []
+    assert logic.long_term_unseen == expected
+    assert logic.recency.unseen(LottoLogic.UNSEEN_WINDOW) == [n for n in range(1, 46) if n not in recent]
+
+
+@pytest.mark.skipif(np is None, reason="covering designs require numpy")
+def test_covering_design_is_deterministic(draws):
+    first, second = LottoLogic(draws), LottoLogic(draws)
+    first.np_rng = np.random.default_rng(1)
+    second.np_rng = np.random.default_rng(2)
+    assert first._covering_plan() == second._covering_plan()
+
+
+def test_cost_stats_count_constraint_builds(draws):
+    logic = LottoLogic(draws)
+    for _ in range(3):
+        logic.generate_balance()
+        logic.generate_prime()
+    assert logic.cost_stats['constraint_builds'] == 2
+
+
+def test_add_draws_leaves_the_callers_list_alone(draws):
+    given = [d[:] for d in draws[:100]]
+    logic = LottoLogic(given)
+    logic.add_draws(draws[100:110])
+    assert given == draws[:100]
+    assert len(logic.past_winnings) == 110
+
+
+def test_tuple_history(draws):
+    logic = LottoLogic(tuple(tuple(d) for d in draws[:100]))
+    logic.add_draws(draws[100:])
+    assert_same_statistics(logic, LottoLogic(draws))
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from L_lotto_mask import (
+    PRIMES, Ticket, contains_pair, even_count, has_consecutive, mask_bits, mask_sum, mask_to_numbers,
+    masks_to_numbers, np, numbers_to_mask, pair_mask, prime_count,
+)
+
+
+def test_predicates_match_the_numbers():
+    rng = random.Random(5)
+    for _ in range(2000):
+        numbers = sorted(rng.sample(range(1, 46), 6))
+        mask = numbers_to_mask(numbers)
+        assert mask_to_numbers(mask) == numbers
+        assert mask_sum(mask) == sum(numbers)
+        assert even_count(mask) == sum(1 for n in numbers if n % 2 == 0)
+        assert prime_count(mask) == sum(1 for n in numbers if n in PRIMES)
+        assert has_consecutive(mask) == any(b - a == 1 for a, b in zip(numbers, numbers[1:]))
+        a, b = rng.sample(range(1, 46), 2)
+        assert contains_pair(mask, pair_mask(a, b)) == (a in numbers and b in numbers)
+
+
+def test_ticket():
+    ticket = Ticket.from_numbers([45, 1, 7, 20, 33, 2])
+    assert ticket.numbers == list(ticket) == [1, 2, 7, 20, 33, 45]
+    assert len(ticket) == 6 and 45 in ticket and 3 not in ticket and 46 not in ticket
+    assert ticket == numbers_to_mask([1, 2, 7, 20, 33, 45]) and hash(ticket) == hash(int(ticket))
+    assert len({ticket, Ticket(int(ticket))}) == 1
+
+
+@pytest.mark.skipif(np is None, reason="the array decoders require numpy")
+def test_array_decoders_match_mask_to_numbers():
+    rng = random.Random(6)
+    tickets = [sorted(rng.sample(range(1, 46), 6)) for _ in range(500)]
+    masks = [numbers_to_mask(t) for t in tickets]
+    assert masks_to_numbers(masks).tolist() == tickets
+    bits = mask_bits(masks)
+    assert bits.shape == (500, 45)
+    assert [[n + 1 for n in np.flatnonzero(row)] for row in bits] == tickets
+    assert mask_bits([0b101], width=3).tolist() == [[1, 0, 1]]
+    with pytest.raises(ValueError):
+        masks_to_numbers([numbers_to_mask([1, 2, 3, 4, 5])])
+    with pytest.raises(ValueError):
+        masks_to_numbers([numbers_to_mask([1, 2, 3, 4, 5]) | 1 << 45])
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from L_lotto_logic import np
+
+pytestmark = pytest.mark.skipif(np is None, reason="the matcher requires numpy")
+
+
+def brute_tier(ticket, draw, bonus):
+    hits = len(set(ticket) & set(draw))
+    if hits == 6:
+        return 1
+    if hits == 5:
+        return 2 if bonus and bonus in ticket else 3
+    return {4: 4, 3: 5}.get(hits, 0)
+
+
+@pytest.fixture
+def history(draws):
+    rng = random.Random(21)
+    draws = draws[:80]
+    bonuses = [rng.choice([n for n in range(1, 46) if n not in d]) for d in draws]
+    bonuses[::7] = [None] * len(bonuses[::7])  # unknown bonus: 5 matches stay tier 3
+    return draws, bonuses
+
+
+@pytest.fixture
+def tickets(history):
+    # Random tickets plus variants of drawn combinations, so every tier shows up
+    draws, bonuses = history
+    rng = random.Random(22)
+    tickets = [sorted(rng.sample(range(1, 46), 6)) for _ in range(200)]
+    for draw, bonus in zip(draws[:40], bonuses[:40]):
+        for keep in (6, 5, 4, 3):
+            others = [n for n in range(1, 46) if n not in draw and n != bonus]
+            tickets.append(sorted(rng.sample(draw, keep) + rng.sample(others, 6 - keep)))
+        if bonus:
+            tickets.append(sorted(rng.sample(draw, 5) + [bonus]))
+    return tickets
+
+
+def test_match_history_agrees_with_brute_force(history, tickets):
+    from L_lotto_match import match_history
+    from L_lotto_mask import numbers_to_mask
+    draws, bonuses = history
+    result = match_history(tickets, draws, bonuses, chunk_size=64)
+    expected = np.array([[brute_tier(t, d, b) for d, b in zip(draws, bonuses)] for t in tickets])
+    assert (result.matches == [[len(set(t) & set(d)) for d in draws] for t in tickets]).all()
+    assert (result.tiers == expected).all()
+    assert set(np.unique(expected)) == {0, 1, 2, 3, 4, 5}
+    for tier in range(6):
+        assert (result.tier_counts()[:, tier] == (expected == tier).sum(axis=1)).all()
+    best = [min((x for x in row if x), default=0) for row in expected]
+    assert result.best_tier().tolist() == best
+    # Bitmask input gives the same result
+    masks = match_history([numbers_to_mask(t) for t in tickets], draws, bonuses)
+    assert (masks.tiers == expected).all()
+
+
+def test_prize_tiers_agrees_with_brute_force(history, tickets):
+    from L_lotto_match import prize_tiers
+    draws, bonuses = history
+    for draw, bonus in zip(draws[:40], bonuses[:40]):
+        assert prize_tiers(tickets, draw, bonus).tolist() == [brute_tier(t, draw, bonus) for t in tickets]
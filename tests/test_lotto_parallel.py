@@ -0,0 +1,24 @@
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="generate_parallel requires numpy")
+
+METHODS = ['generate_random', 'generate_pattern', 'generate_balance', 'generate_sum_range',
+           'generate_compatibility_mix', 'generate_covering', 'generate_data_driven_mix',
+           'generate_all_methods']
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_fixed_seed_repeats(draws, method):
+    # Separate instances with different generator states, in-process and in a pool
+    runs = [LottoLogic(draws, seed=s).generate_parallel(method, 600, seed=5, workers=w, chunk_size=200)
+            for s, w in ((1, 1), (2, 1), (3, 2))]
+    assert runs[0].shape == (600, 6)
+    assert (runs[0] == runs[1]).all() and (runs[0] == runs[2]).all()
+
+
+def test_seeds_differ(draws):
+    logic = LottoLogic(draws)
+    assert not (logic.generate_parallel('generate_random', 100, seed=1, workers=1)
+                == logic.generate_parallel('generate_random', 100, seed=2, workers=1)).all()
@@ -0,0 +1,93 @@
+import math
+import random
+from itertools import combinations, permutations
+
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="score_tickets requires numpy")
+
+PRIMES = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43}
+
+
+def brute_weighted(ticket, weights):
+    # Numbers drawn one at a time with probability proportional to weight among those left
+    total = sum(weights.values())
+    p = 0.0
+    for order in permutations(ticket):
+        left, q = total, 1.0
+        for n in order:
+            q *= weights.get(n, 0) / left
+            left -= weights.get(n, 0)
+        p += q
+    return p
+
+
+def random_tickets(count, seed):
+    rng = random.Random(seed)
+    return [sorted(rng.sample(range(1, 46), 6)) for _ in range(count)]
+
+
+def test_pattern_scores_match_brute_force(draws):
+    logic = LottoLogic(draws[:40])
+    tickets = random_tickets(30, 41) + [sorted(d) for d in draws[:10]]
+    scores = logic.score_tickets(tickets, ['generate_pattern', 'generate_inverse_pattern'])
+    max_f = max(logic.number_freq.values())
+    inverse = {n: max_f - logic.number_freq.get(n, 0) + 1 for n in range(1, 46)}
+    for i, ticket in enumerate(tickets):
+        pattern = brute_weighted(ticket, dict(logic.number_freq))
+        assert scores['generate_pattern'][i] == (pytest.approx(math.log(pattern)) if pattern else -np.inf)
+        assert scores['generate_inverse_pattern'][i] == pytest.approx(math.log(brute_weighted(ticket, inverse)))
+
+
+def test_small_pattern_support_sums_to_one():
+    logic = LottoLogic([[1, 2, 3, 4, 5, 6], [3, 4, 5, 6, 7, 8]])
+    support = [list(t) for t in combinations(range(1, 9), 6)]
+    p = np.exp(logic.score_tickets(support, ['generate_pattern'])['generate_pattern'])
+    assert p.sum() == pytest.approx(1.0)
+    assert p == pytest.approx([brute_weighted(t, dict(logic.number_freq)) for t in support])
+
+
+def test_constrained_scores_are_uniform_over_the_exact_support(draws):
+    logic = LottoLogic(draws)
+    tickets = random_tickets(3000, 42)
+    scores = logic.score_tickets(tickets)
+    lo, hi = logic.sum_stats['min'], logic.sum_stats['max']
+    sizes = {
+        'generate_balance': sum(math.comb(22, e) * math.comb(23, 6 - e) for e in (2, 3, 4)),
+        'generate_prime': sum(math.comb(14, p) * math.comb(31, 6 - p) for p in range(2, 7)),
+        'generate_consecutive': math.comb(45, 6) - math.comb(40, 6),
+    }
+    rules = {
+        'generate_balance': lambda t: 2 <= sum(n % 2 == 0 for n in t) <= 4,
+        'generate_prime': lambda t: sum(n in PRIMES for n in t) >= 2,
+        'generate_consecutive': lambda t: any(b - a == 1 for a, b in zip(t, t[1:])),
+        'generate_sum_range': lambda t: lo <= sum(t) <= hi,
+    }
+    for name, rule in rules.items():
+        inside = np.array([rule(t) for t in tickets])
+        assert np.isneginf(scores[name][~inside]).all()
+        assert np.unique(scores[name][inside]).size == 1
+        if name in sizes:
+            assert scores[name][inside][0] == pytest.approx(-math.log(sizes[name]))
+    assert (scores['generate_random'] == -math.log(math.comb(45, 6))).all()
+
+
+def test_history_models_match_brute_force():
+    # Low sums keep the brute-force count of tickets per sum small
+    history = [[1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 7], [1, 2, 3, 4, 5, 7], [1, 2, 3, 4, 6, 8]]
+    logic = LottoLogic(history)
+    tickets = [[1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 6, 7], [1, 2, 3, 5, 6, 7], [1, 2, 3, 4, 5, 8], [2, 3, 4, 5, 6, 9]]
+    scores = logic.score_tickets(tickets, ['history_sum', 'history_even'])
+    possible_sums = sum(range(40, 46)) - 21 + 1
+    for i, ticket in enumerate(tickets):
+        s = sum(ticket)
+        with_sum = sum(1 for t in combinations(range(1, s), 6) if sum(t) == s)
+        drawn = sum(1 for d in history if sum(d) == s)
+        expected = math.log((drawn + 1) / (len(history) + possible_sums)) - math.log(with_sum)
+        assert scores['history_sum'][i] == pytest.approx(expected)
+        e = sum(n % 2 == 0 for n in ticket)
+        drawn = sum(1 for d in history if sum(n % 2 == 0 for n in d) == e)
+        expected = math.log((drawn + 1) / (len(history) + 7)) - math.log(math.comb(22, e) * math.comb(23, 6 - e))
+        assert scores['history_even'][i] == pytest.approx(expected)
@@ -0,0 +1,71 @@
+import pytest
+
+from L_lotto_logic import LottoLogic
+from test_lotto_logic import ENGINES, assert_same_statistics
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_round_trip(draws, tmp_path, engine):
+    path = str(tmp_path / 'lotto_data.stats')
+    LottoLogic([d[:] for d in draws], engine=engine).save_snapshot(path)
+    loaded = LottoLogic([d[:] for d in draws], engine=engine)
+    assert loaded.load_snapshot(path)
+    assert_same_statistics(loaded, LottoLogic([d[:] for d in draws], engine=engine))
+
+
+def test_loaded_statistics_keep_updating(draws, tmp_path):
+    path = str(tmp_path / 'lotto_data.stats')
+    LottoLogic([d[:] for d in draws[:250]]).save_snapshot(path)
+    loaded = LottoLogic([d[:] for d in draws[:250]])
+    assert loaded.load_snapshot(path)
+    loaded.add_draws(draws[250:])
+    assert_same_statistics(loaded, LottoLogic([d[:] for d in draws]))
+
+
+def test_snapshot_of_other_draws_is_ignored(draws, tmp_path):
+    path = str(tmp_path / 'lotto_data.stats')
+    LottoLogic([d[:] for d in draws]).save_snapshot(path)
+    changed = [d[:] for d in draws]
+    changed[10] = [1, 2, 3, 4, 5, 6] if changed[10] != [1, 2, 3, 4, 5, 6] else [7, 8, 9, 10, 11, 12]
+    for other in (draws[:-1], changed):
+        logic = LottoLogic([d[:] for d in other])
+        assert not logic.load_snapshot(path)
+        assert not logic._stats
+
+
+def test_missing_or_corrupt_file_is_ignored(draws, tmp_path):
+    logic = LottoLogic(draws)
+    assert not logic.load_snapshot(str(tmp_path / 'missing.stats'))
+    corrupt = tmp_path / 'corrupt.stats'
+    corrupt.write_bytes(b'\0' * 10)
+    assert not logic.load_snapshot(str(corrupt))
+
+
+def test_write_snapshot_matches_history(draws, tmp_path):
+    from L_lotto_history import DrawHistory
+    from L_lotto_snapshot import snapshot_path, write_snapshot
+    rows = [dict({f'num{i + 1}': n for i, n in enumerate(d)}, round=r + 1, bonus=None) for r, d in enumerate(draws)]
+    data_file = str(tmp_path / 'lotto_data.json')
+    assert write_snapshot(rows, data_file)
+    logic = LottoLogic(DrawHistory.from_rows(rows))
+    assert logic.load_snapshot(snapshot_path(data_file))
+    assert_same_statistics(logic, LottoLogic([d[:] for d in draws]))
+
+
+def test_write_snapshot_updates_the_live_logic(draws, tmp_path):
+    from L_lotto_history import DrawHistory
+    from L_lotto_snapshot import snapshot_path, write_snapshot
+    rows = [dict({f'num{i + 1}': n for i, n in enumerate(d)}, round=r + 1, bonus=None) for r, d in enumerate(draws)]
+    data_file = str(tmp_path / 'lotto_data.json')
+    live = LottoLogic(DrawHistory.from_rows(rows[:250]))
+    live.number_freq  # computed once; the new draws are added to it, not recounted
+    assert write_snapshot(rows, data_file, live)
+    assert len(live.past_winnings) == len(draws)
+    assert_same_statistics(live, LottoLogic([d[:] for d in draws]))
+    logic = LottoLogic(DrawHistory.from_rows(rows))
+    assert logic.load_snapshot(snapshot_path(data_file))
+    assert_same_statistics(logic, LottoLogic([d[:] for d in draws]))
+    # A live logic over other draws is left alone
+    other = LottoLogic(DrawHistory.from_rows(rows[1:10]))
+    assert write_snapshot(rows, data_file, other)
+    assert len(other.past_winnings) == 9
@@ -0,0 +1,68 @@
+import pytest
+
+from L_lotto_logic import LottoLogic, np
+
+
+def test_tickets_are_distinct_and_avoid_exclusions(draws):
+    logic = LottoLogic(draws)
+    logic.rng.seed(3)
+    tickets = logic.generate_unique('generate_balance', 200, exclude_drawn=True)
+    assert len({tuple(t) for t in tickets}) == 200
+    assert not {tuple(t) for t in tickets} & {tuple(d) for d in draws}
+
+
+@pytest.mark.skipif(np is None, reason="covering designs require numpy")
+def test_exhausted_generator_raises_instead_of_substituting(draws):
+    logic = LottoLogic(draws)
+    logic.rng.seed(3)
+    design = {tuple(t) for t in logic._covering_plan()}
+    tickets = logic.generate_unique('generate_covering', len(design))
+    assert {tuple(t) for t in tickets} == design
+    with pytest.raises(ValueError):
+        logic.generate_unique('generate_covering', len(design) + 1)
+
+
+def test_exhausted_constrained_generator_raises():
+    # 합계 21은 1..6 한 조합뿐
+    logic = LottoLogic([[1, 2, 3, 4, 5, 6]])
+    assert logic.generate_unique('generate_sum_range', 1) == [[1, 2, 3, 4, 5, 6]]
+    with pytest.raises(ValueError):
+        logic.generate_unique('generate_sum_range', 2)
+
+
+def test_excluded_tickets_inside_the_support_are_counted():
+    logic = LottoLogic([[1, 2, 3, 4, 5, 6]])  # generate_sum_range: sum exactly 21, i.e. only 1..6
+    with pytest.raises(ValueError, match="outside the excluded"):
+        logic.generate_unique('generate_sum_range', 1, exclude_drawn=True)
+    assert logic.generate_unique('generate_sum_range', 1, exclude=[[7, 8, 9, 10, 11, 12]]) == [[1, 2, 3, 4, 5, 6]]
+
+
+def test_one_draw_pattern_raises_from_the_support_size():
+    logic = LottoLogic([[1, 2, 3, 4, 5, 6]])  # generate_pattern can only return the one drawn ticket
+    assert logic.generate_unique('generate_pattern', 1) == [[1, 2, 3, 4, 5, 6]]
+    with pytest.raises(ValueError, match="only 1 distinct"):
+        logic.generate_unique('generate_pattern', 3)
+    assert logic.cost_stats['unique_duplicates'] == 0
+
+
+@pytest.mark.skipif(np is None, reason="the weighted support walk requires numpy")
+def test_small_weighted_support_is_walked_to_the_end():
+    logic = LottoLogic([[1, 2, 3, 4, 5, 6], [5, 6, 7, 8, 9, 10]], seed=5)  # 10 numbers: C(10, 6) = 210 tickets
+    tickets = logic.generate_unique('generate_pattern', 210)
+    assert len({tuple(t) for t in tickets}) == 210
+    assert all(t[-1] <= 10 for t in tickets)
+    assert logic.cost_stats['support_walks'] == 1
+
+
+@pytest.mark.skipif(np is None, reason="the weighted support walk requires numpy")
+def test_weighted_walk_follows_the_generator_distribution():
+    from L_lotto_mask import mask_to_numbers
+    from L_lotto_unique import UniqueTicketGenerator
+    logic = LottoLogic([[1, 2, 3, 4, 5, 6], [3, 4, 5, 6, 7, 8]], seed=6)  # 28 tickets, 3..6 twice as likely
+    support = UniqueTicketGenerator(logic)._support('generate_pattern')
+    n = 3000
+    walked = np.zeros(46)
+    for _ in range(n):
+        walked[mask_to_numbers(next(support.walk(set())))] += 1
+    sampled = np.bincount(logic._pattern_sampler().sample_batch(n, np.random.default_rng(1)).ravel(), minlength=46)
+    assert np.abs(walked - sampled).max() / n < 0.04
@@ -0,0 +1,52 @@
+import itertools
+
+import pytest
+
+from L_lotto_logic import np
+
+pytestmark = pytest.mark.skipif(np is None, reason="DrawPrefixSums requires numpy")
+
+
+def brute_counts(draws):
+    numbers = np.zeros(45, dtype=np.int64)
+    pairs = np.zeros((45, 45), dtype=np.int64)
+    for draw in draws:
+        for n in draw:
+            numbers[n - 1] += 1
+        for a, b in itertools.combinations(draw, 2):
+            pairs[a - 1, b - 1] += 1
+            pairs[b - 1, a - 1] += 1
+    return numbers, pairs
+
+
+def test_windows_match_slicing(draws):
+    from L_lotto_window import DrawPrefixSums
+    sums = DrawPrefixSums(draws[:200])
+    for draw in draws[200:]:
+        sums.append(draw)
+    assert len(sums) == len(draws)
+    for start, stop in [(None, None), (0, 1), (-30, None), (50, 180), (120, 250), (10, 5)]:
+        numbers, pairs = brute_counts(draws[start:stop])
+        assert (sums.number_counts(start, stop) == numbers).all()
+        assert (sums.pair_counts(start, stop) == pairs).all()
+
+
+def test_pair_table_is_built_on_the_first_pair_query(draws):
+    from L_lotto_window import DrawPrefixSums
+    sums = DrawPrefixSums(draws[:10])
+    sums.number_counts(-5)
+    assert sums._pairs is None
+    # Appends before the first pair query (including a capacity doubling) are still counted
+    for draw in draws[10:40]:
+        sums.append(draw)
+    assert (sums.pair_counts(-25) == brute_counts(draws[15:40])[1]).all()
+    for draw in draws[40:80]:
+        sums.append(draw)
+    assert (sums.pair_counts(30, 75) == brute_counts(draws[30:75])[1]).all()
+
+
+def test_empty_history():
+    from L_lotto_window import DrawPrefixSums
+    sums = DrawPrefixSums()
+    assert not sums.number_counts().any()
+    assert not sums.pair_counts().any()